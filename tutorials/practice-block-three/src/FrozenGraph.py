@@ -0,0 +1,323 @@
+from array import array
+from collections import deque
+from IndexedGraph import *
+import Traversals
+
+class FrozenGraph:
+    """
+    An immutable directed graph in compressed sparse row (CSR) form, for
+    read-heavy workloads. Node labels are interned to the dense integers
+    0..V-1, in the order given by labels. The out-neighbours of node i are
+    the ids targets[offsets[i]:offsets[i+1]], and in the same way the
+    in-neighbours are sources[in_offsets[i]:in_offsets[i+1]].
+
+    The adjacency lives in flat typed buffers (array.array, or any other
+    sequence of ints such as a memoryview) rather than a set of tuples. Ids
+    are stored in 4 bytes when there are fewer than 2**31 nodes, so each
+    edge costs 8 bytes: 4 in the forward buffer and 4 in the reverse one.
+
+    A FrozenGraph answers the same neighbour queries and iterative
+    traversals as Graph, but add_node and add_edge are not supported. Use
+    freeze to build one from a Graph and thaw to get a mutable IndexedGraph
+    back.
+    """
+
+    def __init__(self, labels: list, offsets, targets, in_offsets, sources):
+        """
+        Construct a frozen graph directly from its buffers.
+        """
+        self.labels = labels
+        self.index = {label: i for (i, label) in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.in_offsets = in_offsets
+        self.sources = sources
+        self.edge_count = len(targets)
+
+    @staticmethod
+    def id_typecode(count: int) -> str:
+        """
+        The array typecode used to store node ids for a graph with count nodes.
+        """
+        return 'i' if count < 2**31 else 'q'
+
+    @classmethod
+    def freeze(cls, g: Graph) -> 'FrozenGraph':
+        """
+        Build a frozen copy of g, which may be a Graph or an IndexedGraph.
+        The neighbours of each node keep the order in which g lists them, so
+        freezing an IndexedGraph preserves its traversal order.
+        """
+        labels = list(g.nodes)
+        index = {label: i for (i, label) in enumerate(labels)}
+        es = [(index[n], index[m]) for (n, m) in g.edges]
+        if hasattr(g, 'predecessors'):
+            in_es = [(index[m], index[n]) for m in labels for n in g.predecessors(m)]
+        else:
+            in_es = [(m, n) for (n, m) in es]
+        (offsets, targets) = cls.compress(len(labels), es)
+        (in_offsets, sources) = cls.compress(len(labels), in_es)
+        return cls(labels, offsets, targets, in_offsets, sources)
+
+    @classmethod
+    def compress(cls, count: int, es: list) -> tuple:
+        """
+        Turn a list of (source id, target id) pairs into CSR offset and target
+        buffers with a counting sort, which keeps pairs with the same source
+        in their original order.
+        """
+        offsets = array('q', bytes(8 * (count + 1)))
+        for (n, _) in es:
+            offsets[n + 1] += 1
+        for i in range(count):
+            offsets[i + 1] += offsets[i]
+        typecode = cls.id_typecode(count)
+        targets = array(typecode, bytes(array(typecode).itemsize * len(es)))
+        cursor = offsets[:-1]
+        for (n, m) in es:
+            targets[cursor[n]] = m
+            cursor[n] += 1
+        return (offsets, targets)
+
+    def thaw(self) -> IndexedGraph:
+        """
+        Make a mutable IndexedGraph with the same nodes and edges.
+        """
+        g = IndexedGraph()
+        for label in self.labels:
+            g.add_node(label)
+        for e in self.edges:
+            g.add_edge(e)
+        return g
+
+    @property
+    def nodes(self):
+        """
+        A set-like view of the nodes in the graph.
+        """
+        return self.index.keys()
+
+    @property
+    def edges(self) -> EdgeView:
+        """
+        A set-like view of the edges in the graph.
+        """
+        return EdgeView(self)
+
+    def add_node(self, n) -> None:
+        raise TypeError("A FrozenGraph cannot be changed, use thaw() first")
+
+    def add_edge(self, e) -> None:
+        raise TypeError("A FrozenGraph cannot be changed, use thaw() first")
+
+    def node_id(self, n) -> int:
+        """
+        The integer id of the node labelled n. Throws a LookupError if n is
+        not in the graph.
+        """
+        try:
+            return self.index[n]
+        except (KeyError, TypeError):
+            raise LookupError(f"Node not in graph: {n}") from None
+
+    def out_ids(self, i: int):
+        """
+        The ids of the out-neighbours of the node with id i.
+        """
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def in_ids(self, i: int):
+        """
+        The ids of the in-neighbours of the node with id i.
+        """
+        return self.sources[self.in_offsets[i]:self.in_offsets[i + 1]]
+
+    def successors(self, n) -> list:
+        """
+        The out-neighbours of n, in order. Throws a LookupError if n is not
+        in the graph.
+        """
+        labels = self.labels
+        return [labels[j] for j in self.out_ids(self.node_id(n))]
+
+    def predecessors(self, n) -> list:
+        """
+        The in-neighbours of n, in order. Throws a LookupError if n is not in
+        the graph.
+        """
+        labels = self.labels
+        return [labels[j] for j in self.in_ids(self.node_id(n))]
+
+    def has_edge(self, e) -> bool:
+        """
+        Returns true if the pair e is an edge in this graph, otherwise false.
+        """
+        (n, m) = e
+        if n not in self.index or m not in self.index:
+            return False
+        return self.index[m] in self.out_ids(self.index[n])
+
+    def disconnected(self) -> set:
+        """
+        Collects the set of disconnected nodes (those which are not part
+        of any edge) in the graph.
+        """
+        (offsets, in_offsets) = (self.offsets, self.in_offsets)
+        return {label for (i, label) in enumerate(self.labels)
+                if offsets[i] == offsets[i + 1] and in_offsets[i] == in_offsets[i + 1]}
+
+    def elem(self, n) -> bool:
+        """
+        Returns true if n is a node in this graph, otherwise false.
+        """
+        return n in self.index
+
+    def neighbours_out(self, n) -> set:
+        """
+        The set of nodes that are connected to n by an edge, where n is the
+        source of that edge.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        return set(self.successors(n))
+
+    def neighbours_in(self, n) -> set:
+        """
+        The set of nodes that are connected to n by an edge, where n is the
+        target of that edge.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        return set(self.predecessors(n))
+
+    def traverse_df_iter(self, n) -> list:
+        """
+        Performs an iterative depth-first traversal of the graph starting at
+        n, and returns the node labels into a list. The traversal works on
+        node ids and a bytearray of visited flags, and visits nodes in the
+        same order as IndexedGraph.traverse_df_iter.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        (offsets, targets) = (self.offsets, self.targets)
+        visited = bytearray(len(self.labels))
+        discovered = []
+        stack = [self.node_id(n)]
+        while stack:
+            v = stack.pop()
+            if not visited[v]:
+                visited[v] = 1
+                discovered.append(v)
+                for k in range(offsets[v + 1] - 1, offsets[v] - 1, -1):
+                    if not visited[targets[k]]:
+                        stack.append(targets[k])
+        labels = self.labels
+        return [labels[i] for i in discovered]
+
+    def traverse_bf(self, n) -> list:
+        """
+        Performs an iterative breadth-first traversal of the graph starting at
+        n, and returns the node labels into a list. The traversal works on
+        node ids and a bytearray of visited flags.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        (offsets, targets) = (self.offsets, self.targets)
+        visited = bytearray(len(self.labels))
+        start = self.node_id(n)
+        visited[start] = 1
+        discovered = [start]
+        queue = deque(discovered)
+        while queue:
+            v = queue.popleft()
+            for k in range(offsets[v], offsets[v + 1]):
+                w = targets[k]
+                if not visited[w]:
+                    visited[w] = 1
+                    discovered.append(w)
+                    queue.append(w)
+        labels = self.labels
+        return [labels[i] for i in discovered]
+
+    def traverse_df(self, n, pre=None, post=None) -> list:
+        """
+        Performs a depth-first traversal of the graph starting at n, visiting
+        nodes in the same order as IndexedGraph.traverse_df_rec but without
+        recursion. pre and post are called with each node before and after
+        its successors have been traversed.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        labels = self.labels
+        by_label = [(lambda i, f=f: f(labels[i])) if f is not None else None
+                    for f in (pre, post)]
+        return [labels[i] for i in
+                Traversals.dfs(self.out_ids, self.node_id(n), *by_label)]
+
+    def topological_sort(self) -> list:
+        """
+        The nodes of the graph ordered so that every edge goes from an earlier
+        node to a later one. Throws a ValueError if the graph has a cycle.
+        """
+        labels = self.labels
+        try:
+            order = Traversals.topological_sort(range(len(labels)), self.out_ids)
+        except ValueError:
+            raise ValueError("Graph has a cycle") from None
+        return [labels[i] for i in order]
+
+    def has_cycle(self) -> bool:
+        """
+        Returns true if the graph has a cycle, otherwise false.
+        """
+        return Traversals.has_cycle(range(len(self.labels)), self.out_ids)
+
+    def iter_df(self, n, max_depth: int = None, visit=None):
+        """
+        A lazy depth-first traversal of the graph starting at n, which yields
+        the node labels as they are discovered. See Traversals for the
+        meaning of max_depth and visit.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        return self.lazy(Traversals.df, n, max_depth, visit)
+
+    def iter_bf(self, n, max_depth: int = None, visit=None):
+        """
+        A lazy breadth-first traversal of the graph starting at n, which yields
+        the node labels as they are discovered. See Traversals for the
+        meaning of max_depth and visit.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        return self.lazy(Traversals.bf, n, max_depth, visit)
+
+    def lazy(self, traversal, n, max_depth: int, visit):
+        """
+        Run one of the traversals in Traversals over node ids, translating
+        the ids back to labels as they are yielded and passed to visit.
+        """
+        labels = self.labels
+        start = self.node_id(n)
+        if visit is not None:
+            by_id = visit
+            visit = lambda i, depth: by_id(labels[i], depth)
+        return map(labels.__getitem__, traversal(self.out_ids, start, max_depth, visit))
+
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the adjacency buffers.
+        """
+        return sum(len(b) * b.itemsize for b in
+                   (self.offsets, self.targets, self.in_offsets, self.sources))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __str__(self):
+        """
+        Format a graph for display in the REPL.
+        """
+        return f"({set(self.nodes)}, {set(self.edges)})"
+
+# End of the FrozenGraph class
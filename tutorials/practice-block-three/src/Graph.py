@@ -21,7 +21,7 @@ class Graph:
         edges. Nodes may be values of any type. Edges must be tuples,
         otherwise a LookupError is thrown.
         """
-        g = Graph()
+        g = cls()
         g.nodes = ns
         for e in es:
             if isinstance(e, tuple):
@@ -0,0 +1,251 @@
+"""
+Reading and writing graphs in a binary on-disk format, so that large graphs
+can be loaded without building Python sets of nodes and edges.
+
+A graph file holds a FrozenGraph. It starts with a header (see HEADER)
+giving the number of nodes and edges, the size in bytes of a node id and
+the file offset of each section. The sections are, in order: the forward
+CSR offsets, the reverse CSR offsets, the forward targets, the reverse
+sources and finally the node labels, one JSON value per line. Every number
+is little-endian and every section starts on an 8-byte boundary.
+
+load memory-maps a graph file: the four adjacency buffers are memoryviews
+onto the mapped file, so a traversal can start as soon as the labels have
+been read, and pages of the file are only read from disk when they are
+touched. Labels must be JSON values that are hashable when read back, such
+as strings and numbers.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from itertools import islice
+from FrozenGraph import *
+
+MAGIC = b'M269GRF1'
+
+# magic, nodes, edges, id size, then the offset of each of the five sections
+HEADER = struct.Struct('<8s8Q')
+
+def align(n: int) -> int:
+    """Round n up to the next multiple of 8."""
+    return (n + 7) & ~7
+
+def layout(node_count: int, edge_count: int, itemsize: int) -> list:
+    """The file offsets of the five sections of a graph file."""
+    offsets = HEADER.size
+    in_offsets = offsets + 8 * (node_count + 1)
+    targets = in_offsets + 8 * (node_count + 1)
+    sources = targets + align(itemsize * edge_count)
+    labels = sources + align(itemsize * edge_count)
+    return [offsets, in_offsets, targets, sources, labels]
+
+def little_endian(a: array) -> array:
+    """A little-endian copy of a, or a itself on little-endian machines."""
+    if sys.byteorder == 'little':
+        return a
+    a = array(a.typecode, a)
+    a.byteswap()
+    return a
+
+def write_labels(f, labels) -> None:
+    """Write the node labels, one JSON value per line."""
+    for label in labels:
+        f.write(json.dumps(label).encode('utf-8'))
+        f.write(b'\n')
+
+def save(g, path: str) -> None:
+    """
+    Write g to a graph file at path. g may be a FrozenGraph or any Graph,
+    which is frozen first.
+    """
+    if not isinstance(g, FrozenGraph):
+        g = FrozenGraph.freeze(g)
+    typecode = FrozenGraph.id_typecode(len(g))
+    itemsize = array(typecode).itemsize
+    sections = layout(len(g), g.edge_count, itemsize)
+    buffers = [(g.offsets, 'q'), (g.in_offsets, 'q'),
+               (g.targets, typecode), (g.sources, typecode)]
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(g), g.edge_count, itemsize, *sections))
+        for (start, (buffer, code)) in zip(sections, buffers):
+            f.write(bytes(start - f.tell()))
+            f.write(little_endian(array(code, buffer)).tobytes())
+        f.write(bytes(sections[4] - f.tell()))
+        write_labels(f, g.labels)
+
+def load(path: str) -> FrozenGraph:
+    """
+    Memory-map the graph file at path and return a FrozenGraph whose
+    adjacency buffers are views onto the file. Throws a ValueError if the
+    file is not a graph file.
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("Memory-mapped graph files need a little-endian machine")
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mm) < HEADER.size:
+        raise ValueError(f"Not a graph file: {path}")
+    (magic, node_count, edge_count, itemsize, *sections) = HEADER.unpack_from(mm)
+    if magic != MAGIC:
+        raise ValueError(f"Not a graph file: {path}")
+    typecode = FrozenGraph.id_typecode(node_count)
+    view = memoryview(mm)
+    def section(i: int, length: int, fmt: str):
+        return view[sections[i]:sections[i] + length * struct.calcsize(fmt)].cast(fmt)
+    labels = [json.loads(line) for line in mm[sections[4]:].splitlines()]
+    if len(labels) != node_count:
+        raise ValueError(f"Corrupt graph file: {path}")
+    return FrozenGraph(labels,
+                       section(0, node_count + 1, 'q'),
+                       section(2, edge_count, typecode),
+                       section(1, node_count + 1, 'q'),
+                       section(3, edge_count, typecode))
+
+def parse_line(line: str) -> tuple:
+    """
+    Parse one line of a text edge list. A line holds a source and a target
+    separated by whitespace, or a single node with no edges. Blank lines and
+    lines starting with # give the empty tuple.
+    """
+    tokens = line.split()
+    if not tokens or tokens[0].startswith('#'):
+        return ()
+    if len(tokens) > 2:
+        raise ValueError(f"Not an edge: {line.strip()}")
+    return tuple(tokens)
+
+def read_chunks(path: str, chunk_size: int = 65536):
+    """
+    Read the text edge list at path and yield lists of at most chunk_size
+    parsed lines, so that only one chunk is in memory at a time.
+    """
+    with open(path, encoding='utf-8') as f:
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            chunk = [t for t in map(parse_line, lines) if t]
+            if chunk:
+                yield chunk
+
+def load_edge_list(path: str, g: Graph = None, chunk_size: int = 65536) -> Graph:
+    """
+    Stream the text edge list at path into g (a new IndexedGraph by
+    default) through add_node and add_edge, a chunk of lines at a time.
+    The file itself is never held in memory.
+    """
+    if g is None:
+        g = IndexedGraph()
+    for chunk in read_chunks(path, chunk_size):
+        for t in chunk:
+            for n in t:
+                g.add_node(n)
+            if len(t) == 2:
+                g.add_edge(t)
+    return g
+
+def convert_edge_list(src: str, dst: str, chunk_size: int = 65536) -> None:
+    """
+    Convert the text edge list at src to a graph file at dst without
+    building the graph in memory. The first pass over src interns the
+    labels and counts degrees, the second scatters each edge straight into
+    a memory-mapped dst, and duplicate edges are then squeezed out in
+    place. Memory use is O(V) however many edges there are. The result is
+    the same as save(load_edge_list(src), dst).
+    """
+    index = {}
+    out_degree = array('q')
+    in_degree = array('q')
+    edge_count = 0
+    for chunk in read_chunks(src, chunk_size):
+        for t in chunk:
+            for n in t:
+                if n not in index:
+                    index[n] = len(index)
+                    out_degree.append(0)
+                    in_degree.append(0)
+            if len(t) == 2:
+                out_degree[index[t[0]]] += 1
+                in_degree[index[t[1]]] += 1
+                edge_count += 1
+    node_count = len(index)
+    typecode = FrozenGraph.id_typecode(node_count)
+    itemsize = array(typecode).itemsize
+    sections = layout(node_count, edge_count, itemsize)
+    offsets = prefix_sums(out_degree)
+    in_offsets = prefix_sums(in_degree)
+    del out_degree, in_degree
+    with open(dst, 'w+b') as f:
+        f.truncate(sections[4])
+        mm = mmap.mmap(f.fileno(), 0)
+        view = memoryview(mm)
+        targets = view[sections[2]:sections[2] + itemsize * edge_count].cast(typecode)
+        sources = view[sections[3]:sections[3] + itemsize * edge_count].cast(typecode)
+        cursor = offsets[:-1]
+        in_cursor = in_offsets[:-1]
+        for chunk in read_chunks(src, chunk_size):
+            for t in chunk:
+                if len(t) == 2:
+                    (n, m) = (index[t[0]], index[t[1]])
+                    targets[cursor[n]] = m
+                    cursor[n] += 1
+                    sources[in_cursor[m]] = n
+                    in_cursor[m] += 1
+        del cursor, in_cursor
+        unique_count = squeeze(offsets, targets)
+        squeeze(in_offsets, sources)
+        # the sections after the targets move down if duplicates were removed
+        sections = layout(node_count, unique_count, itemsize)
+        mm.move(sections[3], sections[2] + align(itemsize * edge_count),
+                itemsize * unique_count)
+        for (start, end) in [(sections[2], sections[3]), (sections[3], sections[4])]:
+            start += itemsize * unique_count
+            view[start:end] = bytes(end - start)
+        view[sections[0]:sections[1]] = little_endian(offsets).tobytes()
+        view[sections[1]:sections[2]] = little_endian(in_offsets).tobytes()
+        HEADER.pack_into(mm, 0, MAGIC, node_count, unique_count, itemsize, *sections)
+        targets.release()
+        sources.release()
+        view.release()
+        mm.close()
+        f.truncate(sections[4])
+        f.seek(sections[4])
+        write_labels(f, index)
+
+def prefix_sums(degrees: array) -> array:
+    """CSR offsets from an array of degrees."""
+    offsets = array('q', [0])
+    total = 0
+    for d in degrees:
+        total += d
+        offsets.append(total)
+    return offsets
+
+def squeeze(offsets: array, targets) -> int:
+    """
+    Remove repeated targets within each node's run of a CSR buffer,
+    keeping the first occurrence, and compact the runs towards the start of
+    the buffer. offsets is updated in place and the new number of targets
+    is returned.
+    """
+    write = 0
+    for i in range(len(offsets) - 1):
+        (start, end) = (offsets[i], offsets[i + 1])
+        offsets[i] = write
+        seen = set()
+        for k in range(start, end):
+            m = targets[k]
+            if m not in seen:
+                seen.add(m)
+                targets[write] = m
+                write += 1
+    offsets[-1] = write
+    return write
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit(f"usage: python3 {sys.argv[0]} EDGE_LIST GRAPH_FILE")
+    convert_edge_list(sys.argv[1], sys.argv[2])
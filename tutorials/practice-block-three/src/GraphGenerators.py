@@ -0,0 +1,100 @@
+"""
+Reproducible generators of synthetic graphs for testing and benchmarking.
+
+Every generator takes the (approximate) number of edges wanted and a seed,
+and returns a pair (nodes, edges) of lists which can be passed to
+Graph.build (as sets) or fed to add_node and add_edge. The same arguments
+always give the same graph. Nodes are the ints 0..V-1 and edges are pairs
+of nodes with no repeats.
+"""
+
+import math
+import random
+
+def erdos_renyi(edges: int, seed: int = 0, degree: int = 4) -> tuple:
+    """
+    A random graph with the given number of edges spread uniformly over
+    edges // degree nodes (the G(n, m) model), so the average out-degree is
+    degree.
+    """
+    rng = random.Random(seed)
+    count = max(2, edges // degree)
+    edges = min(edges, count * count)
+    es = set()
+    while len(es) < edges:
+        es.add((rng.randrange(count), rng.randrange(count)))
+    return (list(range(count)), list(es))
+
+def power_law(edges: int, seed: int = 0, degree: int = 4) -> tuple:
+    """
+    A scale-free graph grown by preferential attachment (the Barabasi-Albert
+    model): each new node adds edges to degree existing nodes, chosen with
+    probability proportional to their degree, so a few hubs end up with very
+    many edges. Edges go from the older node to the new one, so the hubs
+    have high out-degree and most of the graph is reachable from node 0.
+    """
+    rng = random.Random(seed)
+    count = max(degree + 1, edges // degree + 1)
+    es = []
+    # every node appears in ends once per edge it is part of
+    ends = list(range(degree))
+    for n in range(degree, count):
+        targets = set()
+        while len(targets) < degree:
+            targets.add(rng.choice(ends))
+        for m in targets:
+            es.append((m, n))
+            ends.append(m)
+        ends.extend([n] * degree)
+    return (list(range(count)), es)
+
+def grid(edges: int, seed: int = 0) -> tuple:
+    """
+    A square grid with edges from each node to its right and lower
+    neighbours. The node at row r and column c is r * side + c. The seed is
+    not used, as the graph is not random.
+    """
+    side = max(2, round(math.sqrt(edges / 2)))
+    es = []
+    for r in range(side):
+        for c in range(side):
+            n = r * side + c
+            if c + 1 < side:
+                es.append((n, n + 1))
+            if r + 1 < side:
+                es.append((n, n + side))
+    return (list(range(side * side)), es)
+
+def chain(edges: int, seed: int = 0) -> tuple:
+    """
+    A single path 0 -> 1 -> ... -> edges, the deepest graph possible for
+    its size. The seed is not used, as the graph is not random.
+    """
+    return (list(range(edges + 1)), [(n, n + 1) for n in range(edges)])
+
+def forest(edges: int, seed: int = 0, tree_size: int = 100) -> tuple:
+    """
+    A forest of random trees of about tree_size nodes each, with edges
+    directed from parent to child, plus one isolated node for every tree so
+    that disconnected has something to find.
+    """
+    rng = random.Random(seed)
+    es = []
+    n = 0
+    while len(es) < edges:
+        root = n
+        n += 1
+        for _ in range(min(tree_size - 1, edges - len(es))):
+            es.append((rng.randrange(root, n), n))
+            n += 1
+        n += 1 # an isolated node
+    return (list(range(n)), es)
+
+# All of the generators, by name
+GENERATORS = {
+    'erdos_renyi': erdos_renyi,
+    'power_law': power_law,
+    'grid': grid,
+    'chain': chain,
+    'forest': forest,
+}
@@ -0,0 +1,155 @@
+"""
+Whole-graph analytics as NumPy/SciPy sparse matrix operations.
+
+GraphMatrix exports a graph to a SciPy CSR adjacency matrix A, in which
+A[i, j] is 1 if there is an edge from node i to node j, and offers batched
+kernels on it: breadth-first levels by repeated sparse matrix-vector
+products (one product per level, for many sources at once), in- and
+out-degree vectors, disconnected nodes as a vectorised mask, and PageRank.
+Each kernel does its work in compiled loops over the CSR buffers rather
+than in a Python loop over the edges.
+
+NumPy and SciPy are optional: the rest of the graph code does not need
+them, and creating a GraphMatrix without them throws an ImportError.
+"""
+
+from FrozenGraph import *
+
+try:
+    import numpy as np
+    import scipy.sparse as sparse
+except ImportError:
+    np = None
+    sparse = None
+
+def require_scipy() -> None:
+    """Throw an ImportError if NumPy or SciPy is not installed."""
+    if sparse is None:
+        raise ImportError("GraphKernels needs numpy and scipy: pip install numpy scipy")
+
+class GraphMatrix:
+    """
+    The adjacency matrix of a graph, with the node labels in the order of
+    its rows and columns.
+    """
+
+    def __init__(self, g):
+        """
+        Export g, which may be any Graph or a FrozenGraph, to a CSR matrix.
+        The matrix's indptr and indices are read straight from the
+        FrozenGraph's offset and target buffers.
+        """
+        require_scipy()
+        if not isinstance(g, FrozenGraph):
+            g = FrozenGraph.freeze(g)
+        self.labels = g.labels
+        self.index = g.index
+        n = len(g.labels)
+        indptr = np.frombuffer(g.offsets, dtype=np.int64)
+        indices = np.frombuffer(g.targets, dtype=np.int32 if g.targets.itemsize == 4
+                                else np.int64)
+        data = np.ones(len(indices), dtype=np.int8)
+        self.matrix = sparse.csr_matrix((data, indices, indptr), shape=(n, n))
+        self.transpose = self.matrix.T.tocsr()
+
+    def node_id(self, n) -> int:
+        """
+        The row of the node labelled n. Throws a LookupError if n is not in
+        the graph.
+        """
+        if n not in self.index:
+            raise LookupError(f"Node not in graph: {n}")
+        return self.index[n]
+
+    def out_degrees(self):
+        """The out-degree of every node, as a vector."""
+        return np.diff(self.matrix.indptr)
+
+    def in_degrees(self):
+        """The in-degree of every node, as a vector."""
+        return np.diff(self.transpose.indptr)
+
+    def disconnected_mask(self):
+        """A boolean vector which is true for nodes that are part of no edge."""
+        return (self.out_degrees() == 0) & (self.in_degrees() == 0)
+
+    def disconnected(self) -> set:
+        """
+        Collects the set of disconnected nodes (those which are not part
+        of any edge) in the graph.
+        """
+        return {self.labels[i] for i in np.flatnonzero(self.disconnected_mask())}
+
+    def neighbours_out(self, n) -> set:
+        """
+        The set of nodes that are connected to n by an edge, where n is the
+        source of that edge. Throws a LookupError if n is not in the graph.
+        """
+        i = self.node_id(n)
+        row = self.matrix.indices[self.matrix.indptr[i]:self.matrix.indptr[i + 1]]
+        return {self.labels[j] for j in row}
+
+    def neighbours_in(self, n) -> set:
+        """
+        The set of nodes that are connected to n by an edge, where n is the
+        target of that edge. Throws a LookupError if n is not in the graph.
+        """
+        i = self.node_id(n)
+        row = self.transpose.indices[self.transpose.indptr[i]:self.transpose.indptr[i + 1]]
+        return {self.labels[j] for j in row}
+
+    def bf_levels(self, sources: list):
+        """
+        Level-synchronous breadth-first search from every node in sources at
+        once. Returns an int matrix with a row per node and a column per
+        source, holding the number of edges on a shortest path from the
+        source to the node, or -1 if the node cannot be reached. Each level
+        is one sparse matrix product of the transposed adjacency matrix with
+        the frontier, which has a column per source.
+        """
+        ids = [self.node_id(s) for s in sources]
+        count = len(self.labels)
+        levels = np.full((count, len(ids)), -1, dtype=np.int64)
+        frontier = np.zeros((count, len(ids)), dtype=np.float64)
+        frontier[ids, np.arange(len(ids))] = 1
+        levels[ids, np.arange(len(ids))] = 0
+        depth = 0
+        while frontier.any():
+            depth += 1
+            reached = (self.transpose @ frontier > 0) & (levels < 0)
+            levels[reached] = depth
+            frontier = reached.astype(np.float64)
+        return levels
+
+    def bf_level_dicts(self, sources: list) -> dict:
+        """
+        The result of bf_levels as a dict from each source to a dict from
+        each node reachable from it to its level.
+        """
+        levels = self.bf_levels(sources)
+        labels = self.labels
+        return {s: {labels[i]: int(levels[i, k]) for i in np.flatnonzero(levels[:, k] >= 0)}
+                for (k, s) in enumerate(sources)}
+
+    def pagerank(self, damping: float = 0.85, tolerance: float = 1e-10,
+                 max_iterations: int = 100) -> dict:
+        """
+        The PageRank of every node, by power iteration. The rank of nodes
+        with no out-edges is shared equally between all nodes. Returns a dict
+        from node label to rank; the ranks add up to 1.
+        """
+        count = len(self.labels)
+        if count == 0:
+            return {}
+        out = self.out_degrees().astype(np.float64)
+        dangling = out == 0
+        scale = np.divide(1.0, out, out=np.zeros(count), where=~dangling)
+        rank = np.full(count, 1.0 / count)
+        for _ in range(max_iterations):
+            spread = self.transpose @ (rank * scale)
+            following = damping * (spread + rank[dangling].sum() / count) + (1 - damping) / count
+            converged = np.abs(following - rank).sum() < tolerance
+            rank = following
+            if converged:
+                break
+        return dict(zip(self.labels, rank.tolist()))
@@ -0,0 +1,268 @@
+from collections.abc import Set
+from Graph import *
+import Traversals
+
+class EdgeView(Set):
+    """
+    A read-only, set-like view of the edges of an indexed graph. It behaves
+    like the set of pairs stored by Graph (membership, len, iteration and
+    comparison with other sets all work) but is computed from the graph's
+    adjacency structure, so the edges are not stored twice. The graph must
+    provide nodes, successors, has_edge and edge_count.
+    """
+
+    def __init__(self, g):
+        self.g = g
+
+    def __contains__(self, e) -> bool:
+        return isinstance(e, tuple) and len(e) == 2 and self.g.has_edge(e)
+
+    def __iter__(self):
+        for n in self.g.nodes:
+            for m in self.g.successors(n):
+                yield (n, m)
+
+    def __len__(self) -> int:
+        return self.g.edge_count
+
+    def __repr__(self):
+        return repr(set(self))
+
+class IndexedGraph(Graph):
+    """
+    A directed graph with the same interface as Graph, but which stores its
+    edges in two adjacency maps: succ maps each node to its out-neighbours
+    and pred maps each node to its in-neighbours. Each map entry is a dict
+    used as an insertion-ordered set, so traversals are deterministic.
+
+    Looking up the neighbours of a node costs O(degree) rather than a scan
+    of every edge, disconnected costs O(V), and the traversals cost O(V+E).
+    The nodes and edges attributes are still available as set-like views
+    for code written against Graph.
+    """
+
+    def __init__(self):
+        """
+        Construct a new empty graph.
+        """
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Remove every node and edge from the graph.
+        """
+        self.succ = {}
+        self.pred = {}
+        self.edge_count = 0
+
+    @property
+    def nodes(self):
+        """
+        A set-like view of the nodes in the graph.
+        """
+        return self.succ.keys()
+
+    @nodes.setter
+    def nodes(self, ns) -> None:
+        """
+        Replace the nodes of the graph. As in Graph.build, this discards
+        any existing edges.
+        """
+        self.clear()
+        for n in ns:
+            self.add_node(n)
+
+    @property
+    def edges(self) -> EdgeView:
+        """
+        A set-like view of the edges in the graph.
+        """
+        return EdgeView(self)
+
+    @edges.setter
+    def edges(self, es) -> None:
+        """
+        Replace the edges of the graph, keeping its nodes.
+        """
+        ns = list(self.succ)
+        self.clear()
+        for n in ns:
+            self.add_node(n)
+        for e in es:
+            self.add_edge(e)
+
+    def add_node(self, n) -> None:
+        """
+        Adds a node to the graph.
+        """
+        if n not in self.succ:
+            self.succ[n] = {}
+            self.pred[n] = {}
+
+    def add_edge(self, e) -> None:
+        """
+        Adds an edge to the graph. Inconsistencies in the edges (eg either
+        element of the tuple is not in the graph) will cause a LookupError.
+        """
+        (n, m) = e
+        if n not in self.succ or m not in self.succ:
+            raise LookupError(f"One or both nodes not in graph: {e}")
+        if m not in self.succ[n]:
+            self.succ[n][m] = None
+            self.pred[m][n] = None
+            self.edge_count += 1
+
+    def successors(self, n):
+        """
+        The out-neighbours of n in the order their edges were added, without
+        copying them into a new set. Throws a LookupError if n is not in
+        the graph.
+        """
+        if n not in self.succ:
+            raise LookupError(f"Node not in graph: {n}")
+        return self.succ[n].keys()
+
+    def predecessors(self, n):
+        """
+        The in-neighbours of n in the order their edges were added, without
+        copying them into a new set. Throws a LookupError if n is not in
+        the graph.
+        """
+        if n not in self.pred:
+            raise LookupError(f"Node not in graph: {n}")
+        return self.pred[n].keys()
+
+    def has_edge(self, e) -> bool:
+        """
+        Returns true if the pair e is an edge in this graph, otherwise false.
+        """
+        (n, m) = e
+        return n in self.succ and m in self.succ[n]
+
+    def disconnected(self) -> set:
+        """
+        Collects the set of disconnected nodes (those which are not part
+        of any edge) in the graph.
+        """
+        return {n for n in self.succ if not self.succ[n] and not self.pred[n]}
+
+    def elem(self, n) -> bool:
+        """
+        Returns true if n is a node in this graph, otherwise false.
+        """
+        return n in self.succ
+
+    def neighbours_out(self, n) -> set:
+        """
+        The set of nodes that are connected to n by an edge, where n is the
+        source of that edge.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        return set(self.successors(n))
+
+    def neighbours_in(self, n) -> set:
+        """
+        The set of nodes that are connected to n by an edge, where n is the
+        target of that edge.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        return set(self.predecessors(n))
+
+    def traverse_df_rec(self, n) -> list:
+        """
+        Performs a recursive depth-first traversal of the graph starting at
+        n, and returns the node labels into a list.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        if n not in self.succ:
+            raise LookupError(f"Node not in graph: {n}")
+        discovered = {}
+        def visit(v):
+            discovered[v] = None
+            for w in self.succ[v]:
+                if w not in discovered:
+                    visit(w)
+        visit(n)
+        return list(discovered)
+
+    def traverse_df_iter(self, n) -> list:
+        """
+        Performs an iterative depth-first traversal of the graph starting at
+        n, and returns the node labels into a list. Neighbours are pushed in
+        reverse so that they are visited in the same order as in
+        traverse_df_rec.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        return list(self.iter_df(n))
+
+    def traverse_bf(self, n) -> list:
+        """
+        Performs an iterative breadth-first traversal of the graph starting at
+        n, and returns the node labels into a list.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        return list(self.iter_bf(n))
+
+    def traverse_df(self, n, pre=None, post=None) -> list:
+        """
+        Performs a depth-first traversal of the graph starting at n, visiting
+        nodes in the same order as traverse_df_rec but without recursion, so
+        that it works however long the paths in the graph are. pre and post
+        are called with each node before and after its successors have been
+        traversed.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        if n not in self.succ:
+            raise LookupError(f"Node not in graph: {n}")
+        return list(Traversals.dfs(self.successors, n, pre, post))
+
+    def topological_sort(self) -> list:
+        """
+        The nodes of the graph ordered so that every edge goes from an earlier
+        node to a later one. Throws a ValueError if the graph has a cycle.
+        """
+        return Traversals.topological_sort(self.succ, self.successors)
+
+    def has_cycle(self) -> bool:
+        """
+        Returns true if the graph has a cycle, otherwise false.
+        """
+        return Traversals.has_cycle(self.succ, self.successors)
+
+    def iter_df(self, n, max_depth: int = None, visit=None):
+        """
+        A lazy depth-first traversal of the graph starting at n, which yields
+        the node labels as they are discovered. See Traversals for the
+        meaning of max_depth and visit.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        if n not in self.succ:
+            raise LookupError(f"Node not in graph: {n}")
+        return Traversals.df(self.successors, n, max_depth, visit)
+
+    def iter_bf(self, n, max_depth: int = None, visit=None):
+        """
+        A lazy breadth-first traversal of the graph starting at n, which yields
+        the node labels as they are discovered. See Traversals for the
+        meaning of max_depth and visit.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        if n not in self.succ:
+            raise LookupError(f"Node not in graph: {n}")
+        return Traversals.bf(self.successors, n, max_depth, visit)
+
+    def __str__(self):
+        """
+        Format a graph for display in the REPL.
+        """
+        return f"({set(self.nodes)}, {set(self.edges)})"
+
+# End of the IndexedGraph class
@@ -0,0 +1,138 @@
+class IndexedMinHeap:
+    """
+    A binary min heap of items with priorities, which also keeps a position
+    map from each item to its index in the heap. The map makes it possible
+    to find an item in O(1) and so to lower its priority (decrease_key) in
+    O(log n), which is what Dijkstra's and Prim's algorithms need. Without
+    it the usual approach is to push a duplicate entry and skip the stale
+    one when it is popped ("lazy deletion"), which lets the heap grow to the
+    number of edges rather than the number of nodes.
+
+    Items must be hashable and each item can be in the heap at most once.
+    Items and priorities are kept in two parallel lists, so only the
+    priorities are ever compared.
+    """
+
+    def __init__(self) -> None:
+        self.items = []
+        self.priorities = []
+        self.position = {}
+
+    def size(self) -> int:
+        """Get the size of the heap."""
+        return len(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item) -> bool:
+        return item in self.position
+
+    def priority(self, item):
+        """The priority of item. Throws a KeyError if it is not in the heap."""
+        return self.priorities[self.position[item]]
+
+    def peek(self) -> tuple:
+        """
+        The (item, priority) pair with the lowest priority, without removing
+        it. Throws an IndexError if the heap is empty.
+        """
+        if not self.items:
+            raise IndexError("peek from an empty heap")
+        return (self.items[0], self.priorities[0])
+
+    def insert(self, item, priority) -> None:
+        """
+        Insert an item with the given priority. Throws a KeyError if the item
+        is already in the heap.
+        """
+        if item in self.position:
+            raise KeyError(f"Already in the heap: {item}")
+        self.items.append(item)
+        self.priorities.append(priority)
+        self.position[item] = len(self.items) - 1
+        self.trickle_up(len(self.items) - 1)
+
+    def remove(self) -> tuple:
+        """
+        Remove and return the (item, priority) pair with the lowest priority.
+        Throws an IndexError if the heap is empty.
+        """
+        if not self.items:
+            raise IndexError("remove from an empty heap")
+        result = (self.items[0], self.priorities[0])
+        last_item = self.items.pop()
+        last_priority = self.priorities.pop()
+        del self.position[result[0]]
+        if self.items:
+            self.items[0] = last_item
+            self.priorities[0] = last_priority
+            self.position[last_item] = 0
+            self.trickle_down(0)
+        return result
+
+    def decrease_key(self, item, priority) -> None:
+        """
+        Lower the priority of an item already in the heap. Throws a KeyError
+        if it is not in the heap and a ValueError if priority is higher than
+        its current priority.
+        """
+        i = self.position[item]
+        if self.priorities[i] < priority:
+            raise ValueError(f"Cannot increase the priority of {item}")
+        self.priorities[i] = priority
+        self.trickle_up(i)
+
+    def insert_or_decrease(self, item, priority) -> bool:
+        """
+        Insert an item, or lower its priority if it is already in the heap
+        with a higher one. Returns true if the heap changed.
+        """
+        i = self.position.get(item)
+        if i is None:
+            self.insert(item, priority)
+            return True
+        if priority < self.priorities[i]:
+            self.priorities[i] = priority
+            self.trickle_up(i)
+            return True
+        return False
+
+    def trickle_up(self, i: int) -> None:
+        """Move the entry at i towards the root until the heap property holds."""
+        (items, priorities, position) = (self.items, self.priorities, self.position)
+        item = items[i]
+        priority = priorities[i]
+        while i > 0:
+            p = (i - 1) >> 1
+            if not priority < priorities[p]:
+                break
+            items[i] = items[p]
+            priorities[i] = priorities[p]
+            position[items[i]] = i
+            i = p
+        items[i] = item
+        priorities[i] = priority
+        position[item] = i
+
+    def trickle_down(self, i: int) -> None:
+        """Move the entry at i towards the leaves until the heap property holds."""
+        (items, priorities, position) = (self.items, self.priorities, self.position)
+        n = len(items)
+        item = items[i]
+        priority = priorities[i]
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and priorities[c + 1] < priorities[c]:
+                c += 1
+            if not priorities[c] < priority:
+                break
+            items[i] = items[c]
+            priorities[i] = priorities[c]
+            position[items[i]] = i
+            i = c
+        items[i] = item
+        priorities[i] = priority
+        position[item] = i
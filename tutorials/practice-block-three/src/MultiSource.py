@@ -0,0 +1,144 @@
+"""
+Breadth-first traversal and reachability from many source nodes at once.
+
+traverse_bf_many runs one breadth-first traversal per source, spread over a
+pool of worker processes. reachable_many answers "which nodes can be
+reached from s?" for many sources s together using bit-parallel
+breadth-first search: each node carries an int in which bit k is set if the
+node has been reached from the k-th source of the batch, so a single pass
+over the graph serves a whole batch of sources.
+
+Both functions take the graph as a FrozenGraph, as any other graph (which
+is frozen first), or as the path of a graph file written by GraphFile.save.
+Each worker process gets its own copy of a FrozenGraph when it starts
+(a FrozenGraph from GraphFile.load is first copied out of its file into
+arrays, as views onto a memory-mapped file cannot be sent to another
+process), whereas with a graph file every worker memory-maps the same
+file, so the operating system shares one copy of the edges between all of
+them. The functions which start workers take an optional mp_context, a
+multiprocessing context giving the way workers are started.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from FrozenGraph import *
+import GraphFile
+
+# The graph used by the functions running in a worker process
+_graph = None
+
+def _init_worker(g) -> None:
+    """Set up a worker process with the graph, loading it if g is a path."""
+    global _graph
+    _graph = GraphFile.load(g) if isinstance(g, str) else g
+
+def _traverse_bf(sources: list) -> list:
+    """Run traverse_bf from each of sources in a worker process."""
+    return [_graph.traverse_bf(s) for s in sources]
+
+def _reachable(sources: list) -> list:
+    """Run reachable_batch on sources in a worker process."""
+    return reachable_batch(_graph, sources)
+
+def _prepare(g):
+    """Turn g into a FrozenGraph or the path of a graph file."""
+    if isinstance(g, (str, FrozenGraph)):
+        return g
+    return FrozenGraph.freeze(g)
+
+def _picklable(g):
+    """
+    Copy any buffers of the FrozenGraph g which are not arrays, such as the
+    memoryviews of a graph from GraphFile.load, into arrays, so that g can
+    be pickled and handed to worker processes.
+    """
+    if isinstance(g, str):
+        return g
+    buffers = []
+    for b in (g.offsets, g.targets, g.in_offsets, g.sources):
+        if not isinstance(b, array):
+            copy = array(b.format)
+            copy.frombytes(b.cast('B'))
+            b = copy
+        buffers.append(b)
+    return FrozenGraph(g.labels, *buffers)
+
+def _batches(items: list, size: int) -> list:
+    """Split items into lists of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _run(g, fn, batches: list, processes: int, mp_context=None) -> list:
+    """
+    Apply fn to each batch, in a pool of processes started with mp_context
+    if processes is more than one, otherwise in this process. The results
+    come back in batch order.
+    """
+    g = _prepare(g)
+    if processes is not None and processes <= 1:
+        _init_worker(g)
+        try:
+            return [fn(b) for b in batches]
+        finally:
+            _init_worker(None)
+    with ProcessPoolExecutor(processes, mp_context, initializer=_init_worker,
+                             initargs=(_picklable(g),)) as pool:
+        return list(pool.map(fn, batches))
+
+def traverse_bf_many(g, sources, processes: int = None, chunk_size: int = 64,
+                     mp_context=None) -> dict:
+    """
+    Breadth-first traversals of g from every node in sources, computed in
+    parallel across processes worker processes (by default one per CPU).
+    Returns a dict mapping each source to the list that traverse_bf gives
+    for it. Throws a LookupError if a source is not in the graph.
+    """
+    sources = list(dict.fromkeys(sources))
+    results = _run(g, _traverse_bf, _batches(sources, chunk_size), processes, mp_context)
+    return dict(zip(sources, (t for batch in results for t in batch)))
+
+def reachable_batch(g: FrozenGraph, sources: list) -> list:
+    """
+    The sets of nodes reachable from each of sources, found with a single
+    level-synchronous breadth-first pass over g. Bit k of seen[v] records
+    that v has been reached from sources[k], and each frontier node carries
+    the bits that reached it for the first time in the previous level, so
+    each edge is followed at most once per level in which new bits arrive.
+    """
+    ids = [g.node_id(s) for s in sources]
+    seen = [0] * len(g)
+    frontier = {}
+    for (k, i) in enumerate(ids):
+        seen[i] |= 1 << k
+        frontier[i] = frontier.get(i, 0) | (1 << k)
+    (offsets, targets) = (g.offsets, g.targets)
+    while frontier:
+        following = {}
+        for (v, bits) in frontier.items():
+            for j in range(offsets[v], offsets[v + 1]):
+                w = targets[j]
+                new = bits & ~seen[w]
+                if new:
+                    seen[w] |= new
+                    following[w] = following.get(w, 0) | new
+        frontier = following
+    reached = [set() for _ in sources]
+    labels = g.labels
+    for (v, bits) in enumerate(seen):
+        while bits:
+            low = bits & -bits
+            reached[low.bit_length() - 1].add(labels[v])
+            bits ^= low
+    return reached
+
+def reachable_many(g, sources, processes: int = None, width: int = 64,
+                   mp_context=None) -> dict:
+    """
+    The set of nodes reachable from each node in sources, answering width
+    sources per bit-parallel pass and running the passes in parallel across
+    processes worker processes (by default one per CPU). Returns a dict
+    mapping each source to a set equal to set(g.traverse_bf(source)).
+    Throws a LookupError if a source is not in the graph.
+    """
+    sources = list(dict.fromkeys(sources))
+    results = _run(g, _reachable, _batches(sources, width), processes, mp_context)
+    return dict(zip(sources, (r for batch in results for r in batch)))
@@ -0,0 +1,127 @@
+from collections import OrderedDict, deque
+from IndexedGraph import *
+
+class ReachableGraph(IndexedGraph):
+    """
+    An IndexedGraph which can quickly answer "is m reachable from n?" while
+    nodes and edges keep being added.
+
+    Each node is given a bit position when it is added, and reach[n] is an
+    int with the bit of every node reachable from n set (including n
+    itself), so a query is a single bit test. The index is kept up to date
+    by add_edge rather than being rebuilt: adding (n, m) ORs reach[m] into
+    reach[n] and into the reach of every node that can reach n, found by
+    walking backwards along the predecessors. The walk stops at any node
+    that can already reach everything m can, since the nodes behind it can
+    too.
+
+    The index takes O(V^2) bits, so once the graph has more than max_indexed
+    nodes it is dropped. From then on queries are answered by a lazy
+    breadth-first search that stops as soon as it finds the target, and
+    recent answers are kept in two LRU caches of cache_size entries each.
+    Adding an edge can only make more nodes reachable, so it clears the
+    cache of negative answers but keeps the positive ones.
+    """
+
+    def __init__(self, max_indexed: int = 10000, cache_size: int = 1024):
+        """
+        Construct a new empty graph.
+        """
+        self.max_indexed = max_indexed
+        self.cache_size = cache_size
+        super().__init__()
+
+    def clear(self) -> None:
+        """
+        Remove every node and edge from the graph, and reset the index.
+        """
+        super().clear()
+        self.bit = {}
+        self.reach = {}
+        self.reachable_cache = OrderedDict()
+        self.unreachable_cache = OrderedDict()
+
+    def is_indexed(self) -> bool:
+        """
+        Returns true if queries are answered from the index, or false if the
+        graph has grown too large and they are answered by searching.
+        """
+        return self.reach is not None
+
+    def add_node(self, n) -> None:
+        """
+        Adds a node to the graph.
+        """
+        if n in self.succ:
+            return
+        super().add_node(n)
+        if self.reach is None:
+            return
+        if len(self.succ) > self.max_indexed:
+            self.bit = None
+            self.reach = None
+        else:
+            self.bit[n] = 1 << len(self.bit)
+            self.reach[n] = self.bit[n]
+
+    def add_edge(self, e) -> None:
+        """
+        Adds an edge to the graph and updates the index. Inconsistencies in
+        the edges (eg either element of the tuple is not in the graph) will
+        cause a LookupError.
+        """
+        super().add_edge(e)
+        self.unreachable_cache.clear()
+        if self.reach is None:
+            return
+        (n, m) = e
+        new = self.reach[m]
+        reach = self.reach
+        queue = deque([n])
+        while queue:
+            v = queue.popleft()
+            if reach[v] | new == reach[v]:
+                continue
+            reach[v] |= new
+            queue.extend(self.pred[v])
+
+    def reachable(self, n, m) -> bool:
+        """
+        Returns true if there is a path from n to m (every node is reachable
+        from itself), otherwise false.
+
+        Throws a LookupError if either node is not in the graph.
+        """
+        if n not in self.succ or m not in self.succ:
+            raise LookupError(f"One or both nodes not in graph: {(n, m)}")
+        if self.reach is not None:
+            return self.reach[n] & self.bit[m] != 0
+        for cache in (self.reachable_cache, self.unreachable_cache):
+            if (n, m) in cache:
+                cache.move_to_end((n, m))
+                return cache[(n, m)]
+        found = False
+        for v in self.iter_bf(n):
+            if v == m:
+                found = True
+                break
+        cache = self.reachable_cache if found else self.unreachable_cache
+        cache[(n, m)] = found
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return found
+
+    def reachable_from(self, n) -> set:
+        """
+        The set of nodes reachable from n, including n.
+
+        Throws a LookupError if n is not in the graph.
+        """
+        if self.reach is None:
+            return set(self.iter_bf(n))
+        if n not in self.succ:
+            raise LookupError(f"Node not in graph: {n}")
+        reach = self.reach[n]
+        return {m for (m, b) in self.bit.items() if reach & b}
+
+# End of the ReachableGraph class
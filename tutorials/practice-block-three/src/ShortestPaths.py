@@ -0,0 +1,177 @@
+"""
+Shortest paths and minimum spanning trees on a WeightedGraph, using the
+greedy algorithms of Dijkstra, Prim and A*. Each algorithm keeps its
+frontier in an IndexedMinHeap and lowers a node's priority in place with
+decrease_key when a cheaper edge to it is found, so the heap never holds
+more than one entry per node.
+
+For comparison, dijkstra_lazy and prim_lazy use heapq with lazy deletion:
+an improved entry is pushed as a duplicate and stale entries are skipped
+when they are popped. See bench_ShortestPaths.py.
+"""
+
+import heapq
+import math
+from itertools import chain
+from IndexedHeap import *
+from WeightedGraph import *
+
+def check_node(g: WeightedGraph, n) -> None:
+    """Throw a LookupError if n is not in the graph."""
+    if not g.elem(n):
+        raise LookupError(f"Node not in graph: {n}")
+
+def check_weight(e: tuple, w) -> None:
+    """Throw a ValueError if the weight w of the edge e is negative."""
+    if w < 0:
+        raise ValueError(f"Negative weight {w} on edge {e}")
+
+def dijkstra(g: WeightedGraph, source) -> tuple:
+    """
+    Dijkstra's algorithm. Returns a pair of dicts (dist, prev): dist maps
+    every node reachable from source to the length of the shortest path to
+    it, and prev maps each of those nodes (apart from source) to the node
+    before it on that path. Throws a LookupError if source is not in the
+    graph and a ValueError if a negative edge weight is found.
+    """
+    check_node(g, source)
+    dist = {}
+    prev = {}
+    heap = IndexedMinHeap()
+    heap.insert(source, 0)
+    while heap:
+        (v, d) = heap.remove()
+        dist[v] = d
+        for (w, weight) in g.out_edges(v):
+            check_weight((v, w), weight)
+            if w not in dist and heap.insert_or_decrease(w, d + weight):
+                prev[w] = v
+    return (dist, prev)
+
+def dijkstra_lazy(g: WeightedGraph, source) -> tuple:
+    """
+    Dijkstra's algorithm with heapq and lazy deletion. Gives the same
+    result as dijkstra.
+    """
+    check_node(g, source)
+    dist = {}
+    prev = {}
+    best = {source: 0}
+    heap = [(0, 0, source)]
+    count = 1 # breaks ties so that nodes are never compared
+    while heap:
+        (d, _, v) = heapq.heappop(heap)
+        if v in dist:
+            continue
+        dist[v] = d
+        for (w, weight) in g.out_edges(v):
+            check_weight((v, w), weight)
+            if w not in dist and (w not in best or d + weight < best[w]):
+                best[w] = d + weight
+                prev[w] = v
+                heapq.heappush(heap, (d + weight, count, w))
+                count += 1
+    return (dist, prev)
+
+def path_to(prev: dict, source, target) -> list:
+    """Follow prev back from target to source to recover a path."""
+    path = [target]
+    while path[-1] != source:
+        path.append(prev[path[-1]])
+    path.reverse()
+    return path
+
+def shortest_path(g: WeightedGraph, source, target) -> tuple:
+    """
+    The shortest path from source to target, as a pair (cost, path) where
+    path is a list of nodes. If target cannot be reached the result is
+    (math.inf, []). Throws a LookupError if either node is not in the graph.
+    """
+    check_node(g, target)
+    return a_star(g, source, target, lambda n: 0)
+
+def a_star(g: WeightedGraph, source, target, h) -> tuple:
+    """
+    A* search for the shortest path from source to target, as a pair
+    (cost, path). h(n) estimates the cost of the cheapest path from n to
+    target. It must never overestimate and must be consistent (h(n) is at
+    most the weight of (n, m) plus h(m)), in which case the path found is a
+    shortest one. With h(n) = 0 this is Dijkstra's algorithm stopping at
+    target. If target cannot be reached the result is (math.inf, []).
+    Throws a LookupError if either node is not in the graph.
+    """
+    check_node(g, source)
+    check_node(g, target)
+    done = set()
+    cost = {source: 0}
+    prev = {}
+    heap = IndexedMinHeap()
+    heap.insert(source, h(source))
+    while heap:
+        (v, _) = heap.remove()
+        if v == target:
+            return (cost[v], path_to(prev, source, target))
+        done.add(v)
+        for (w, weight) in g.out_edges(v):
+            check_weight((v, w), weight)
+            c = cost[v] + weight
+            if w not in done and (w not in cost or c < cost[w]):
+                cost[w] = c
+                prev[w] = v
+                heap.insert_or_decrease(w, c + h(w))
+    return (math.inf, [])
+
+def prim(g: WeightedGraph, root=None) -> WeightedGraph:
+    """
+    Prim's algorithm for a minimum spanning tree, treating every edge as
+    undirected. Returns a WeightedGraph holding the nodes reachable from root
+    (ignoring direction) and the edges of the tree, each directed away from
+    root. If root is not given the result is a minimum spanning forest of
+    the whole graph.
+    """
+    tree = WeightedGraph()
+    roots = g.nodes if root is None else [root]
+    if root is not None:
+        check_node(g, root)
+    parent = {}
+    heap = IndexedMinHeap()
+    for r in roots:
+        if tree.elem(r):
+            continue
+        heap.insert(r, 0)
+        while heap:
+            (v, weight) = heap.remove()
+            tree.add_node(v)
+            if v in parent:
+                tree.add_edge((parent.pop(v), v), weight)
+            for (w, weight) in chain(g.out_edges(v), g.in_edges(v)):
+                if not tree.elem(w) and heap.insert_or_decrease(w, weight):
+                    parent[w] = v
+    return tree
+
+def prim_lazy(g: WeightedGraph, root=None) -> WeightedGraph:
+    """
+    Prim's algorithm with heapq and lazy deletion. Gives a spanning tree of
+    the same total weight as prim.
+    """
+    tree = WeightedGraph()
+    roots = g.nodes if root is None else [root]
+    if root is not None:
+        check_node(g, root)
+    count = 0
+    for r in roots:
+        if tree.elem(r):
+            continue
+        heap = [(0, count, r, None)]
+        while heap:
+            (weight, _, v, p) = heapq.heappop(heap)
+            if tree.elem(v):
+                continue
+            tree.add_node(v)
+            if p is not None:
+                tree.add_edge((p, v), weight)
+            for (w, weight) in chain(g.out_edges(v), g.in_edges(v)):
+                if not tree.elem(w):
+                    count += 1
+                    heapq.heappush(heap, (weight, count, w, v))
+    return tree
@@ -0,0 +1,140 @@
+"""
+Lazy graph traversals. Each traversal is a generator that yields nodes as
+they are discovered, so a caller that only needs the first few reachable
+nodes, or is searching for a particular node, can stop early and pay only
+for the part of the graph it has seen.
+
+The traversals do not depend on how a graph is stored. They take a
+function, successors, which gives the out-neighbours of a node in order;
+IndexedGraph.successors and FrozenGraph.out_ids are both suitable.
+
+Both traversals accept:
+
++ max_depth: nodes further than this many edges from the start (along the
+  path the traversal took) are not visited.
++ visit: a function called with each node and its depth when the node is
+  discovered. If it returns True the traversal stops after that node.
+"""
+
+from collections import deque
+
+def bf(successors, start, max_depth: int = None, visit=None):
+    """
+    Breadth-first traversal from start, using a deque as the queue so that
+    each node is enqueued and dequeued in O(1).
+    """
+    discovered = {start}
+    yield start
+    if visit is not None and visit(start, 0):
+        return
+    queue = deque([(start, 0)])
+    while queue:
+        (v, depth) = queue.popleft()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for w in successors(v):
+            if w not in discovered:
+                discovered.add(w)
+                yield w
+                if visit is not None and visit(w, depth + 1):
+                    return
+                queue.append((w, depth + 1))
+
+def df(successors, start, max_depth: int = None, visit=None):
+    """
+    Iterative depth-first traversal from start. Neighbours are pushed in
+    reverse so that, without a depth limit, nodes come out in the same order
+    as a recursive depth-first traversal.
+    """
+    discovered = set()
+    stack = [(start, 0)]
+    while stack:
+        (v, depth) = stack.pop()
+        if v in discovered:
+            continue
+        discovered.add(v)
+        yield v
+        if visit is not None and visit(v, depth):
+            return
+        if max_depth is not None and depth >= max_depth:
+            continue
+        stack.extend((w, depth + 1) for w in reversed(list(successors(v)))
+                     if w not in discovered)
+
+def dfs(successors, start, pre=None, post=None, discovered: set = None):
+    """
+    Depth-first traversal from start which visits nodes in exactly the same
+    order as a recursive depth-first traversal, but keeps an explicit stack
+    of (node, iterator over its successors) pairs instead of using Python's
+    call stack, so it works on paths of any length. Each edge is looked at
+    once, so the traversal is O(V+E) and the stack never holds more than
+    one entry per node.
+
+    pre is called with each node when it is first reached and post is
+    called with each node when all of its successors have been finished,
+    which is when a recursive traversal would return from it. Nodes already
+    in discovered are skipped and discovered is updated as the traversal
+    goes, so that one set can be shared by several traversals to cover a
+    whole graph.
+    """
+    if discovered is None:
+        discovered = set()
+    if start in discovered:
+        return
+    discovered.add(start)
+    if pre is not None:
+        pre(start)
+    yield start
+    stack = [(start, iter(successors(start)))]
+    while stack:
+        (v, ws) = stack[-1]
+        for w in ws:
+            if w not in discovered:
+                discovered.add(w)
+                if pre is not None:
+                    pre(w)
+                yield w
+                stack.append((w, iter(successors(w))))
+                break
+        else:
+            stack.pop()
+            if post is not None:
+                post(v)
+
+def postorder(nodes, successors) -> list:
+    """
+    Every node in a graph in depth-first post-order, starting a new
+    traversal from each of nodes in turn that has not yet been reached.
+    """
+    order = []
+    discovered = set()
+    for n in nodes:
+        for _ in dfs(successors, n, post=order.append, discovered=discovered):
+            pass
+    return order
+
+def topological_sort(nodes, successors) -> list:
+    """
+    Order the nodes of a graph so that every edge goes from an earlier node
+    to a later one, by reversing a depth-first post-order. Throws a
+    ValueError if the graph has a cycle, in which case no such order exists.
+    """
+    order = postorder(nodes, successors)
+    order.reverse()
+    position = {v: i for (i, v) in enumerate(order)}
+    for v in order:
+        for w in successors(v):
+            if position[w] <= position[v]:
+                raise ValueError(f"Graph has a cycle through {v} and {w}")
+    return order
+
+def has_cycle(nodes, successors) -> bool:
+    """
+    Returns true if the graph has a cycle (including an edge from a node to
+    itself), otherwise false.
+    """
+    try:
+        topological_sort(nodes, successors)
+    except ValueError:
+        return True
+    return False
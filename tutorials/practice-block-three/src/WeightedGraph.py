@@ -0,0 +1,77 @@
+from IndexedGraph import *
+
+class WeightedGraph(IndexedGraph):
+    """
+    A directed graph whose edges carry weights (numbers such as distances or
+    costs). The weight of the edge (n, m) is stored as the value of m in the
+    adjacency map succ[n] (and of n in pred[m]), so weights cost no extra
+    lookups. Edges added without a weight get the weight 1, so every
+    IndexedGraph method works unchanged and nodes and edges still hold
+    plain nodes and pairs. The edges passed to build may be triples
+    (n, m, weight) as well as pairs.
+    """
+
+    def add_edge(self, e, weight=None) -> None:
+        """
+        Adds an edge to the graph. e may be a pair (n, m), with the weight
+        given separately (by default 1), or a triple (n, m, weight). Adding
+        an edge which is already in the graph replaces its weight.
+        Inconsistencies in the edges (eg either node is not in the graph)
+        will cause a LookupError.
+        """
+        if len(e) == 3:
+            (n, m, weight) = e
+        else:
+            (n, m) = e
+        if weight is None:
+            weight = 1
+        if n not in self.succ or m not in self.succ:
+            raise LookupError(f"One or both nodes not in graph: {e}")
+        if m not in self.succ[n]:
+            self.edge_count += 1
+        self.succ[n][m] = weight
+        self.pred[m][n] = weight
+
+    def weight(self, e):
+        """
+        The weight of the edge e = (n, m). Throws a LookupError if e is not an
+        edge in the graph.
+        """
+        (n, m) = e
+        if not self.has_edge(e):
+            raise LookupError(f"Edge not in graph: {e}")
+        return self.succ[n][m]
+
+    def out_edges(self, n):
+        """
+        The (out-neighbour, weight) pairs of n. Throws a LookupError if n is
+        not in the graph.
+        """
+        if n not in self.succ:
+            raise LookupError(f"Node not in graph: {n}")
+        return self.succ[n].items()
+
+    def in_edges(self, n):
+        """
+        The (in-neighbour, weight) pairs of n. Throws a LookupError if n is
+        not in the graph.
+        """
+        if n not in self.pred:
+            raise LookupError(f"Node not in graph: {n}")
+        return self.pred[n].items()
+
+    def weighted_edges(self):
+        """
+        Iterate over the edges of the graph as (n, m, weight) triples.
+        """
+        for (n, ms) in self.succ.items():
+            for (m, w) in ms.items():
+                yield (n, m, w)
+
+    def __str__(self):
+        """
+        Format a graph for display in the REPL.
+        """
+        return f"({set(self.nodes)}, {set(self.weighted_edges())})"
+
+# End of the WeightedGraph class
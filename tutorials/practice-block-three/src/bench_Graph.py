@@ -0,0 +1,173 @@
+"""
+A benchmark suite for the graph classes, using the synthetic graphs from
+GraphGenerators. For each generator and each size it times:
+
++ build: IndexedGraph.build from sets of nodes and edges
++ add_edge: adding every edge in turn to a graph holding just the nodes
++ freeze: FrozenGraph.freeze
++ neighbours_out and neighbours_in: per query, averaged over a sample of
+  nodes
++ disconnected
++ traverse_df_rec, traverse_df, traverse_df_iter and traverse_bf from
+  node 0, on the IndexedGraph, and the iterative traversals on the
+  FrozenGraph too. traverse_df_rec is reported as a RecursionError on
+  graphs too deep for it.
+
+It reports the time and throughput (edges per second) of each operation,
+the peak memory used while building the graph, and, for each generator and
+operation, the scaling exponent k fitted to time ~ edges**k over the sizes
+run. Results are written as JSON so they can be kept and compared between
+versions.
+
+    $ python3 bench_Graph.py --sizes 1000 10000 100000 --output bench.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from FrozenGraph import *
+from GraphGenerators import *
+
+def best_time(fn, repeat: int) -> float:
+    """The fastest of repeat runs of fn(), in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def peak_memory(fn) -> int:
+    """The peak memory allocated while running fn(), in bytes."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def add_edges(ns: list, es: list) -> IndexedGraph:
+    """Build a graph by adding the nodes and then each edge in turn."""
+    g = IndexedGraph()
+    for n in ns:
+        g.add_node(n)
+    for e in es:
+        g.add_edge(e)
+    return g
+
+def measure(ns: list, es: list, repeat: int, sample: int) -> dict:
+    """Time every operation on the graph with nodes ns and edges es."""
+    (node_set, edge_set) = (set(ns), set(es))
+    g = IndexedGraph.build(node_set, edge_set)
+    f = FrozenGraph.freeze(g)
+    queries = ns[::max(1, len(ns) // sample)]
+    start = ns[0]
+    ops = {
+        'build': lambda: IndexedGraph.build(node_set, edge_set),
+        'add_edge': lambda: add_edges(ns, es),
+        'freeze': lambda: FrozenGraph.freeze(g),
+        'neighbours_out': lambda: [g.neighbours_out(n) for n in queries],
+        'neighbours_in': lambda: [g.neighbours_in(n) for n in queries],
+        'disconnected': g.disconnected,
+        'traverse_df_iter': lambda: g.traverse_df_iter(start),
+        'traverse_df': lambda: g.traverse_df(start),
+        'traverse_bf': lambda: g.traverse_bf(start),
+        'frozen_neighbours_out': lambda: [f.neighbours_out(n) for n in queries],
+        'frozen_traverse_df_iter': lambda: f.traverse_df_iter(start),
+        'frozen_traverse_bf': lambda: f.traverse_bf(start),
+        'traverse_df_rec': lambda: g.traverse_df_rec(start),
+    }
+    results = {}
+    for (name, fn) in ops.items():
+        try:
+            seconds = best_time(fn, repeat)
+        except RecursionError:
+            results[name] = {'error': 'RecursionError'}
+            continue
+        per = len(queries) if 'neighbours' in name else 1
+        results[name] = {
+            'seconds': seconds / per,
+            'edges_per_second': len(es) / seconds if seconds > 0 and per == 1 else None,
+        }
+    return {
+        'nodes': len(ns),
+        'edges': len(es),
+        'peak_build_bytes': peak_memory(lambda: IndexedGraph.build(node_set, edge_set)),
+        'peak_freeze_bytes': peak_memory(lambda: FrozenGraph.freeze(g)),
+        'operations': results,
+    }
+
+def fit_exponent(points: list) -> float:
+    """
+    The slope of the least-squares line through (log x, log y) for the
+    (x, y) pairs in points, ie the k for which y grows like x**k. Returns
+    None if there are fewer than two usable points.
+    """
+    logs = [(math.log(x), math.log(y)) for (x, y) in points if x > 0 and y > 0]
+    if len(logs) < 2:
+        return None
+    mx = sum(x for (x, _) in logs) / len(logs)
+    my = sum(y for (_, y) in logs) / len(logs)
+    sxx = sum((x - mx) ** 2 for (x, _) in logs)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for (x, y) in logs) / sxx
+
+def run(generators: list, sizes: list, repeat: int = 3, sample: int = 1000,
+        seed: int = 0, log=None) -> dict:
+    """
+    Run the benchmarks and return the report as a dict, ready to be written
+    as JSON. log, if given, is called with a line of progress for each run.
+    """
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seed': seed,
+        'sizes': sizes,
+        'results': {},
+        'scaling': {},
+    }
+    for name in generators:
+        runs = []
+        for size in sizes:
+            (ns, es) = GENERATORS[name](size, seed)
+            runs.append(measure(ns, es, repeat, sample))
+            if log is not None:
+                log(f"{name} {len(es)} edges: build "
+                    f"{runs[-1]['operations']['build']['seconds']:.4f}s")
+        report['results'][name] = runs
+        report['scaling'][name] = {
+            op: fit_exponent([(r['edges'], r['operations'][op]['seconds'])
+                              for r in runs if 'seconds' in r['operations'][op]])
+            for op in runs[0]['operations']
+        }
+    return report
+
+def main(argv: list) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the graph classes.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="numbers of edges (default: 1000 10000 100000)")
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS),
+                        default=list(GENERATORS))
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="runs of each operation, the fastest is reported")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="file to write the JSON report to (default: stdout)")
+    args = parser.parse_args(argv)
+    report = run(args.generators, args.sizes, args.repeat, seed=args.seed,
+                 log=lambda line: print(line, file=sys.stderr))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
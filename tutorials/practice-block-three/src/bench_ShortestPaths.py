@@ -0,0 +1,39 @@
+"""
+Compare Dijkstra's and Prim's algorithms using an IndexedMinHeap with
+decrease_key against the same algorithms using heapq with lazy deletion,
+on random sparse graphs (about 4 edges per node) and dense graphs (about
+half of all possible edges).
+
+    $ python3 bench_ShortestPaths.py [NODES ...]
+"""
+
+import random
+import sys
+from ShortestPaths import *
+from bench_Graph import best_time
+
+def random_graph(nodes: int, edges: int, seed: int = 269) -> WeightedGraph:
+    """A random weighted graph with the given numbers of nodes and edges."""
+    rng = random.Random(seed)
+    g = WeightedGraph()
+    for n in range(nodes):
+        g.add_node(n)
+    while g.edge_count < edges:
+        g.add_edge((rng.randrange(nodes), rng.randrange(nodes)), rng.random())
+    return g
+
+def main(sizes: list) -> None:
+    print(f"{'graph':>6} {'nodes':>7} {'edges':>9} {'algorithm':>9}"
+          f" {'indexed':>9} {'lazy':>9} {'ratio':>6}")
+    for nodes in sizes:
+        for (kind, edges) in [('sparse', 4 * nodes), ('dense', nodes * (nodes - 1) // 2)]:
+            g = random_graph(nodes, edges)
+            for (name, indexed, lazy) in [('dijkstra', dijkstra, dijkstra_lazy),
+                                          ('prim', prim, prim_lazy)]:
+                t1 = best_time(lambda: indexed(g, 0), 3)
+                t2 = best_time(lambda: lazy(g, 0), 3)
+                print(f"{kind:>6} {nodes:>7} {edges:>9} {name:>9}"
+                      f" {t1:>8.4f}s {t2:>8.4f}s {t2 / t1:>6.2f}")
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [100, 300, 1000])
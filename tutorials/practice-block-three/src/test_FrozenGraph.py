@@ -0,0 +1,70 @@
+import random
+import unittest
+from FrozenGraph import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.tree1 = IndexedGraph.build({'A', 'B', 'C', 'D', 'E', 'F', 'G'}
+                                        , {('A', 'B'), ('A', 'C'), ('A', 'E')
+                                        , ('B', 'D'), ('B', 'F'), ('C', 'G')
+                                        , ('E', 'F')})
+        self.frozen1 = FrozenGraph.freeze(self.tree1)
+        self.random = IndexedGraph()
+        rng = random.Random(269)
+        for n in range(200):
+            self.random.add_node(n)
+        for _ in range(600):
+            self.random.add_edge((rng.randrange(200), rng.randrange(200)))
+
+    def test_freeze_keeps_nodes_and_edges(self):
+        """ Test that freezing keeps the same nodes and edges."""
+        self.assertEqual(self.frozen1.nodes, self.tree1.nodes)
+        self.assertEqual(self.frozen1.edges, self.tree1.edges)
+        plain = Graph.build({1, 2, 3}, {(1, 2), (2, 3)})
+        self.assertEqual(FrozenGraph.freeze(plain).edges, {(1, 2), (2, 3)})
+
+    def test_queries(self):
+        """ Test that the queries give the same answers as the IndexedGraph."""
+        g = self.random
+        f = FrozenGraph.freeze(g)
+        self.assertEqual(f.disconnected(), g.disconnected())
+        for n in g.nodes:
+            self.assertTrue(f.elem(n))
+            self.assertEqual(f.neighbours_out(n), g.neighbours_out(n))
+            self.assertEqual(f.neighbours_in(n), g.neighbours_in(n))
+        self.assertFalse(f.elem('X'))
+        with self.assertRaises(LookupError):
+            f.neighbours_out('X')
+        with self.assertRaises(LookupError):
+            f.neighbours_in('X')
+
+    def test_traversals(self):
+        """ Test that the traversals visit nodes in the same order as the
+            IndexedGraph they were frozen from.
+        """
+        g = self.random
+        f = FrozenGraph.freeze(g)
+        for n in range(0, 200, 7):
+            self.assertEqual(f.traverse_bf(n), g.traverse_bf(n))
+            self.assertEqual(f.traverse_df_iter(n), g.traverse_df_iter(n))
+        with self.assertRaises(LookupError):
+            f.traverse_bf('X')
+        with self.assertRaises(LookupError):
+            f.traverse_df_iter('X')
+
+    def test_immutable(self):
+        """ Test that a FrozenGraph cannot be changed but can be thawed."""
+        with self.assertRaises(TypeError):
+            self.frozen1.add_node('H')
+        with self.assertRaises(TypeError):
+            self.frozen1.add_edge(('A', 'D'))
+        g = self.frozen1.thaw()
+        g.add_edge(('A', 'D'))
+        self.assertEqual(g.neighbours_out('A'), {'B', 'C', 'D', 'E'})
+
+    def test_compact(self):
+        """ Test that each edge costs 8 bytes of adjacency plus the offsets."""
+        f = FrozenGraph.freeze(self.random)
+        offsets = 2 * 8 * (len(f) + 1)
+        self.assertEqual(f.nbytes(), 8 * f.edge_count + offsets)
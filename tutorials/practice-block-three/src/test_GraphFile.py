@@ -0,0 +1,74 @@
+import os
+import random
+import tempfile
+import unittest
+from GraphFile import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.edge_list = os.path.join(self.dir.name, 'edges.txt')
+        rng = random.Random(269)
+        with open(self.edge_list, 'w') as f:
+            f.write('# a random graph with some repeated edges\n')
+            for _ in range(500):
+                f.write(f'n{rng.randrange(100)} n{rng.randrange(100)}\n')
+            f.write('\nlonely\n')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.dir.name, name)
+
+    def test_load_edge_list(self):
+        """ Test that streaming a text edge list in small chunks builds the
+            whole graph.
+        """
+        g = load_edge_list(self.edge_list, chunk_size=7)
+        self.assertTrue(g.elem('lonely'))
+        self.assertTrue('lonely' in g.disconnected())
+        with open(self.edge_list) as f:
+            edges = {tuple(line.split()) for line in f if len(line.split()) == 2
+                     and not line.startswith('#')}
+        self.assertEqual(g.edges, edges)
+
+    def test_save_and_load(self):
+        """ Test that a saved graph loads with the same nodes, edges and
+            traversals.
+        """
+        g = IndexedGraph.build({1, 2, 3, 4, 5}, {(1, 2), (2, 3), (3, 1), (1, 4)})
+        save(g, self.path('g.bin'))
+        f = load(self.path('g.bin'))
+        self.assertEqual(f.nodes, g.nodes)
+        self.assertEqual(f.edges, g.edges)
+        self.assertEqual(f.disconnected(), {5})
+        self.assertEqual(f.traverse_bf(1), g.traverse_bf(1))
+        self.assertEqual(f.traverse_df_iter(1), g.traverse_df_iter(1))
+        self.assertIsInstance(f.targets, memoryview)
+
+    def test_convert_matches_save(self):
+        """ Test that the streaming converter writes exactly the file that
+            saving the loaded edge list would.
+        """
+        convert_edge_list(self.edge_list, self.path('streamed.bin'), chunk_size=16)
+        save(load_edge_list(self.edge_list), self.path('saved.bin'))
+        with open(self.path('streamed.bin'), 'rb') as f1, open(self.path('saved.bin'), 'rb') as f2:
+            self.assertEqual(f1.read(), f2.read())
+        f = load(self.path('streamed.bin'))
+        g = load_edge_list(self.edge_list)
+        for n in ['n0', 'n13', 'n99']:
+            self.assertEqual(f.neighbours_in(n), g.neighbours_in(n))
+            self.assertEqual(f.traverse_bf(n), g.traverse_bf(n))
+
+    def test_empty_graph(self):
+        """ Test that an empty edge list converts and loads."""
+        open(self.path('empty.txt'), 'w').close()
+        convert_edge_list(self.path('empty.txt'), self.path('empty.bin'))
+        self.assertEqual(len(load(self.path('empty.bin'))), 0)
+
+    def test_bad_file(self):
+        """ Test that loading a file which is not a graph file fails."""
+        with self.assertRaises(ValueError):
+            load(self.edge_list)
@@ -0,0 +1,49 @@
+import json
+import unittest
+from GraphGenerators import *
+from IndexedGraph import *
+import bench_Graph
+
+class Testing(unittest.TestCase):
+
+    def test_generators(self):
+        """ Test that every generator is reproducible and gives about the
+            number of edges asked for, between nodes of the graph, without
+            repeats.
+        """
+        for (name, generate) in GENERATORS.items():
+            (ns, es) = generate(2000, seed=1)
+            self.assertEqual(generate(2000, seed=1), (ns, es))
+            self.assertEqual(len(es), len(set(es)))
+            self.assertTrue(1800 <= len(es) <= 2200, name)
+            nodes = set(ns)
+            for (n, m) in es:
+                self.assertTrue(n in nodes and m in nodes)
+
+    def test_shapes(self):
+        """ Test the shapes of the graphs which are not random."""
+        g = IndexedGraph.build(*map(set, chain(100)))
+        self.assertEqual(g.traverse_df(0), list(range(101)))
+        g = IndexedGraph.build(*map(set, grid(200)))
+        self.assertEqual(len(g.traverse_bf(0)), len(g.nodes))
+        self.assertEqual(max(len(g.neighbours_out(n)) for n in g.nodes), 2)
+        g = IndexedGraph.build(*map(set, forest(1000, tree_size=50)))
+        self.assertFalse(g.has_cycle())
+        self.assertEqual(len(g.disconnected()), 1000 // 49 + 1)
+        self.assertTrue(all(len(g.neighbours_in(n)) <= 1 for n in g.nodes))
+        g = IndexedGraph.build(*map(set, power_law(2000)))
+        self.assertGreater(len(g.traverse_bf(0)), len(g.nodes) // 2)
+
+    def test_fit_exponent(self):
+        """ Test that the fitted scaling exponent recovers a power law."""
+        self.assertAlmostEqual(bench_Graph.fit_exponent([(x, 3 * x ** 2) for x in (10, 100, 1000)]), 2)
+        self.assertIsNone(bench_Graph.fit_exponent([(10, 1)]))
+
+    def test_bench_report(self):
+        """ Test that a small benchmark run gives a JSON report."""
+        report = bench_Graph.run(['chain', 'grid'], [200, 2000], repeat=1)
+        json.dumps(report)
+        self.assertEqual(len(report['results']['chain']), 2)
+        self.assertTrue('traverse_bf' in report['scaling']['grid'])
+        self.assertEqual(report['results']['chain'][1]['operations']['traverse_df_rec']
+                         , {'error': 'RecursionError'})
@@ -0,0 +1,68 @@
+import random
+import unittest
+from GraphKernels import *
+import Traversals
+
+@unittest.skipIf(sparse is None, "numpy and scipy are not installed")
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.graphs = []
+        rng = random.Random(269)
+        for size in (1, 10, 60, 200):
+            g = IndexedGraph()
+            for n in range(size):
+                g.add_node(n)
+            for _ in range(rng.randrange(2 * size)):
+                g.add_edge((rng.randrange(size), rng.randrange(size)))
+            self.graphs.append(g)
+
+    def test_matrix(self):
+        """ Test that the matrix has a 1 for exactly the edges of the graph."""
+        for g in self.graphs:
+            m = GraphMatrix(g)
+            coo = m.matrix.tocoo()
+            edges = {(m.labels[i], m.labels[j]) for (i, j) in zip(coo.row, coo.col)}
+            self.assertEqual(edges, g.edges)
+
+    def test_degrees_and_neighbours(self):
+        """ Test the degree vectors and neighbour sets against the graph."""
+        for g in self.graphs:
+            m = GraphMatrix(g)
+            for (i, n) in enumerate(m.labels):
+                self.assertEqual(m.neighbours_out(n), g.neighbours_out(n))
+                self.assertEqual(m.neighbours_in(n), g.neighbours_in(n))
+                self.assertEqual(m.out_degrees()[i], len(g.neighbours_out(n)))
+                self.assertEqual(m.in_degrees()[i], len(g.neighbours_in(n)))
+            self.assertEqual(m.disconnected(), g.disconnected())
+        with self.assertRaises(LookupError):
+            m.neighbours_out('X')
+
+    def test_bf_levels(self):
+        """ Test that the levels found by matrix products match the nodes and
+            depths of traverse_bf.
+        """
+        for g in self.graphs:
+            m = GraphMatrix(g)
+            sources = list(g.nodes)[:20]
+            levels = m.bf_level_dicts(sources)
+            for s in sources:
+                depths = {}
+                list(Traversals.bf(g.successors, s, visit=depths.__setitem__))
+                self.assertEqual(set(levels[s]), set(g.traverse_bf(s)))
+                self.assertEqual(levels[s], depths)
+
+    def test_pagerank(self):
+        """ Test PageRank against a plain Python power iteration."""
+        for g in self.graphs:
+            ranks = GraphMatrix(g).pagerank()
+            count = len(g.nodes)
+            expected = {n: 1 / count for n in g.nodes}
+            for _ in range(100):
+                dangling = sum(expected[n] for n in g.nodes if not g.neighbours_out(n))
+                expected = {n: 0.15 / count + 0.85 * (dangling / count + sum(
+                    expected[p] / len(g.neighbours_out(p)) for p in g.neighbours_in(n)))
+                            for n in g.nodes}
+            self.assertAlmostEqual(sum(ranks.values()), 1)
+            for n in g.nodes:
+                self.assertAlmostEqual(ranks[n], expected[n])
@@ -0,0 +1,91 @@
+import unittest
+from IndexedGraph import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.tree0 = IndexedGraph.build({'A', 'B', 'C', 'D'}, {('A', 'B'), ('A', 'C')})
+        self.tree1 = IndexedGraph.build({'A', 'B', 'C', 'D', 'E', 'F', 'G'}
+                                        , {('A', 'B'), ('A', 'C'), ('A', 'E')
+                                        , ('B', 'D'), ('B', 'F'), ('C', 'G')
+                                        , ('E', 'F')})
+        self.tree_discon = IndexedGraph.build({'A', 'B', 'C', 'D', 'E', 'F', 'G'}
+                                              , {('A', 'C'), ('A', 'F')})
+
+    def test_build(self):
+        """ Test that build returns an IndexedGraph and rejects bad edges."""
+        self.assertIsInstance(self.tree0, IndexedGraph)
+        with self.assertRaises(LookupError):
+            IndexedGraph.build({'A', 'B'}, {('A', 'X')})
+        with self.assertRaises(LookupError):
+            IndexedGraph.build({'A', 'B'}, {'AB'})
+
+    def test_views(self):
+        """ Test that the nodes and edges views behave like the sets in Graph."""
+        self.assertEqual(self.tree0.nodes, {'A', 'B', 'C', 'D'})
+        self.assertEqual(self.tree0.edges, {('A', 'B'), ('A', 'C')})
+        self.assertEqual(len(self.tree1.edges), 7)
+        self.assertTrue(('B', 'F') in self.tree1.edges)
+        self.assertFalse(('F', 'B') in self.tree1.edges)
+        self.tree0.add_edge(('A', 'B'))
+        self.assertEqual(len(self.tree0.edges), 2)
+
+    def test_indexes_stay_in_sync(self):
+        """ Test that add_node and add_edge keep both adjacency maps in sync."""
+        g = IndexedGraph()
+        for n in range(5):
+            g.add_node(n)
+        g.add_edge((0, 1))
+        g.add_edge((2, 1))
+        g.add_edge((1, 1))
+        self.assertEqual(g.neighbours_out(1), {1})
+        self.assertEqual(g.neighbours_in(1), {0, 1, 2})
+        self.assertEqual(g.disconnected(), {3, 4})
+        for (n, m) in g.edges:
+            self.assertTrue(n in g.neighbours_in(m))
+
+    def test_disconnected(self):
+        """ Test that the disconnected method returns the right set of nodes."""
+        self.assertEqual(self.tree0.disconnected(), {'D'})
+        self.assertEqual(self.tree1.disconnected(), set())
+        self.assertEqual(self.tree_discon.disconnected(), {'B', 'D', 'G', 'E'})
+
+    def test_elem(self):
+        """ Test that the elem method works."""
+        self.assertTrue(self.tree0.elem('A'))
+        self.assertFalse(self.tree0.elem('E'))
+        self.assertFalse(IndexedGraph().elem('X'))
+
+    def test_neighbours(self):
+        """ Test that the neighbours_out and neighbours_in methods work."""
+        self.assertEqual(self.tree0.neighbours_out('A'), {'B', 'C'})
+        self.assertEqual(self.tree1.neighbours_out('B'), {'D', 'F'})
+        self.assertEqual(self.tree0.neighbours_in('A'), set())
+        self.assertEqual(self.tree1.neighbours_in('F'), {'B', 'E'})
+        with self.assertRaises(LookupError):
+            self.tree0.neighbours_out('X')
+        with self.assertRaises(LookupError):
+            self.tree0.neighbours_in('X')
+
+    def test_traversals(self):
+        """ Test that the traversals visit every reachable node once, starting
+            with the first node.
+        """
+        for traverse in (self.tree1.traverse_df_rec, self.tree1.traverse_df_iter
+                         , self.tree1.traverse_bf):
+            t = traverse('A')
+            self.assertEqual(t[0], 'A')
+            self.assertEqual(sorted(t), sorted(self.tree1.nodes))
+            with self.assertRaises(LookupError):
+                traverse('X')
+        self.assertEqual(set(self.tree1.traverse_bf('A')[1:4]), {'B', 'C', 'E'})
+
+    def test_df_iter_matches_df_rec(self):
+        """ Test that both depth-first traversals visit nodes in the same order."""
+        g = IndexedGraph()
+        for n in range(8):
+            g.add_node(n)
+        for e in [(0, 3), (0, 1), (3, 2), (1, 2), (2, 0), (1, 4), (4, 5), (7, 6)]:
+            g.add_edge(e)
+        self.assertEqual(g.traverse_df_iter(0), g.traverse_df_rec(0))
+        self.assertEqual(g.traverse_df_rec(0), [0, 3, 2, 1, 4, 5])
@@ -0,0 +1,69 @@
+import random
+import unittest
+from IndexedHeap import *
+
+class Testing(unittest.TestCase):
+
+    def check_heap_property(self, heap: IndexedMinHeap) -> None:
+        for i in range(1, heap.size()):
+            self.assertLessEqual(heap.priorities[(i - 1) // 2], heap.priorities[i])
+        for (i, item) in enumerate(heap.items):
+            self.assertEqual(heap.position[item], i)
+
+    def test_insert_and_remove(self):
+        """ Test that items come out in priority order."""
+        heap = IndexedMinHeap()
+        nums = [12, 3, 99, 25, 3, 7, 32, 4]
+        for (i, n) in enumerate(nums):
+            heap.insert(i, n)
+            self.check_heap_property(heap)
+        self.assertEqual(heap.peek()[1], 3)
+        out = []
+        while heap.size() > 0:
+            out.append(heap.remove()[1])
+            self.check_heap_property(heap)
+        self.assertEqual(out, sorted(nums))
+        with self.assertRaises(IndexError):
+            heap.remove()
+        with self.assertRaises(IndexError):
+            heap.peek()
+
+    def test_decrease_key(self):
+        """ Test that decreasing a priority moves the item and keeps the
+            position map correct.
+        """
+        heap = IndexedMinHeap()
+        rng = random.Random(269)
+        priorities = {}
+        for i in range(200):
+            priorities[i] = rng.randrange(1000)
+            heap.insert(i, priorities[i])
+        for _ in range(300):
+            i = rng.randrange(200)
+            priorities[i] -= rng.randrange(100)
+            heap.decrease_key(i, priorities[i])
+            self.check_heap_property(heap)
+        out = [heap.remove() for _ in range(200)]
+        self.assertEqual([p for (_, p) in out], sorted(priorities.values()))
+        self.assertEqual(dict(out), priorities)
+
+    def test_errors(self):
+        """ Test that bad inserts and decreases are rejected."""
+        heap = IndexedMinHeap()
+        heap.insert('a', 5)
+        with self.assertRaises(KeyError):
+            heap.insert('a', 1)
+        with self.assertRaises(KeyError):
+            heap.decrease_key('b', 1)
+        with self.assertRaises(ValueError):
+            heap.decrease_key('a', 6)
+
+    def test_insert_or_decrease(self):
+        """ Test that insert_or_decrease only ever lowers priorities."""
+        heap = IndexedMinHeap()
+        self.assertTrue(heap.insert_or_decrease('a', 5))
+        self.assertFalse(heap.insert_or_decrease('a', 7))
+        self.assertTrue(heap.insert_or_decrease('a', 2))
+        self.assertEqual(heap.priority('a'), 2)
+        self.assertTrue('a' in heap)
+        self.assertEqual(len(heap), 1)
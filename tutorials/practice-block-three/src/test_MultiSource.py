@@ -0,0 +1,77 @@
+import multiprocessing
+import os
+import random
+import tempfile
+import unittest
+from MultiSource import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(269)
+        self.g = IndexedGraph()
+        for n in range(300):
+            self.g.add_node(n)
+        for _ in range(450):
+            self.g.add_edge((rng.randrange(300), rng.randrange(300)))
+
+    def test_traverse_bf_many(self):
+        """ Test that the parallel traversals match traverse_bf exactly."""
+        sources = list(range(0, 300, 3))
+        result = traverse_bf_many(self.g, sources, processes=2, chunk_size=8)
+        self.assertEqual(list(result), sources)
+        for s in sources:
+            self.assertEqual(result[s], self.g.traverse_bf(s))
+
+    def test_reachable_batch(self):
+        """ Test that one bit-parallel pass finds the same nodes as a
+            traverse_bf from each source.
+        """
+        f = FrozenGraph.freeze(self.g)
+        sources = list(range(100))
+        for (s, reached) in zip(sources, reachable_batch(f, sources)):
+            self.assertEqual(reached, set(self.g.traverse_bf(s)))
+
+    def test_reachable_many(self):
+        """ Test reachability from more sources than fit in one batch, in
+            this process and in a pool.
+        """
+        sources = list(range(150)) + [0]
+        for processes in (1, 2):
+            result = reachable_many(self.g, sources, processes=processes, width=64)
+            self.assertEqual(len(result), 150)
+            for s in result:
+                self.assertEqual(result[s], set(self.g.traverse_bf(s)))
+
+    def test_graph_file(self):
+        """ Test that workers can share a memory-mapped graph file."""
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'g.bin')
+            GraphFile.save(self.g, path)
+            result = reachable_many(path, [1, 2, 3], processes=2)
+            for s in [1, 2, 3]:
+                self.assertEqual(result[s], set(self.g.traverse_bf(s)))
+            self.assertEqual(traverse_bf_many(path, [4], processes=2)[4]
+                             , self.g.traverse_bf(4))
+
+    def test_spawn(self):
+        """ Test that a graph loaded from a graph file can be handed to
+            workers which are spawned rather than forked.
+        """
+        spawn = multiprocessing.get_context('spawn')
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'g.bin')
+            GraphFile.save(self.g, path)
+            f = GraphFile.load(path)
+            result = reachable_many(f, [1, 2, 3], processes=2, mp_context=spawn)
+            for s in [1, 2, 3]:
+                self.assertEqual(result[s], set(self.g.traverse_bf(s)))
+            self.assertEqual(traverse_bf_many(f, [4], processes=2, mp_context=spawn)[4]
+                             , self.g.traverse_bf(4))
+
+    def test_missing_source(self):
+        """ Test that an unknown source throws a LookupError."""
+        with self.assertRaises(LookupError):
+            reachable_many(self.g, ['X'], processes=1)
+        with self.assertRaises(LookupError):
+            traverse_bf_many(self.g, ['X'], processes=1)
@@ -0,0 +1,58 @@
+import random
+import unittest
+from ReachableGraph import *
+
+class Testing(unittest.TestCase):
+
+    def check_against_bf(self, g: ReachableGraph) -> None:
+        for n in g.nodes:
+            reached = set(g.traverse_bf(n))
+            self.assertEqual(g.reachable_from(n), reached)
+            for m in g.nodes:
+                self.assertEqual(g.reachable(n, m), m in reached)
+
+    def test_incremental(self):
+        """ Test that the index stays correct as edges arrive one at a time."""
+        rng = random.Random(269)
+        g = ReachableGraph()
+        for n in range(40):
+            g.add_node(n)
+        for i in range(80):
+            g.add_edge((rng.randrange(40), rng.randrange(40)))
+            if i % 20 == 0:
+                self.check_against_bf(g)
+        self.assertTrue(g.is_indexed())
+        self.check_against_bf(g)
+
+    def test_build(self):
+        """ Test that building a graph builds the index."""
+        g = ReachableGraph.build({'A', 'B', 'C', 'D'}, {('A', 'B'), ('B', 'C')})
+        self.assertTrue(g.reachable('A', 'C'))
+        self.assertTrue(g.reachable('D', 'D'))
+        self.assertFalse(g.reachable('C', 'A'))
+        g.edges = {('C', 'A')}
+        self.assertFalse(g.reachable('A', 'C'))
+        self.assertTrue(g.reachable('C', 'A'))
+        with self.assertRaises(LookupError):
+            g.reachable('A', 'X')
+
+    def test_fallback(self):
+        """ Test that a graph too large to index answers queries by search,
+            and that cached answers are kept correct when edges are added.
+        """
+        g = ReachableGraph(max_indexed=10, cache_size=4)
+        for n in range(20):
+            g.add_node(n)
+        self.assertFalse(g.is_indexed())
+        for n in range(1, 15):
+            g.add_edge((n - 1, n))
+        self.assertTrue(g.reachable(0, 14))
+        self.assertFalse(g.reachable(0, 15))
+        self.assertFalse(g.reachable(14, 0))
+        g.add_edge((14, 15))
+        self.assertTrue(g.reachable(0, 15))
+        self.assertEqual(g.reachable_from(10), set(range(10, 16)))
+        for n in range(10):
+            g.reachable(n, 19)
+        self.assertLessEqual(len(g.unreachable_cache), 4)
+        self.check_against_bf(g)
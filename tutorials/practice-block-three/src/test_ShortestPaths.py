@@ -0,0 +1,112 @@
+import math
+import random
+import unittest
+from ShortestPaths import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.g = WeightedGraph.build({'A', 'B', 'C', 'D', 'E', 'F'}
+                                     , {('A', 'B', 7), ('A', 'C', 9), ('A', 'F', 14)
+                                     , ('B', 'C', 10), ('B', 'D', 15), ('C', 'D', 11)
+                                     , ('C', 'F', 2), ('D', 'E', 6), ('F', 'E', 9)})
+
+    def random_graph(self, rng, nodes: int, edges: int) -> WeightedGraph:
+        g = WeightedGraph()
+        for n in range(nodes):
+            g.add_node(n)
+        for _ in range(edges):
+            g.add_edge((rng.randrange(nodes), rng.randrange(nodes)), rng.randrange(1, 50))
+        return g
+
+    def test_weighted_graph(self):
+        """ Test that weights are stored and the Graph views still work."""
+        self.assertEqual(self.g.weight(('A', 'B')), 7)
+        self.assertTrue(('C', 'F') in self.g.edges)
+        self.assertEqual(self.g.neighbours_in('E'), {'D', 'F'})
+        self.g.add_edge(('A', 'B'), 3)
+        self.assertEqual(self.g.weight(('A', 'B')), 3)
+        self.assertEqual(len(self.g.edges), 9)
+        self.g.add_edge(('E', 'A'))
+        self.assertEqual(self.g.weight(('E', 'A')), 1)
+        with self.assertRaises(LookupError):
+            self.g.weight(('B', 'A'))
+
+    def test_dijkstra(self):
+        """ Test Dijkstra's algorithm on a small graph."""
+        (dist, prev) = dijkstra(self.g, 'A')
+        self.assertEqual(dist, {'A': 0, 'B': 7, 'C': 9, 'D': 20, 'E': 20, 'F': 11})
+        self.assertEqual(path_to(prev, 'A', 'E'), ['A', 'C', 'F', 'E'])
+        self.assertEqual(shortest_path(self.g, 'A', 'E'), (20, ['A', 'C', 'F', 'E']))
+        self.assertEqual(shortest_path(self.g, 'E', 'A'), (math.inf, []))
+        with self.assertRaises(LookupError):
+            dijkstra(self.g, 'X')
+
+    def test_dijkstra_random(self):
+        """ Test that both versions of Dijkstra's algorithm agree with
+            Bellman-Ford on random graphs.
+        """
+        rng = random.Random(269)
+        for _ in range(10):
+            g = self.random_graph(rng, 40, 150)
+            dist = {0: 0}
+            for _ in range(40):
+                for (n, m, w) in g.weighted_edges():
+                    if n in dist and dist[n] + w < dist.get(m, math.inf):
+                        dist[m] = dist[n] + w
+            self.assertEqual(dijkstra(g, 0)[0], dist)
+            self.assertEqual(dijkstra_lazy(g, 0)[0], dist)
+            for t in range(1, 40):
+                (cost, path) = shortest_path(g, 0, t)
+                self.assertEqual(cost, dist.get(t, math.inf))
+                if path:
+                    self.assertEqual(sum(g.weight(e) for e in zip(path, path[1:])), cost)
+
+    def test_negative_weight(self):
+        """ Test that negative weights are rejected."""
+        self.g.add_edge(('A', 'B'), -1)
+        with self.assertRaises(ValueError):
+            dijkstra(self.g, 'A')
+
+    def test_a_star(self):
+        """ Test that A* on a grid with a wall, using the Manhattan distance,
+            finds a shortest path.
+        """
+        g = WeightedGraph()
+        for x in range(10):
+            for y in range(10):
+                g.add_node((x, y))
+        for x in range(10):
+            for y in range(10):
+                for (dx, dy) in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                    # a wall at x = 4 with a gap at the top
+                    if (x + dx, y + dy) in g.nodes and not (x + dx == 4 and y + dy < 8):
+                        g.add_edge(((x, y), (x + dx, y + dy)))
+        h = lambda n: abs(n[0] - 9) + abs(n[1] - 9)
+        (cost, path) = a_star(g, (0, 0), (9, 9), h)
+        self.assertEqual(cost, shortest_path(g, (0, 0), (9, 9))[0])
+        self.assertEqual(len(path), cost + 1)
+
+    def test_prim(self):
+        """ Test that Prim's algorithm finds a minimum spanning tree."""
+        t = prim(self.g, 'A')
+        self.assertEqual(t.nodes, self.g.nodes)
+        self.assertEqual(len(t.edges), 5)
+        self.assertEqual(sum(w for (_, _, w) in t.weighted_edges()), 33)
+        self.assertEqual(t.traverse_bf('A')[0], 'A')
+        self.assertEqual(len(t.traverse_bf('A')), 6)
+
+    def test_prim_random(self):
+        """ Test that both versions of Prim's algorithm give spanning forests
+            of the same weight on random graphs.
+        """
+        rng = random.Random(269)
+        weight = lambda t: sum(w for (_, _, w) in t.weighted_edges())
+        for _ in range(10):
+            g = self.random_graph(rng, 40, 60)
+            t1 = prim(g)
+            t2 = prim_lazy(g)
+            self.assertEqual(t1.nodes, g.nodes)
+            self.assertEqual(weight(t1), weight(t2))
+            self.assertEqual(len(t1.edges), len(t2.edges))
+            self.assertFalse(t1.has_cycle())
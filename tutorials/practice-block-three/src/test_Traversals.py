@@ -0,0 +1,141 @@
+import random
+import unittest
+from itertools import islice
+from FrozenGraph import *
+import Traversals
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.tree1 = IndexedGraph.build({'A', 'B', 'C', 'D', 'E', 'F', 'G'}
+                                        , {('A', 'B'), ('A', 'C'), ('A', 'E')
+                                        , ('B', 'D'), ('B', 'F'), ('C', 'G')
+                                        , ('E', 'F')})
+        self.graphs = [self.tree1, FrozenGraph.freeze(self.tree1)]
+
+    def test_same_order_as_lists(self):
+        """ Test that the lazy traversals yield the same nodes in the same
+            order as the list-returning traversals.
+        """
+        for g in self.graphs:
+            self.assertEqual(list(g.iter_bf('A')), g.traverse_bf('A'))
+            self.assertEqual(list(g.iter_df('A')), g.traverse_df_iter('A'))
+        self.assertEqual(list(self.tree1.iter_df('A')), self.tree1.traverse_df_rec('A'))
+
+    def test_fails_when_missing(self):
+        """ Test that the lazy traversals throw a LookupError straight away
+            if the node is not present.
+        """
+        for g in self.graphs:
+            with self.assertRaises(LookupError):
+                g.iter_bf('X')
+            with self.assertRaises(LookupError):
+                g.iter_df('X')
+
+    def test_max_depth(self):
+        """ Test that a depth limit stops the traversal going further."""
+        for g in self.graphs:
+            self.assertEqual(list(g.iter_bf('A', max_depth=0)), ['A'])
+            self.assertEqual(set(g.iter_bf('A', max_depth=1)), {'A', 'B', 'C', 'E'})
+            self.assertEqual(set(g.iter_df('A', max_depth=1)), {'A', 'B', 'C', 'E'})
+            self.assertEqual(set(g.iter_bf('A', max_depth=2)), set(g.nodes))
+
+    def test_visit(self):
+        """ Test that visit sees every node with its depth, and can stop the
+            traversal.
+        """
+        for g in self.graphs:
+            seen = []
+            list(g.iter_bf('A', visit=lambda n, d: seen.append((n, d))))
+            self.assertEqual(dict(seen), {'A': 0, 'B': 1, 'C': 1, 'E': 1
+                                          , 'D': 2, 'F': 2, 'G': 2})
+            t = list(g.iter_df('A', visit=lambda n, d: n == 'B'))
+            self.assertEqual(t[-1], 'B')
+
+    def test_lazy(self):
+        """ Test that stopping early only looks at the part of the graph
+            needed, even when the graph is infinite.
+        """
+        calls = []
+        def successors(n):
+            calls.append(n)
+            return [2 * n, 2 * n + 1]
+        self.assertEqual(list(islice(Traversals.bf(successors, 1), 7))
+                         , [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(list(islice(Traversals.df(successors, 1), 4)), [1, 2, 4, 8])
+
+    def test_long_chain(self):
+        """ Test that breadth-first traversal of a long chain is fast."""
+        g = IndexedGraph()
+        for n in range(100000):
+            g.add_node(n)
+        for n in range(1, 100000):
+            g.add_edge((n - 1, n))
+        self.assertEqual(g.traverse_bf(0)[-1], 99999)
+        self.assertEqual(g.traverse_df_iter(0)[-1], 99999)
+
+    def test_dfs_matches_recursive(self):
+        """ Test that the explicit-stack depth-first traversal visits nodes in
+            exactly the same order as the recursive one.
+        """
+        rng = random.Random(269)
+        for _ in range(20):
+            g = IndexedGraph()
+            for n in range(30):
+                g.add_node(n)
+            for _ in range(rng.randrange(60)):
+                g.add_edge((rng.randrange(30), rng.randrange(30)))
+            f = FrozenGraph.freeze(g)
+            for n in range(0, 30, 5):
+                self.assertEqual(g.traverse_df(n), g.traverse_df_rec(n))
+                self.assertEqual(f.traverse_df(n), g.traverse_df_rec(n))
+
+    def test_dfs_hooks(self):
+        """ Test that pre and post are called in the order a recursive
+            traversal would enter and leave each node.
+        """
+        for g in self.graphs:
+            events = []
+            g.traverse_df('A', pre=lambda n: events.append(('pre', n))
+                          , post=lambda n: events.append(('post', n)))
+            expected = []
+            def visit(v, seen):
+                seen.add(v)
+                expected.append(('pre', v))
+                for w in self.tree1.successors(v):
+                    if w not in seen:
+                        visit(w, seen)
+                expected.append(('post', v))
+            visit('A', set())
+            self.assertEqual(events, expected)
+
+    def test_dfs_deep_chain(self):
+        """ Test that the depth-first traversal works on a chain far longer
+            than the recursion limit.
+        """
+        g = IndexedGraph()
+        for n in range(200000):
+            g.add_node(n)
+        for n in range(1, 200000):
+            g.add_edge((n - 1, n))
+        self.assertEqual(g.traverse_df(0), list(range(200000)))
+        self.assertEqual(g.topological_sort(), list(range(200000)))
+        self.assertFalse(g.has_cycle())
+        g.add_edge((199999, 0))
+        self.assertTrue(g.has_cycle())
+
+    def test_topological_sort(self):
+        """ Test that a topological sort puts the source of each edge first,
+            and fails on graphs with cycles.
+        """
+        for g in self.graphs:
+            order = g.topological_sort()
+            self.assertEqual(sorted(order), sorted(g.nodes))
+            for (n, m) in g.edges:
+                self.assertLess(order.index(n), order.index(m))
+            self.assertFalse(g.has_cycle())
+        loop = IndexedGraph.build({1, 2}, {(1, 2), (2, 2)})
+        self.assertTrue(loop.has_cycle())
+        with self.assertRaises(ValueError):
+            FrozenGraph.freeze(loop).topological_sort()
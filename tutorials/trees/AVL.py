@@ -0,0 +1,142 @@
+from BST import *
+
+def node_height(t: 'AVL') -> int:
+    """The height of an AVL tree, which is 0 for the empty tree."""
+    return t.node_height if t else 0
+
+class AVL(BST):
+    """An AVL tree: a BST which rebalances itself after every insert and
+    remove, so that the heights of the two subtrees of any node differ by
+    at most one. The height of the whole tree is then O(log n), and so are
+    insert, remove and search, whatever order the items arrive in.
+
+    Each node caches its height in node_height. All changes to the shape of
+    the tree go through relink, which sets a node's children and updates
+    what it caches, so subclasses can cache more or change how nodes are
+    updated by overriding update and relink.
+    """
+
+    __slots__ = ('node_height',)
+
+    def __init__(self, value, left: 'AVL' = None, right: 'AVL' = None):
+        """ Construct a new AVL tree."""
+        super().__init__(value, left, right)
+        self.update()
+
+    def update(self) -> None:
+        """Recompute the data cached in this node from its children."""
+        self.node_height = 1 + max(node_height(self.left), node_height(self.right))
+
+    def relink(self, left: 'AVL', right: 'AVL', value=None) -> 'AVL':
+        """Give this node new children (and optionally a new value), update
+        it and return it.
+        """
+        if value is not None:
+            self.value = value
+        self.left = left
+        self.right = right
+        self.update()
+        return self
+
+    def leaf(self, item) -> 'AVL':
+        """Make a new single-node tree of the same class as this one."""
+        return type(self)(item, None, None)
+
+    def balance_factor(self) -> int:
+        """The height of the left subtree minus the height of the right one."""
+        return node_height(self.left) - node_height(self.right)
+
+    def rotate_right(self) -> 'AVL':
+        """Rotate this node down to the right, returning the new root."""
+        l = self.left
+        return l.relink(l.left, self.relink(l.right, self.right))
+
+    def rotate_left(self) -> 'AVL':
+        """Rotate this node down to the left, returning the new root."""
+        r = self.right
+        return r.relink(self.relink(self.left, r.left), r.right)
+
+    def rebalance(self) -> 'AVL':
+        """Restore the AVL property at this node, whose subtrees are AVL
+        trees with heights differing by at most two, and return the new root.
+        """
+        bf = self.balance_factor()
+        if bf > 1:
+            t = self
+            if self.left.balance_factor() < 0:
+                t = self.relink(self.left.rotate_left(), self.right)
+            return t.rotate_right()
+        if bf < -1:
+            t = self
+            if self.right.balance_factor() > 0:
+                t = self.relink(self.left, self.right.rotate_right())
+            return t.rotate_left()
+        return self
+
+    def insert(self, item) -> 'AVL':
+        """Insert a new item to the AVL tree, returning the new root."""
+        if self.search(item):
+            return self
+        return self.insert_below(item)
+
+    def insert_below(self, item) -> 'AVL':
+        """Insert item, which must not be present, into the subtree rooted
+        here, returning the new root of the subtree.
+        """
+        if item < self.value:
+            left = self.left.insert_below(item) if self.left else self.leaf(item)
+            return self.relink(left, self.right).rebalance()
+        right = self.right.insert_below(item) if self.right else self.leaf(item)
+        return self.relink(self.left, right).rebalance()
+
+    def remove_min(self) -> tuple:
+        """Remove the smallest item, returning the new root (or None) and
+        the item.
+        """
+        if not self.left:
+            return (self.right, self.value)
+        (left, item) = self.left.remove_min()
+        return (self.relink(left, self.right).rebalance(), item)
+
+    def remove(self, item) -> 'AVL':
+        """Remove an item from the AVL tree, returning the new root, or None
+        if the tree is now empty. Removing an item which is not in the tree
+        returns the tree unchanged.
+        """
+        if not self.search(item):
+            return self
+        return self.remove_below(item)
+
+    def remove_below(self, item) -> 'AVL':
+        """Remove item, which must be present, from the subtree rooted here,
+        returning the new root of the subtree.
+        """
+        if item < self.value:
+            return self.relink(self.left.remove_below(item), self.right).rebalance()
+        if item > self.value:
+            return self.relink(self.left, self.right.remove_below(item)).rebalance()
+        if not self.left:
+            return self.right
+        if not self.right:
+            return self.left
+        (right, successor) = self.right.remove_min()
+        return self.relink(self.left, right, successor).rebalance()
+
+    def search(self, item) -> bool:
+        """Search the AVL tree for an item."""
+        t = self
+        while t:
+            if item == t.value:
+                return True
+            t = t.left if item < t.value else t.right
+        return False
+
+    @classmethod
+    def build(cls, ns: set) -> 'AVL':
+        """Build an AVL tree from a set, or None if the set is empty."""
+        return cls.bulk_build(ns)
+
+    @classmethod
+    def merge(cls, t1: 'AVL', t2: 'AVL') -> 'AVL':
+        """Merge two AVL trees into a new one. Either may be None."""
+        return cls.bulk_merge(t1, t2)
@@ -1,9 +1,40 @@
 import random
 from Tree import *
 
+# The end of an iterator in merge_sorted, which no item can be
+_END = object()
+
+def merge_sorted(xs, ys):
+    """Merge two ascending iterators of distinct items into one ascending
+    iterator, keeping only one copy of an item which appears in both.
+    """
+    xs = iter(xs)
+    ys = iter(ys)
+    x = next(xs, _END)
+    y = next(ys, _END)
+    while x is not _END and y is not _END:
+        if x < y:
+            yield x
+            x = next(xs, _END)
+        elif y < x:
+            yield y
+            y = next(ys, _END)
+        else:
+            yield x
+            x = next(xs, _END)
+            y = next(ys, _END)
+    if x is not _END:
+        yield x
+        yield from xs
+    if y is not _END:
+        yield y
+        yield from ys
+
 class BST(Tree):
     """A Binary Search Tree."""
 
+    __slots__ = ()
+
     def insert(self, item) -> 'BST':
         """Insert a new item to the BST."""
         pass
@@ -24,4 +55,31 @@ class BST(Tree):
     @classmethod
     def merge(cls, t1: 'BST', t2: 'BST') -> 'BST':
         """Merge two BSTs."""
-        pass
\ No newline at end of file
+        pass
+
+    @classmethod
+    def from_sorted(cls, items: list) -> 'BST':
+        """Build a perfectly balanced BST from a list of distinct items in
+        ascending order, or None if the list is empty. Each item becomes a
+        node exactly once, so this takes O(n) time.
+        """
+        def build(lo: int, hi: int) -> 'BST':
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            return cls(items[mid], build(lo, mid), build(mid + 1, hi))
+        return build(0, len(items))
+
+    @classmethod
+    def bulk_build(cls, ns) -> 'BST':
+        """Build a balanced BST from a collection by sorting it once and then
+        using from_sorted, instead of inserting the items one at a time.
+        """
+        return cls.from_sorted(sorted(set(ns)))
+
+    @classmethod
+    def bulk_merge(cls, t1: 'BST', t2: 'BST') -> 'BST':
+        """Merge two BSTs (either may be None) into a new balanced BST in
+        O(n+m) time, by merging their in-order streams and using from_sorted.
+        """
+        return cls.from_sorted(list(merge_sorted(in_order(t1), in_order(t2))))
@@ -0,0 +1,288 @@
+from bisect import bisect_left, bisect_right
+from BST import *
+
+# The default maximum number of keys in a leaf and children of a branch
+DEFAULT_FANOUT = 128
+
+class Leaf:
+    """A leaf of a B+ tree: a sorted list of keys and the next leaf to the
+    right, so that the leaves form a chain in key order.
+    """
+
+    __slots__ = ('keys', 'next')
+
+    def __init__(self, keys: list, next: 'Leaf' = None):
+        self.keys = keys
+        self.next = next
+
+class Branch:
+    """An internal node of a B+ tree. children[i] holds the keys below
+    keys[i] and at or above keys[i-1], so there is one more child than key.
+    """
+
+    __slots__ = ('keys', 'children')
+
+    def __init__(self, keys: list, children: list):
+        self.keys = keys
+        self.children = children
+
+def split_evenly(items: list, parts: int) -> list:
+    """Split items into the given number of runs whose lengths differ by at
+    most one.
+    """
+    (size, extra) = divmod(len(items), parts)
+    runs = []
+    lo = 0
+    for p in range(parts):
+        hi = lo + size + (p < extra)
+        runs.append(items[lo:hi])
+        lo = hi
+    return runs
+
+class BTree:
+    """An ordered set of items stored as a B+ tree. Every leaf is at the
+    same depth and holds up to fanout keys in a Python list, and every
+    branch has up to fanout children, so the height is about log n to the
+    base fanout/2 and each search follows a handful of references and then
+    bisects a list in C, instead of following one reference per level of a
+    binary tree. The leaves are chained together, so iterating over a range
+    of keys needs one search to find where to start.
+
+    BTree keeps the contract of BST: insert and remove return the tree (here
+    always the same object, which is a container rather than a node), and
+    build and merge are class methods.
+    """
+
+    __slots__ = ('fanout', 'root', 'size')
+
+    def __init__(self, fanout: int = DEFAULT_FANOUT):
+        """ Construct a new, empty BTree. Throws a ValueError if fanout is
+        less than 4.
+        """
+        if fanout < 4:
+            raise ValueError(f"Fanout must be at least 4: {fanout}")
+        self.fanout = fanout
+        self.root = Leaf([])
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, item) -> bool:
+        return self.search(item)
+
+    def __iter__(self):
+        """Iterate over the items in order, along the chain of leaves."""
+        leaf = self.first_leaf()
+        while leaf:
+            yield from leaf.keys
+            leaf = leaf.next
+
+    def to_list(self) -> list:
+        """The items in order."""
+        return list(self)
+
+    def height(self) -> int:
+        """The number of levels of the tree, counting the leaves."""
+        h = 1
+        node = self.root
+        while isinstance(node, Branch):
+            node = node.children[0]
+            h += 1
+        return h
+
+    def first_leaf(self) -> Leaf:
+        """The leaf holding the smallest items."""
+        node = self.root
+        while isinstance(node, Branch):
+            node = node.children[0]
+        return node
+
+    def find_leaf(self, item, path: list = None) -> Leaf:
+        """The leaf in which item is or would be. If path is given, each
+        branch on the way and the index of the child taken are appended to
+        it.
+        """
+        node = self.root
+        while isinstance(node, Branch):
+            i = bisect_right(node.keys, item)
+            if path is not None:
+                path.append((node, i))
+            node = node.children[i]
+        return node
+
+    def search(self, item) -> bool:
+        """Search the BTree for an item."""
+        keys = self.find_leaf(item).keys
+        i = bisect_left(keys, item)
+        return i < len(keys) and keys[i] == item
+
+    def range(self, lo, hi):
+        """Iterate in order over the items x in the tree with lo <= x < hi,
+        in O(log n + k) time for k items.
+        """
+        leaf = self.find_leaf(lo)
+        i = bisect_left(leaf.keys, lo)
+        while leaf:
+            for x in leaf.keys[i:]:
+                if not x < hi:
+                    return
+                yield x
+            leaf = leaf.next
+            i = 0
+
+    def insert(self, item) -> 'BTree':
+        """Insert a new item to the BTree, splitting full nodes on the way
+        back up, and return the BTree.
+        """
+        path = []
+        leaf = self.find_leaf(item, path)
+        keys = leaf.keys
+        i = bisect_left(keys, item)
+        if i < len(keys) and keys[i] == item:
+            return self
+        keys.insert(i, item)
+        self.size += 1
+        if len(keys) <= self.fanout:
+            return self
+        mid = len(keys) // 2
+        new = Leaf(keys[mid:], leaf.next)
+        del keys[mid:]
+        leaf.next = new
+        separator = new.keys[0]
+        while path:
+            (branch, i) = path.pop()
+            branch.keys.insert(i, separator)
+            branch.children.insert(i + 1, new)
+            if len(branch.children) <= self.fanout:
+                return self
+            mid = len(branch.keys) // 2
+            separator = branch.keys[mid]
+            new = Branch(branch.keys[mid + 1:], branch.children[mid + 1:])
+            del branch.keys[mid:]
+            del branch.children[mid + 1:]
+        self.root = Branch([separator], [self.root, new])
+        return self
+
+    def remove(self, item) -> 'BTree':
+        """Remove an item from the BTree and return the BTree. A node left
+        less than half full borrows from a sibling or is merged with one,
+        on the way back up. Removing an item which is not in the tree leaves
+        it unchanged.
+        """
+        path = []
+        leaf = self.find_leaf(item, path)
+        keys = leaf.keys
+        i = bisect_left(keys, item)
+        if i == len(keys) or keys[i] != item:
+            return self
+        del keys[i]
+        self.size -= 1
+        least = self.fanout // 2
+        node = leaf
+        while path:
+            (parent, i) = path.pop()
+            if isinstance(node, Leaf):
+                if len(node.keys) >= least:
+                    break
+                self.fix_leaf(parent, i, least)
+            else:
+                if len(node.children) >= least:
+                    break
+                self.fix_branch(parent, i, least)
+            node = parent
+        if isinstance(self.root, Branch) and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+        return self
+
+    def fix_leaf(self, parent: Branch, i: int, least: int) -> None:
+        """Refill the leaf parent.children[i], which has too few keys, from
+        a sibling, or merge it with one.
+        """
+        node = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+        if left and len(left.keys) > least:
+            node.keys.insert(0, left.keys.pop())
+            parent.keys[i - 1] = node.keys[0]
+        elif right and len(right.keys) > least:
+            node.keys.append(right.keys.pop(0))
+            parent.keys[i] = right.keys[0]
+        elif left:
+            left.keys.extend(node.keys)
+            left.next = node.next
+            del parent.keys[i - 1]
+            del parent.children[i]
+        else:
+            node.keys.extend(right.keys)
+            node.next = right.next
+            del parent.keys[i]
+            del parent.children[i + 1]
+
+    def fix_branch(self, parent: Branch, i: int, least: int) -> None:
+        """Refill the branch parent.children[i], which has too few children,
+        from a sibling, or merge it with one. Keys move through the parent.
+        """
+        node = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+        if left and len(left.children) > least:
+            node.keys.insert(0, parent.keys[i - 1])
+            node.children.insert(0, left.children.pop())
+            parent.keys[i - 1] = left.keys.pop()
+        elif right and len(right.children) > least:
+            node.keys.append(parent.keys[i])
+            node.children.append(right.children.pop(0))
+            parent.keys[i] = right.keys.pop(0)
+        elif left:
+            left.keys.append(parent.keys[i - 1])
+            left.keys.extend(node.keys)
+            left.children.extend(node.children)
+            del parent.keys[i - 1]
+            del parent.children[i]
+        else:
+            node.keys.append(parent.keys[i])
+            node.keys.extend(right.keys)
+            node.children.extend(right.children)
+            del parent.keys[i]
+            del parent.children[i + 1]
+
+    @classmethod
+    def from_sorted(cls, items: list, fanout: int = DEFAULT_FANOUT) -> 'BTree':
+        """Bulk load a BTree from a list of distinct items in ascending order
+        in O(n) time. Each level is made by cutting the one below into as
+        few nodes as will hold it, with sizes differing by at most one, so
+        every node is at least half full.
+        """
+        t = cls(fanout)
+        if not items:
+            return t
+        leaves = [Leaf(keys) for keys in split_evenly(items, -(-len(items) // fanout))]
+        for (leaf, next) in zip(leaves, leaves[1:]):
+            leaf.next = next
+        # each node of the level being built, with the smallest key below it
+        level = [(leaf, leaf.keys[0]) for leaf in leaves]
+        while len(level) > 1:
+            level = [(Branch([least for (_, least) in run[1:]], [node for (node, _) in run]),
+                      run[0][1])
+                     for run in split_evenly(level, -(-len(level) // fanout))]
+        t.root = level[0][0]
+        t.size = len(items)
+        return t
+
+    @classmethod
+    def build(cls, ns, fanout: int = DEFAULT_FANOUT) -> 'BTree':
+        """Build a BTree from a collection by sorting it once and bulk
+        loading it.
+        """
+        return cls.from_sorted(sorted(set(ns)), fanout)
+
+    @classmethod
+    def merge(cls, t1: 'BTree', t2: 'BTree') -> 'BTree':
+        """Merge two BTrees (either may be None) into a new one in O(n+m)
+        time, by merging their chains of leaves. The new tree has the fanout
+        of t1, or of t2 if t1 is None.
+        """
+        fanout = t1.fanout if t1 is not None else \
+            t2.fanout if t2 is not None else DEFAULT_FANOUT
+        return cls.from_sorted(list(merge_sorted(t1 or (), t2 or ())), fanout)
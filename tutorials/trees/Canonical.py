@@ -0,0 +1,207 @@
+"""
+Canonical Huffman codes and a table-driven decoder.
+
+A Huffman tree fixes only how long the code of each symbol is; which bits
+the codes use is arbitrary. A canonical code gives the codes out in order:
+symbols are sorted by code length and then by symbol, and each gets the
+next code of its length, so a code can be rebuilt from the lengths alone
+and is sent as those lengths rather than as a tree or a table of bit
+lists.
+
+Codes are pairs (bits, length) of an int and the number of its low bits
+used, most significant bit first. Decoding reads bytes, taking the bits of
+each byte from the most significant down.
+
+DecodeTable resolves a whole code per lookup rather than walking a tree a
+bit at a time. The next root_bits bits of input index a root table, whose
+entry gives the symbol and its code length directly for codes no longer
+than root_bits. A longer code shares its first root_bits bits with the
+other long codes under the same entry, which instead points to a subtable
+indexed by up to root_bits of the bits that follow, and so on for codes
+longer still. A subtable is only as wide as the longest code under it
+needs, and never wider than the root table, so a code of length l takes
+at most ceil(l / root_bits) lookups and the tables grow with the number
+of symbols rather than with the length of the longest code.
+"""
+
+from Tree import *
+
+# The default number of bits indexing the root table of a DecodeTable
+ROOT_BITS = 10
+
+def code_lengths(t: Tree) -> dict:
+    """The length of the code of every symbol in a Huffman tree, whose
+    leaves have values (symbol, freq). A tree with only one leaf gives its
+    symbol a code of one bit.
+    """
+    if t is None:
+        return {}
+    if t.is_leaf():
+        return {t.value[0]: 1}
+    return {n.value[0]: depth - 1 for (n, depth) in t.iter_depths() if n.is_leaf()}
+
+def canonical_code(lengths: dict) -> dict:
+    """The canonical code for the given code lengths, as a dict from each
+    symbol to a pair (bits, length). Throws a ValueError if the lengths do
+    not describe a prefix code.
+    """
+    code = {}
+    bits = 0
+    previous = 0
+    for (length, symbol) in sorted((l, s) for (s, l) in lengths.items()):
+        if length < 1:
+            raise ValueError(f"Code length must be at least 1: {symbol!r}")
+        bits <<= length - previous
+        if bits >> length:
+            raise ValueError("Code lengths are too short to make a prefix code")
+        code[symbol] = (bits, length)
+        bits += 1
+        previous = length
+    return code
+
+def code_bits(code: dict) -> dict:
+    """A code of (bits, length) pairs as a dict from each symbol to a list
+    of bits, the form used by Huffman.build_code.
+    """
+    return {s: [(bits >> i) & 1 for i in reversed(range(length))]
+            for (s, (bits, length)) in code.items()}
+
+def pack_bits(bits: list) -> bytes:
+    """Pack a list of bits into bytes, most significant bit first, padding
+    the last byte with zeros.
+    """
+    data = bytearray((len(bits) + 7) // 8)
+    for (i, b) in enumerate(bits):
+        if b:
+            data[i >> 3] |= 0x80 >> (i & 7)
+    return bytes(data)
+
+def table_layout(lengths: dict, root_bits: int = ROOT_BITS) -> tuple:
+    """
+    The shape of the tables of a DecodeTable for the given code lengths, as
+    a pair (width, subtables) for the root table: width is the number of
+    bits indexing the table, and subtables maps each entry which points to
+    a subtable to the shape of that subtable in turn. A table is indexed by
+    as many bits as the longest code under it has left, up to root_bits.
+    """
+    return _layout(list(canonical_code(lengths).values()), 0, root_bits)
+
+def _layout(codes: list, used: int, root_bits: int) -> tuple:
+    """The shape of a table for codes of (bits, length) pairs whose first
+    used bits index the tables above it.
+    """
+    width = min(root_bits, max((length for (_, length) in codes), default=0) - used)
+    groups = {}
+    for (bits, length) in codes:
+        if length - used > width:
+            i = (bits >> (length - used - width)) & ((1 << width) - 1)
+            groups.setdefault(i, []).append((bits, length))
+    return (width, {i: _layout(group, used + width, root_bits) for (i, group) in groups.items()})
+
+def table_entries(lengths: dict, root_bits: int = ROOT_BITS) -> int:
+    """The number of entries in the tables a DecodeTable would have for the
+    code lengths, a measure of the memory it needs, found from their shape
+    without making them.
+    """
+    entries = 0
+    layouts = [table_layout(lengths, root_bits)]
+    while layouts:
+        (width, subtables) = layouts.pop()
+        entries += 1 << width
+        layouts.extend(subtables.values())
+    return entries
+
+class DecodeTable:
+    """A multi-level lookup table for decoding a canonical Huffman code.
+
+    The root table and each subtable are a pair of lists, symbols and
+    lengths. A positive length is the total length of the code of the
+    entry's symbol, a negative one -k means the symbol is a subtable
+    indexed by the k bits that follow, and 0 means that no code starts
+    with those bits.
+    """
+
+    def __init__(self, lengths: dict, root_bits: int = ROOT_BITS):
+        """ Construct a new DecodeTable for the canonical code with the
+        given code lengths.
+        """
+        layout = table_layout(lengths, root_bits)
+        self.max_length = max(lengths.values(), default=0)
+        self.root_bits = layout[0]
+        (self.symbols, self.lengths) = self.make_table(layout)
+        for (symbol, (bits, length)) in canonical_code(lengths).items():
+            (symbols, lengths, width, used) = (self.symbols, self.lengths, self.root_bits, 0)
+            while length - used > width:
+                used += width
+                i = (bits >> (length - used)) & ((1 << width) - 1)
+                width = -lengths[i]
+                (symbols, lengths) = symbols[i]
+            spare = width - (length - used)
+            low = (bits & ((1 << (length - used)) - 1)) << spare
+            for i in range(low, low + (1 << spare)):
+                symbols[i] = symbol
+                lengths[i] = length
+
+    @staticmethod
+    def make_table(layout: tuple) -> tuple:
+        """Make the empty tables with the shape layout, from table_layout."""
+        (width, subtables) = layout
+        (symbols, lengths) = ([None] * (1 << width), [0] * (1 << width))
+        for (i, sub) in subtables.items():
+            symbols[i] = DecodeTable.make_table(sub)
+            lengths[i] = -sub[0]
+        return (symbols, lengths)
+
+    def decode(self, data: bytes, count: int, offset: int = 0) -> list:
+        """Decode count symbols from data, starting offset bits in, and
+        return them as a list. Throws a ValueError if the data do not hold
+        count codes.
+        """
+        (root_bits, max_length) = (self.root_bits, self.max_length)
+        (root_symbols, root_lengths) = (self.symbols, self.lengths)
+        root_mask = (1 << root_bits) - 1
+        # enough bytes to hold the longest code, however many bits are left
+        refill = max(7, (max_length + 7) >> 3)
+        out = []
+        append = out.append
+        # acc holds the next nbits bits of input, ahead of pos in data
+        (pos, skip) = divmod(offset, 8)
+        (acc, nbits) = (0, 0)
+        if skip:
+            (acc, nbits) = (data[pos] & (0xFF >> skip), 8 - skip)
+            pos += 1
+        padding = 0
+        for _ in range(count):
+            if nbits < max_length:
+                chunk = data[pos:pos + refill]
+                pos += refill
+                acc = ((acc & ((1 << nbits) - 1)) << (8 * len(chunk))) | int.from_bytes(chunk, 'big')
+                nbits += 8 * len(chunk)
+                if nbits < max_length:
+                    # past the end of the data: make up the rest with zeros
+                    acc <<= max_length - nbits
+                    padding += max_length - nbits
+                    nbits = max_length
+            i = (acc >> (nbits - root_bits)) & root_mask
+            length = root_lengths[i]
+            if length > 0:
+                append(root_symbols[i])
+            elif length < 0:
+                (symbols, lengths) = root_symbols[i]
+                used = root_bits
+                while True:
+                    used -= length
+                    j = (acc >> (nbits - used)) & ((1 << -length) - 1)
+                    length = lengths[j]
+                    if length >= 0:
+                        break
+                    (symbols, lengths) = symbols[j]
+                if not length:
+                    raise ValueError("Invalid code in data")
+                append(symbols[j])
+            else:
+                raise ValueError("Invalid code in data")
+            nbits -= length
+        if nbits < padding:
+            raise ValueError("Data ended in the middle of a code")
+        return out
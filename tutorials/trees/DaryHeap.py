@@ -0,0 +1,156 @@
+class DaryHeap:
+    """An array-backed min heap in which each node has arity children (4 by
+    default), so the heap is shallower than a binary one and the children
+    compared at each step of a sift down sit next to each other in memory.
+
+    Each item's priority is worked out once, when it is added, by key (the
+    item itself if there is no key) or given explicitly, and kept in the
+    list priorities, which runs in parallel with items. The sift loops only
+    compare priorities, so they never call key or look up attributes, and
+    items with equal priorities are never compared with each other.
+    """
+
+    __slots__ = ('arity', 'key', 'priorities', 'items')
+
+    def __init__(self, arity: int = 4, key=None) -> None:
+        """ Construct a new, empty DaryHeap. Throws a ValueError if arity is
+        less than 2.
+        """
+        if arity < 2:
+            raise ValueError(f"Arity must be at least 2: {arity}")
+        self.arity = arity
+        self.key = key
+        self.priorities = []
+        self.items = []
+
+    @classmethod
+    def from_iterable(cls, items, arity: int = 4, key=None) -> 'DaryHeap':
+        """Make a heap of the items in O(n) time with heapify."""
+        h = cls(arity, key)
+        h.items = list(items)
+        h.priorities = list(map(key, h.items)) if key else h.items.copy()
+        h.heapify()
+        return h
+
+    def heapify(self) -> None:
+        """Restore the heap property for the whole heap bottom up, by
+        sifting down every node which has children, last first. This is
+        O(n), as most nodes are near the bottom and move only a little way.
+        """
+        (priorities, items) = (self.priorities, self.items)
+        for i in reversed(range((len(items) - 2) // self.arity + 1)):
+            self.sift_down(i, priorities[i], items[i])
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def size(self) -> int:
+        """Get the size of the heap."""
+        return len(self.items)
+
+    def priority(self, item):
+        """The priority of item, by key if there is one."""
+        return self.key(item) if self.key else item
+
+    def peek(self):
+        """The item with the smallest priority, without removing it. Throws
+        an IndexError if the heap is empty.
+        """
+        if not self.items:
+            raise IndexError("peek from an empty heap")
+        return self.items[0]
+
+    def peek_priority(self):
+        """The smallest priority in the heap. Throws an IndexError if the
+        heap is empty.
+        """
+        if not self.items:
+            raise IndexError("peek from an empty heap")
+        return self.priorities[0]
+
+    def push(self, item, priority=None) -> None:
+        """Add an item with the given priority, or the priority given by
+        key if there is none.
+        """
+        if priority is None:
+            priority = self.priority(item)
+        self.priorities.append(priority)
+        self.items.append(item)
+        self.sift_up(len(self.items) - 1, priority, item)
+
+    def pop(self):
+        """Remove and return the item with the smallest priority. Throws an
+        IndexError if the heap is empty.
+        """
+        if not self.items:
+            raise IndexError("pop from an empty heap")
+        priority = self.priorities.pop()
+        item = self.items.pop()
+        if not self.items:
+            return item
+        top = self.items[0]
+        self.sift_down(0, priority, item)
+        return top
+
+    def pushpop(self, item, priority=None):
+        """Push item and then pop the smallest item, in one sift down, or
+        none at all if item would come straight back out.
+        """
+        if priority is None:
+            priority = self.priority(item)
+        if not self.items or not self.priorities[0] < priority:
+            return item
+        top = self.items[0]
+        self.sift_down(0, priority, item)
+        return top
+
+    def replace(self, item, priority=None):
+        """Pop the smallest item and then push item, in one sift down. Throws
+        an IndexError if the heap is empty.
+        """
+        if not self.items:
+            raise IndexError("replace on an empty heap")
+        if priority is None:
+            priority = self.priority(item)
+        top = self.items[0]
+        self.sift_down(0, priority, item)
+        return top
+
+    def sift_up(self, i: int, priority, item) -> None:
+        """Put item with the given priority at i, or above it, moving each
+        parent with a larger priority down into the hole left below it.
+        """
+        (priorities, items, arity) = (self.priorities, self.items, self.arity)
+        while i > 0:
+            parent = (i - 1) // arity
+            p = priorities[parent]
+            if not priority < p:
+                break
+            priorities[i] = p
+            items[i] = items[parent]
+            i = parent
+        priorities[i] = priority
+        items[i] = item
+
+    def sift_down(self, i: int, priority, item) -> None:
+        """Put item with the given priority at i, or below it, moving the
+        smallest child up into the hole while it is smaller than priority.
+        """
+        (priorities, items, arity) = (self.priorities, self.items, self.arity)
+        n = len(items)
+        while True:
+            first = arity * i + 1
+            if first >= n:
+                break
+            child = first
+            smallest = priorities[first]
+            for j in range(first + 1, min(first + arity, n)):
+                if priorities[j] < smallest:
+                    (child, smallest) = (j, priorities[j])
+            if not smallest < priority:
+                break
+            priorities[i] = smallest
+            items[i] = items[child]
+            i = child
+        priorities[i] = priority
+        items[i] = item
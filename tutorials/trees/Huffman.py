@@ -1,13 +1,15 @@
-from queue import PriorityQueue
+from HuffmanQueue import *
 from Tree import *
 
 def freq_table(input: str) -> dict:
     """Build a frequency table from the input string."""
     pass
 
-def htree_from_freqtable(ft: dict) -> Tree:
-    """Build a Huffman tree from a frequency table."""
-    pass
+def htree_from_freqtable(ft: dict, queue=HeapQueue) -> Tree:
+    """Build a Huffman tree from a frequency table, using one of the
+    priority queues in HuffmanQueue.
+    """
+    return build_htree(ft, queue)
 
 def build_code(t: Tree) -> dict:
     """Build a Huffman code from a Huffman tree."""
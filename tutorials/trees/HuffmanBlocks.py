@@ -0,0 +1,214 @@
+"""
+Block-wise Huffman compression across processes.
+
+The input is cut into blocks of block_size bytes which are coded
+independently, so they can be coded and decoded in parallel by a
+ProcessPoolExecutor, and any one block can be decoded without the others.
+The blocks either share one code for the whole input, counted once and
+sent once, or each have their own, which suits input whose statistics
+drift but costs a header per block.
+
+The compressed form is:
+
+    MAGIC
+    shared   1 byte, 1 if the blocks share a code
+    code     if shared, the header of HuffmanCodec for the shared code
+    blocks   each the output of encode_packed, or if shared a varint count
+             of bytes followed by the coded data
+    index    an ENTRY per block: its offset and its decoded size
+    footer   FOOTER: the offset of the index, the number of blocks and MAGIC
+
+so a reader finds the index from the end of the data. compress_file
+compresses a file without reading all of it into memory, and BlockReader
+reads any buffer, such as an mmap of a compressed file.
+"""
+
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from HuffmanCodec import *
+
+MAGIC = b'HUFB'
+
+# The default number of bytes of input in a block
+BLOCK_SIZE = 1 << 20
+
+# An entry in the index: the offset of a block and its decoded size
+ENTRY = struct.Struct('<QQ')
+
+# The end of the data: the offset of the index, the number of blocks, MAGIC
+FOOTER = struct.Struct('<QQ4s')
+
+# The shared code in a worker process, as (code, table), or None
+_shared = None
+
+def _init_worker(lengths: dict) -> None:
+    """Set up a worker process with the shared code, if there is one."""
+    global _shared
+    _shared = (canonical_code(lengths), DecodeTable(lengths)) if lengths is not None else None
+
+def _read_block(block):
+    """The bytes of a block, given either as a bytes-like object or as a
+    triple (path, offset, size) of the part of a file which holds it.
+    """
+    if not isinstance(block, tuple):
+        return block
+    (path, offset, size) = block
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        return f.read(size)
+
+def _encode_block(block) -> bytes:
+    """Code a block, read by _read_block, in a worker process."""
+    block = _read_block(block)
+    if _shared is None:
+        return encode_packed(block)
+    out = bytearray()
+    write_varint(out, len(block))
+    w = BitWriter(out)
+    encode_bytes(block, _shared[0], w)
+    return w.getvalue()
+
+def _decode(data, table: DecodeTable) -> bytes:
+    """Decode a block coded with the shared code decoded by table, or with
+    its own code if table is None.
+    """
+    if table is None:
+        return decode_packed(data)
+    (count, pos) = read_varint(data, 0)
+    return bytes(table.decode(data, count, 8 * pos))
+
+def _decode_block(data: bytes) -> bytes:
+    """Decode a block in a worker process."""
+    return _decode(data, _shared and _shared[1])
+
+def _run(lengths: dict, fn, jobs, processes: int):
+    """
+    Apply fn to each job, in a pool of processes if processes is more than
+    one, otherwise in this process, yielding the results in job order.
+    Memoryviews are copied to bytes to be sent to the pool.
+    """
+    if processes is not None and processes <= 1:
+        _init_worker(lengths)
+        try:
+            for job in jobs:
+                yield fn(job)
+        finally:
+            _init_worker(None)
+        return
+    jobs = (bytes(job) if isinstance(job, memoryview) else job for job in jobs)
+    with ProcessPoolExecutor(processes, initializer=_init_worker,
+                             initargs=(lengths,)) as pool:
+        yield from pool.map(fn, jobs)
+
+def _compress(write, ft: dict, blocks: list, sizes: list, processes: int) -> None:
+    """
+    Code blocks, which hold sizes bytes each, with one code for the
+    frequency table ft, or a code per block if ft is None, passing the
+    compressed data to write a piece at a time.
+    """
+    out = bytearray(MAGIC)
+    out.append(0 if ft is None else 1)
+    lengths = None
+    if ft is not None:
+        lengths = lengths_for(ft)
+        write_header(out, lengths, KIND_BYTES, 0)
+    write(out)
+    offset = len(out)
+    index = bytearray()
+    for (size, coded) in zip(sizes, _run(lengths, _encode_block, blocks, processes)):
+        index += ENTRY.pack(offset, size)
+        write(coded)
+        offset += len(coded)
+    write(index)
+    write(FOOTER.pack(offset, len(sizes), MAGIC))
+
+def compress_blocks(data, block_size: int = BLOCK_SIZE, shared: bool = True,
+                    processes: int = None) -> bytearray:
+    """
+    Compress a bytes-like object in blocks of block_size bytes, coding them
+    in parallel across processes worker processes (by default one per CPU),
+    with one code for all of the blocks if shared is true and a code per
+    block otherwise. The blocks are views onto data rather than copies.
+    """
+    view = memoryview(data).cast('B')
+    blocks = [view[i:i + block_size] for i in range(0, len(view), block_size)]
+    out = bytearray()
+    _compress(out.extend, frequencies(view) if shared else None,
+              blocks, [len(block) for block in blocks], processes)
+    return out
+
+def compress_file(source: str, target: str, block_size: int = BLOCK_SIZE,
+                  shared: bool = True, processes: int = None) -> None:
+    """
+    Compress the file source into the file target like compress_blocks,
+    without holding the whole of either in memory: each worker reads its
+    own block from source, and the coded blocks are written to target as
+    they come back.
+    """
+    size = os.path.getsize(source)
+    blocks = [(source, i, min(block_size, size - i)) for i in range(0, size, block_size)]
+    ft = None
+    if shared:
+        ft = {}
+        with open(source, 'rb') as f:
+            for _ in blocks:
+                for (b, n) in count_bytes(f.read(block_size)).items():
+                    ft[b] = ft.get(b, 0) + n
+    with open(target, 'wb') as out:
+        _compress(out.write, ft, blocks, [n for (_, _, n) in blocks], processes)
+
+class BlockReader:
+    """Random access to the blocks of the output of compress_blocks."""
+
+    def __init__(self, data):
+        """ Construct a new BlockReader, reading the index of data. Throws a
+        ValueError if data is not the output of compress_blocks.
+        """
+        data = memoryview(data)
+        if len(data) < len(MAGIC) + 1 + FOOTER.size or bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Not compressed blocks")
+        (index, count, magic) = FOOTER.unpack(data[-FOOTER.size:])
+        if magic != MAGIC or index + count * ENTRY.size != len(data) - FOOTER.size:
+            raise ValueError("Compressed blocks have a broken index")
+        self.data = data
+        entries = [ENTRY.unpack_from(data, index + k * ENTRY.size) for k in range(count)]
+        # the offset of each block, and of the index after the last one
+        self.offsets = [offset for (offset, _) in entries] + [index]
+        self.sizes = [size for (_, size) in entries]
+        self.lengths = None
+        self.table = None
+        if data[len(MAGIC)]:
+            (self.lengths, _, _, _) = read_header(data, len(MAGIC) + 1)
+            self.table = DecodeTable(self.lengths)
+
+    def __len__(self) -> int:
+        """The number of blocks."""
+        return len(self.sizes)
+
+    def size(self) -> int:
+        """The number of bytes of decoded data."""
+        return sum(self.sizes)
+
+    def coded(self, k: int) -> bytes:
+        """The coded bytes of block k."""
+        return bytes(self.data[self.offsets[k]:self.offsets[k + 1]])
+
+    def block(self, k: int) -> bytes:
+        """Decode block k on its own. Throws an IndexError if there is no
+        block k.
+        """
+        if not 0 <= k < len(self):
+            raise IndexError(f"No such block: {k}")
+        return _decode(self.coded(k), self.table)
+
+    def decompress(self, processes: int = None) -> bytes:
+        """Decode all of the blocks in parallel across processes worker
+        processes (by default one per CPU).
+        """
+        jobs = [self.coded(k) for k in range(len(self))]
+        return b''.join(_run(self.lengths, _decode_block, jobs, processes))
+
+def decompress_blocks(data, processes: int = None) -> bytes:
+    """Decode the output of compress_blocks."""
+    return BlockReader(data).decompress(processes)
@@ -0,0 +1,260 @@
+"""
+Huffman coding of strings and bytes into packed bytes.
+
+encode_packed writes a canonical Huffman code for the input, followed by
+the input coded with it, into a single bytes object, and decode_packed
+reads it back. The codes are written into a BitWriter, which packs them
+into a bytearray eight bits to a byte, so the coded data take their true
+size rather than a list element per bit.
+
+The code is sent as a header holding only the symbols and the lengths of
+their codes, from which canonical_code rebuilds the code:
+
+    kind      1 byte, KIND_BYTES or KIND_STR
+    symbols   varint, the number of symbols in the code
+    for each symbol in ascending order:
+      gap     varint, the symbol minus the previous one (the first symbol
+              minus 0); a str symbol is sent as its code point
+      length  1 byte, the length of its code
+    count     varint, the number of symbols in the coded data
+
+and the coded data follow, most significant bit first, with the last byte
+padded with zeros. A varint is an unsigned int in groups of 7 bits, least
+significant first, with the top bit of every byte but the last set.
+
+Bytes are counted and coded by NumPy when it is installed: np.bincount
+counts them, and they are coded a pair at a time, a block of input at a
+time. The code of each pair is looked up in a table indexed by the pair,
+the bit offset of every code is a cumulative sum of their lengths, and
+the bytes of each code, shifted to its offset, are added into the output
+bytes by np.bincount with the bytes as weights. Codes do not overlap, so
+adding them is the same as or-ing them. Without NumPy bytes are counted
+by collections.Counter, which counts in C, and coded by a BitWriter. The
+output is the same either way.
+"""
+
+from collections import Counter
+from Canonical import *
+from HuffmanQueue import *
+from LengthLimited import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The kinds of input, in the first byte of the header
+KIND_BYTES = 0
+KIND_STR = 1
+
+# The number of bytes coded at a time by encode_bytes with NumPy
+NUMPY_BLOCK = 1 << 20
+
+class BitWriter:
+    """A buffer which codes are written into bit by bit and packed into a
+    bytearray. Bits wait in an int until there are enough for several whole
+    bytes, which are then added to the bytearray together.
+    """
+
+    __slots__ = ('buffer', 'acc', 'nbits')
+
+    def __init__(self, buffer: bytearray = None):
+        """ Construct a new BitWriter, adding to buffer if it is given."""
+        self.buffer = bytearray() if buffer is None else buffer
+        self.acc = 0
+        self.nbits = 0
+
+    def write(self, bits: int, length: int) -> None:
+        """Write the low length bits of bits, most significant first."""
+        self.acc = (self.acc << length) | bits
+        self.nbits += length
+        if self.nbits >= 64:
+            self.flush_bytes()
+
+    def write_codes(self, code: dict, symbols) -> None:
+        """Write the code of every symbol in turn."""
+        (acc, nbits, buffer) = (self.acc, self.nbits, self.buffer)
+        for s in symbols:
+            (bits, length) = code[s]
+            acc = (acc << length) | bits
+            nbits += length
+            if nbits >= 64:
+                whole = nbits >> 3
+                nbits &= 7
+                buffer += (acc >> nbits).to_bytes(whole, 'big')
+                acc &= (1 << nbits) - 1
+        (self.acc, self.nbits) = (acc, nbits)
+
+    def flush_bytes(self) -> None:
+        """Move the whole bytes waiting in acc into the buffer."""
+        whole = self.nbits >> 3
+        self.nbits &= 7
+        self.buffer += (self.acc >> self.nbits).to_bytes(whole, 'big')
+        self.acc &= (1 << self.nbits) - 1
+
+    def bit_length(self) -> int:
+        """The number of bits written so far."""
+        return 8 * len(self.buffer) + self.nbits
+
+    def getvalue(self) -> bytearray:
+        """Pad the bits written with zeros to a whole byte and return the
+        buffer.
+        """
+        if self.nbits & 7:
+            self.write(0, 8 - (self.nbits & 7))
+        self.flush_bytes()
+        return self.buffer
+
+def write_varint(out: bytearray, n: int) -> None:
+    """Add the varint for n to out."""
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+def read_varint(data, pos: int) -> tuple:
+    """Read a varint from data at pos, returning it and the position after
+    it. Throws a ValueError if the data end first.
+    """
+    n = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Data ended in the middle of a varint")
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return (n, pos)
+        shift += 7
+
+def write_header(out: bytearray, lengths: dict, kind: int, count: int) -> None:
+    """Add the header for a code with the given lengths to out."""
+    out.append(kind)
+    write_varint(out, len(lengths))
+    previous = 0
+    for s in sorted(lengths):
+        n = ord(s) if kind == KIND_STR else s
+        if lengths[s] > 255:
+            raise ValueError(f"Code too long for the header: {lengths[s]}")
+        write_varint(out, n - previous)
+        out.append(lengths[s])
+        previous = n
+    write_varint(out, count)
+
+def read_header(data, pos: int = 0) -> tuple:
+    """Read a header from data at pos, returning the code lengths, the kind
+    of input, the number of coded symbols and the position of the coded
+    data.
+    """
+    if pos >= len(data) or data[pos] not in (KIND_BYTES, KIND_STR):
+        raise ValueError("Not a Huffman coded header")
+    kind = data[pos]
+    (size, pos) = read_varint(data, pos + 1)
+    lengths = {}
+    n = 0
+    for _ in range(size):
+        (gap, pos) = read_varint(data, pos)
+        n += gap
+        if pos >= len(data):
+            raise ValueError("Data ended in the middle of the header")
+        lengths[chr(n) if kind == KIND_STR else n] = data[pos]
+        pos += 1
+    (count, pos) = read_varint(data, pos)
+    return (lengths, kind, count, pos)
+
+def count_bytes(data) -> dict:
+    """The number of times each byte value appears in a bytes-like object,
+    for the values which do appear, in ascending order.
+    """
+    if np is not None:
+        counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+        return {int(b): int(counts[b]) for b in np.flatnonzero(counts)}
+    counts = Counter(memoryview(data).cast('B'))
+    return {b: counts[b] for b in sorted(counts)}
+
+def frequencies(input) -> dict:
+    """The number of times each symbol appears in input."""
+    if isinstance(input, (bytes, bytearray, memoryview)):
+        return count_bytes(input)
+    return dict(Counter(input))
+
+def lengths_for(ft: dict, max_length: int = None) -> dict:
+    """The code lengths of a Huffman code for the frequency table ft, or of
+    the best code with no code longer than max_length if it is given. The
+    symbols are put in order first, so the code does not depend on the
+    order of ft.
+    """
+    ft = dict(sorted(ft.items()))
+    if max_length is not None:
+        return limited_lengths(ft, max_length)
+    return code_lengths(build_htree(ft))
+
+def encode_bytes(data, code: dict, w: BitWriter) -> None:
+    """Write the codes of the bytes in data to w."""
+    longest = max((length for (_, length) in code.values()), default=0)
+    if np is None or len(data) < 2 or longest > 28:
+        w.write_codes(code, data if isinstance(data, bytes) else bytes(data))
+        return
+    codes = np.zeros(256, dtype=np.uint64)
+    lengths = np.zeros(256, dtype=np.int64)
+    for (b, (bits, length)) in code.items():
+        codes[b] = bits
+        lengths[b] = length
+    # code pairs of bytes, read as big-endian 16 bit ints, at once: the
+    # code of a pair is the code of its first byte followed by the second
+    pair_codes = ((codes[:, None] << lengths[None, :].astype(np.uint64)) | codes[None, :]).ravel()
+    pair_lengths = (lengths[:, None] + lengths[None, :]).ravel()
+    # the number of output bytes a pair can touch, from any bit of a byte
+    spread = (2 * longest + 14) // 8
+    pairs = np.frombuffer(data, dtype='>u2', count=len(data) // 2)
+    for first in range(0, len(pairs), NUMPY_BLOCK):
+        block = pairs[first:first + NUMPY_BLOCK]
+        l = pair_lengths[block]
+        # carry on from the bits the writer holds, less than a byte of them
+        w.flush_bytes()
+        ends = np.cumsum(l) + w.nbits
+        starts = ends - l
+        # each code shifted to where it sits in the 8 bytes from its first
+        v = pair_codes[block] << (64 - ends + (starts & ~7)).astype(np.uint64)
+        index = starts >> 3
+        total = int(ends[-1])
+        size = (total + 7) >> 3
+        # bincount sums weights as float64, which is exact here: each output
+        # byte is the sum of at most 8 weights of at most 255, which have no
+        # bits in common, so every sum is an int no bigger than 255
+        out = np.zeros(size + spread, dtype=np.float64)
+        out[0] = w.acc << (8 - w.nbits)
+        # the codes do not overlap, so adding their bytes is or-ing them
+        for k in range(spread):
+            byte = (v >> np.uint64(56 - 8 * k)) & np.uint64(0xFF)
+            out += np.bincount(index + k, weights=byte, minlength=size + spread)
+        packed = out[:size].astype(np.uint8)
+        w.buffer += packed[:total >> 3].tobytes()
+        w.nbits = total & 7
+        w.acc = int(packed[-1]) >> (8 - w.nbits) if w.nbits else 0
+    if len(data) % 2:
+        w.write(*code[data[-1]])
+
+def encode_packed(input, max_length: int = None) -> bytes:
+    """Huffman code a str or bytes object with a header and packed data,
+    with no code longer than max_length if it is given.
+    """
+    kind = KIND_STR if isinstance(input, str) else KIND_BYTES
+    lengths = lengths_for(frequencies(input), max_length)
+    out = bytearray()
+    write_header(out, lengths, kind, len(input))
+    w = BitWriter(out)
+    if kind == KIND_BYTES:
+        encode_bytes(input, canonical_code(lengths), w)
+    else:
+        w.write_codes(canonical_code(lengths), input)
+    return bytes(w.getvalue())
+
+def decode_packed(data):
+    """Decode the output of encode_packed, which may be any bytes-like
+    object, back to the str or bytes it came from.
+    """
+    (lengths, kind, count, pos) = read_header(data)
+    symbols = DecodeTable(lengths).decode(data, count, 8 * pos) if count else []
+    return ''.join(symbols) if kind == KIND_STR else bytes(symbols)
@@ -0,0 +1,151 @@
+"""
+Priority queues of Huffman trees, for building a Huffman tree from a
+frequency table without the locking done by queue.PriorityQueue, which is
+only needed when several threads share a queue.
+
+The nodes of a Huffman tree are Trees whose values are pairs: (char, freq)
+in a leaf and (None, freq) in a branch, where freq is the total frequency
+of the leaves below. Every queue is made from a list of leaves and has
+push, pop (which returns the tree with the smallest frequency) and len:
+
++ HeapQueue: heapq on a list, with a counter to break ties
++ DaryQueue: a 4-ary DaryHeap, with the frequencies cached
++ LockedQueue: queue.PriorityQueue, for comparison
++ TwoQueues: the linear time method for leaves sorted by frequency, which
+  needs no heap at all
+
+The project's MinHeap is not a backend, as its methods are left as an
+exercise.
+"""
+
+import heapq
+from collections import deque
+from itertools import count
+from queue import PriorityQueue
+from DaryHeap import *
+from Tree import *
+
+def frequency(t: Tree) -> int:
+    """The frequency of a Huffman tree, for a leaf or a branch."""
+    return t.value[1]
+
+class HeapQueue:
+    """A queue of Huffman trees kept as a binary heap by heapq. Entries are
+    (freq, n, tree) triples, where n counts the pushes, so trees with equal
+    frequencies come out in the order they went in and are never compared.
+    """
+
+    def __init__(self, trees: list) -> None:
+        self.counter = count()
+        self.heap = [(frequency(t), next(self.counter), t) for t in trees]
+        heapq.heapify(self.heap)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, t: Tree) -> None:
+        heapq.heappush(self.heap, (frequency(t), next(self.counter), t))
+
+    def pop(self) -> Tree:
+        return heapq.heappop(self.heap)[2]
+
+class DaryQueue:
+    """A queue of Huffman trees kept in a DaryHeap, which caches each tree's
+    frequency alongside it.
+    """
+
+    def __init__(self, trees: list, arity: int = 4) -> None:
+        self.heap = DaryHeap.from_iterable(trees, arity, frequency)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, t: Tree) -> None:
+        self.heap.push(t, frequency(t))
+
+    def pop(self) -> Tree:
+        return self.heap.pop()
+
+class LockedQueue:
+    """A queue of Huffman trees kept in a queue.PriorityQueue, which takes
+    a lock for every put and get.
+    """
+
+    def __init__(self, trees: list) -> None:
+        self.counter = count()
+        self.queue = PriorityQueue()
+        for t in trees:
+            self.push(t)
+
+    def __len__(self) -> int:
+        return self.queue.qsize()
+
+    def push(self, t: Tree) -> None:
+        self.queue.put((frequency(t), next(self.counter), t))
+
+    def pop(self) -> Tree:
+        return self.queue.get()[2]
+
+class TwoQueues:
+    """A queue of Huffman trees made from leaves sorted by frequency. The
+    leaves wait in one FIFO queue and the branches in another. Each branch
+    is made from the two smallest trees, so branches are made in order of
+    frequency and both queues stay sorted: the smallest tree is always at
+    the front of one of them, and push and pop are O(1).
+    """
+
+    sorted_input = True
+
+    def __init__(self, trees: list) -> None:
+        """ Construct a new TwoQueues. Throws a ValueError if the trees are
+        not sorted by frequency.
+        """
+        if any(frequency(a) > frequency(b) for (a, b) in zip(trees, trees[1:])):
+            raise ValueError("TwoQueues needs trees sorted by frequency")
+        self.leaves = deque(trees)
+        self.branches = deque()
+
+    def __len__(self) -> int:
+        return len(self.leaves) + len(self.branches)
+
+    def push(self, t: Tree) -> None:
+        """Add a tree, which must be no smaller than any pushed before."""
+        self.branches.append(t)
+
+    def pop(self) -> Tree:
+        if not self.branches or \
+           (self.leaves and frequency(self.leaves[0]) <= frequency(self.branches[0])):
+            return self.leaves.popleft()
+        return self.branches.popleft()
+
+# All of the queues, by name
+QUEUES = {
+    'heapq': HeapQueue,
+    'dary': DaryQueue,
+    'locked': LockedQueue,
+    'two_queues': TwoQueues,
+}
+
+def build_htree(ft: dict, queue=HeapQueue) -> Tree:
+    """Build a Huffman tree from a frequency table, using the given queue
+    class (or its name in QUEUES), or return None if the table is empty.
+    The leaves are sorted by frequency first for a queue which needs it.
+    """
+    if isinstance(queue, str):
+        queue = QUEUES[queue]
+    leaves = [Tree((c, f), None, None) for (c, f) in ft.items()]
+    if getattr(queue, 'sorted_input', False):
+        leaves.sort(key=frequency)
+    return build_from_queue(queue(leaves))
+
+def build_from_queue(q) -> Tree:
+    """Build a Huffman tree from a queue of trees by joining the two
+    smallest trees until only one is left. Returns None if q is empty.
+    """
+    if not len(q):
+        return None
+    while len(q) > 1:
+        a = q.pop()
+        b = q.pop()
+        q.push(Tree((None, frequency(a) + frequency(b)), a, b))
+    return q.pop()
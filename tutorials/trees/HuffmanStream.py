@@ -0,0 +1,195 @@
+"""
+Streaming Huffman coding of files too big to hold in memory.
+
+Compressing takes two passes over the input, which is read in chunks. The
+first counts the frequency of every byte, either over the whole input or
+over a prefix of it (in which case every byte value is given one extra
+count, so bytes which are not in the prefix still get a code). The second
+codes the input chunk by chunk with the canonical code for those
+frequencies. Only one chunk and its coded frame are in memory at a time,
+so the memory used does not grow with the size of the input.
+
+A .huf stream is MAGIC, then the header of HuffmanCodec (with a count of
+0, as the frames carry the counts), then a frame per chunk:
+
+    count    varint, the number of bytes coded in the frame
+    size     varint, the number of bytes of coded data
+    data     the coded bytes, padded with zeros to a whole byte
+
+and a frame with a count of 0 to end the stream. Decoding reads a
+generator of chunks of the stream and yields the decoded chunks.
+
+    $ python3 HuffmanStream.py compress big.log big.log.huf [--sample BYTES]
+                                           [--max-length BITS]
+    $ python3 HuffmanStream.py decompress big.log.huf big.log
+"""
+
+import argparse
+import sys
+from HuffmanCodec import *
+
+MAGIC = b'HUF1'
+
+# The default number of bytes in a chunk of input
+CHUNK_SIZE = 1 << 20
+
+def read_chunks(f, size: int = CHUNK_SIZE):
+    """Read a binary file in chunks of up to size bytes."""
+    while True:
+        chunk = f.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+def count_frequencies(chunks, sample: int = None) -> dict:
+    """
+    The frequency of every byte in an iterable of chunks. If sample is
+    given, only about the first sample bytes are counted, and every byte
+    value gets one more count than it had, so that all of them have codes.
+    """
+    ft = {}
+    seen = 0
+    for chunk in chunks:
+        for (b, n) in count_bytes(chunk).items():
+            ft[b] = ft.get(b, 0) + n
+        seen += len(chunk)
+        if sample is not None and seen >= sample:
+            break
+    if sample is not None:
+        ft = {b: ft.get(b, 0) + 1 for b in range(256)}
+    return ft
+
+def encode_stream(chunks, ft: dict, max_length: int = None):
+    """Code an iterable of chunks of bytes with the canonical code for the
+    frequency table ft (with codes no longer than max_length, if it is
+    given), yielding the .huf stream a piece at a time. Throws a KeyError
+    if a chunk has a byte which has no code.
+    """
+    lengths = lengths_for(ft, max_length)
+    code = canonical_code(lengths)
+    out = bytearray(MAGIC)
+    write_header(out, lengths, KIND_BYTES, 0)
+    yield bytes(out)
+    for chunk in chunks:
+        if not chunk:
+            continue
+        w = BitWriter()
+        encode_bytes(chunk, code, w)
+        data = w.getvalue()
+        out = bytearray()
+        write_varint(out, len(chunk))
+        write_varint(out, len(data))
+        yield bytes(out)
+        yield bytes(data)
+    yield b'\x00'
+
+class ChunkReader:
+    """Reads bytes and varints from an iterable of chunks, keeping only the
+    bytes not yet read.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.buffer = bytearray()
+        self.pos = 0
+
+    def fill(self, n: int) -> None:
+        """Make sure at least n bytes are waiting to be read. Throws a
+        ValueError if the chunks run out first.
+        """
+        while len(self.buffer) - self.pos < n:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                raise ValueError("Stream ended early")
+            del self.buffer[:self.pos]
+            self.pos = 0
+            self.buffer += chunk
+
+    def read(self, n: int) -> bytes:
+        """Read exactly n bytes."""
+        self.fill(n)
+        data = bytes(self.buffer[self.pos:self.pos + n])
+        self.pos += n
+        return data
+
+    def parse(self, fn) -> tuple:
+        """
+        Apply fn, which reads from a buffer at a position and returns a tuple
+        whose last item is the position after what it read, to the bytes
+        waiting to be read, with more of them each time fn finds too few.
+        Returns the rest of the tuple.
+        """
+        while True:
+            try:
+                result = fn(self.buffer, self.pos)
+            except ValueError:
+                self.fill(len(self.buffer) - self.pos + 1)
+                continue
+            self.pos = result[-1]
+            return result[:-1]
+
+    def read_varint(self) -> int:
+        """Read a varint."""
+        return self.parse(read_varint)[0]
+
+    def read_header(self) -> dict:
+        """Read the MAGIC and the header of a stream, returning the code
+        lengths.
+        """
+        if self.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not a .huf stream")
+        self.fill(1)
+        if self.buffer[self.pos] != KIND_BYTES:
+            raise ValueError("Not a .huf stream of bytes")
+        return self.parse(read_header)[0]
+
+def decode_stream(chunks):
+    """Decode a .huf stream, given as an iterable of chunks of bytes,
+    yielding the decoded bytes a frame at a time.
+    """
+    reader = ChunkReader(chunks)
+    table = DecodeTable(reader.read_header())
+    while True:
+        count = reader.read_varint()
+        if count == 0:
+            return
+        data = reader.read(reader.read_varint())
+        yield bytes(table.decode(data, count))
+
+def compress_file(source: str, target: str, chunk_size: int = CHUNK_SIZE,
+                  sample: int = None, max_length: int = None) -> None:
+    """Compress the file source into the .huf file target."""
+    with open(source, 'rb') as f:
+        ft = count_frequencies(read_chunks(f, chunk_size), sample)
+    with open(source, 'rb') as f, open(target, 'wb') as out:
+        for piece in encode_stream(read_chunks(f, chunk_size), ft, max_length):
+            out.write(piece)
+
+def decompress_file(source: str, target: str, chunk_size: int = CHUNK_SIZE) -> None:
+    """Decompress the .huf file source into the file target."""
+    with open(source, 'rb') as f, open(target, 'wb') as out:
+        for chunk in decode_stream(read_chunks(f, chunk_size)):
+            out.write(chunk)
+
+def main(argv: list) -> None:
+    parser = argparse.ArgumentParser(description="Huffman (de)compress files as .huf streams.")
+    parser.add_argument('command', choices=['compress', 'decompress'])
+    parser.add_argument('source')
+    parser.add_argument('target')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help=f"bytes per chunk (default: {CHUNK_SIZE})")
+    parser.add_argument('--sample', type=int,
+                        help="count frequencies over only this many bytes of the input")
+    parser.add_argument('--max-length', type=int,
+                        help="the longest code allowed, in bits (8 or more)")
+    args = parser.parse_args(argv)
+    if args.max_length is not None and args.max_length < 8:
+        parser.error("--max-length must be at least 8, to give every byte a code")
+    if args.command == 'compress':
+        compress_file(args.source, args.target, args.chunk_size, args.sample,
+                      args.max_length)
+    else:
+        decompress_file(args.source, args.target, args.chunk_size)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
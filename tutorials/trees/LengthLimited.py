@@ -0,0 +1,103 @@
+"""
+Huffman codes whose codes are no longer than a given length.
+
+A Huffman tree for skewed frequencies (Fibonacci numbers are the worst
+case) can be as deep as there are symbols, which makes codes longer than
+a machine word, and a DecodeTable for them needs subtables under
+subtables to decode the longest ones. limited_lengths
+finds the code lengths which cost the fewest bits among all prefix codes
+with no code longer than max_length, by the package-merge algorithm
+(Larmore and Hirschberg, 1990), in O(n * max_length) time. The lengths can
+be used with canonical_code and DecodeTable like those of any code.
+
+length_limit_report says how much compression a limit costs compared with
+the unlimited Huffman code, and how big the decode tables are for each.
+Run as a script, it reports on the bytes of a file for several limits:
+
+    $ python3 LengthLimited.py FILE [MAX_LENGTH ...]
+"""
+
+import heapq
+import sys
+from collections import Counter
+from Canonical import *
+from HuffmanQueue import *
+
+def limited_lengths(ft: dict, max_length: int) -> dict:
+    """
+    The code lengths of an optimal prefix code for the frequency table ft
+    in which no code is longer than max_length. Throws a ValueError if
+    there are more symbols than codes of that length (2**max_length).
+
+    Each symbol starts as a coin whose width is its frequency. Coins are
+    paired off in order, cheapest first, into packages, which are merged
+    back in with the coins, max_length - 1 times over. The cheapest
+    2n - 2 items of the last list make the code: the length of a symbol's
+    code is the number of times its coin appears in them.
+    """
+    symbols = sorted(ft, key=lambda s: ft[s])
+    n = len(symbols)
+    if n <= 1:
+        return {s: 1 for s in symbols}
+    if max_length < 1 or n > 1 << max_length:
+        raise ValueError(f"{n} symbols need codes longer than {max_length}")
+    # an item is (width, node): a node is a coin, the index of a symbol, or
+    # a package, the pair of items it was made from
+    coins = [(ft[s], k) for (k, s) in enumerate(symbols)]
+    items = coins
+    for _ in range(max_length - 1):
+        packages = [(items[i][0] + items[i + 1][0], (items[i][1], items[i + 1][1]))
+                    for i in range(0, len(items) - 1, 2)]
+        items = list(heapq.merge(coins, packages, key=lambda item: item[0]))
+    counts = [0] * n
+    stack = [node for (_, node) in items[:2 * n - 2]]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, int):
+            counts[node] += 1
+        else:
+            stack.extend(node)
+    return {s: counts[k] for (k, s) in enumerate(symbols)}
+
+def coded_bits(ft: dict, lengths: dict) -> int:
+    """The number of bits needed to code symbols with frequencies ft with
+    codes of the given lengths.
+    """
+    return sum(f * lengths[s] for (s, f) in ft.items())
+
+def length_limit_report(ft: dict, max_length: int) -> dict:
+    """
+    Compare the code with no code longer than max_length with the Huffman
+    code for ft. Gives the longest code, the total bits, the bits per symbol
+    and the decode table entries for each, and the loss: the fraction by
+    which the limited code is bigger than the Huffman one.
+    """
+    optimal = code_lengths(build_htree(ft))
+    limited = limited_lengths(ft, max_length)
+    count = sum(ft.values())
+    report = {'symbols': len(ft), 'count': count, 'max_length': max_length}
+    for (name, lengths) in (('optimal', optimal), ('limited', limited)):
+        bits = coded_bits(ft, lengths)
+        report[name] = {
+            'longest': max(lengths.values(), default=0),
+            'bits': bits,
+            'bits_per_symbol': bits / count if count else 0.0,
+            'table_entries': table_entries(lengths),
+        }
+    (o, l) = (report['optimal']['bits'], report['limited']['bits'])
+    report['loss'] = (l - o) / o if o else 0.0
+    return report
+
+def main(argv: list) -> None:
+    with open(argv[0], 'rb') as f:
+        ft = dict(Counter(f.read()))
+    reports = [length_limit_report(ft, m) for m in [int(a) for a in argv[1:]] or [8, 10, 12, 16]]
+    print(f"{'limit':>6} {'longest':>8} {'bits/byte':>10} {'loss':>8} {'table entries':>14}")
+    rows = [('none', reports[0]['optimal'], 0.0)] + \
+        [(r['max_length'], r['limited'], r['loss']) for r in reports]
+    for (limit, row, loss) in rows:
+        print(f"{limit:>6} {row['longest']:>8} {row['bits_per_symbol']:>10.4f}"
+              f" {loss:>7.3%} {row['table_entries']:>14}")
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
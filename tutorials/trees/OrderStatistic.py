@@ -0,0 +1,86 @@
+from AVL import *
+
+def node_size(t: 'OrderStatistic') -> int:
+    """The number of items in an order-statistic tree, which is 0 for the
+    empty tree.
+    """
+    return t.size if t else 0
+
+class OrderStatistic(AVL):
+    """An AVL tree in which each node also caches the number of items in
+    its subtree. The sizes are kept up to date by update, like the heights,
+    so insert and remove stay O(log n), and they let the tree answer
+    questions about positions in sorted order in O(log n) time: the rank of
+    an item, the item at a given rank and the number of items in a range.
+    """
+
+    __slots__ = ('size',)
+
+    def update(self) -> None:
+        """Recompute the height and size of this node from its children."""
+        super().update()
+        self.size = 1 + node_size(self.left) + node_size(self.right)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def rank(self, item) -> int:
+        """The number of items in the tree smaller than item, whether or not
+        item is in the tree.
+        """
+        r = 0
+        t = self
+        while t:
+            if item <= t.value:
+                t = t.left
+            else:
+                r += node_size(t.left) + 1
+                t = t.right
+        return r
+
+    def select(self, k: int):
+        """The item of rank k, ie the k-th smallest item counting from 0.
+        Throws an IndexError if k is not in the range 0 to size - 1.
+        """
+        if not 0 <= k < self.size:
+            raise IndexError(f"Rank out of range: {k}")
+        t = self
+        while True:
+            left = node_size(t.left)
+            if k < left:
+                t = t.left
+            elif k == left:
+                return t.value
+            else:
+                k -= left + 1
+                t = t.right
+
+    def count_range(self, lo, hi) -> int:
+        """The number of items x in the tree with lo <= x < hi."""
+        if hi <= lo:
+            return 0
+        return self.rank(hi) - self.rank(lo)
+
+    def range(self, lo, hi):
+        """Iterate in order over the items x in the tree with lo <= x < hi.
+        The stack starts as the path down to lo, skipping every subtree
+        which is wholly below it, so this takes O(log n + k) time for k
+        items.
+        """
+        stack = []
+        t = self
+        while t:
+            if t.value < lo:
+                t = t.right
+            else:
+                stack.append(t)
+                t = t.left
+        while stack:
+            t = stack.pop()
+            if not t.value < hi:
+                return
+            yield t.value
+            t = t.right
+            while t:
+                stack.append(t)
+                t = t.left
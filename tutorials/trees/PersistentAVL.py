@@ -0,0 +1,38 @@
+from AVL import *
+
+class PersistentAVL(AVL):
+    """A persistent AVL tree: insert and remove never change a node, but
+    return the root of a new version of the tree that shares every subtree
+    the change did not touch with the old one. Only the nodes on the path
+    from the root to the change (and those moved by rotations on the way
+    back up) are copied, so an update makes O(log n) new nodes, and every
+    old root stays a valid tree which can be read or iterated over while
+    newer versions are being made, without locks.
+
+    This works because AVL makes every change to the shape of the tree
+    through relink, which here makes a new node instead of changing this
+    one.
+    """
+
+    __slots__ = ()
+
+    def relink(self, left: 'PersistentAVL', right: 'PersistentAVL',
+               value=None) -> 'PersistentAVL':
+        """Make a copy of this node with new children (and optionally a new
+        value), leaving this one unchanged.
+        """
+        if left is self.left and right is self.right and value is None:
+            return self
+        return type(self)(self.value if value is None else value, left, right)
+
+    def snapshot(self) -> 'PersistentAVL':
+        """A version of the tree which later updates will not change. As no
+        version is ever changed, this is the tree itself and costs O(1).
+        """
+        return self
+
+    def copy(self) -> 'PersistentAVL':
+        """A copy of the tree, which, as the tree cannot change, is the tree
+        itself.
+        """
+        return self
@@ -0,0 +1,316 @@
+import sys
+from array import array
+from BST import *
+
+# The index of the empty tree in a NodePool
+NIL = -1
+
+class NodePool:
+    """Struct-of-arrays storage for the nodes of binary trees. Node i has its
+    value in values[i] and the indices of its children in lefts[i] and
+    rights[i], with NIL for an empty subtree, so a node costs 8 bytes for
+    its children and one slot of values instead of a Python object.
+
+    values is a list by default. Given an array typecode such as 'q' or 'd'
+    it is an array of that type instead, which stores numbers unboxed.
+    Released nodes are kept on a free list threaded through lefts and are
+    reused by new.
+    """
+
+    __slots__ = ('values', 'lefts', 'rights', 'free', 'size')
+
+    def __init__(self, typecode: str = None):
+        """ Construct a new, empty NodePool."""
+        self.values = array(typecode) if typecode else []
+        self.lefts = array('i')
+        self.rights = array('i')
+        self.free = NIL
+        self.size = 0
+
+    def new(self, value, left: int = NIL, right: int = NIL) -> int:
+        """Store a new node and return its index."""
+        self.size += 1
+        i = self.free
+        if i == NIL:
+            self.values.append(value)
+            self.lefts.append(left)
+            self.rights.append(right)
+            return len(self.lefts) - 1
+        self.free = self.lefts[i]
+        self.values[i] = value
+        self.lefts[i] = left
+        self.rights[i] = right
+        return i
+
+    def release(self, i: int) -> None:
+        """Put node i on the free list, to be reused by new."""
+        self.size -= 1
+        if isinstance(self.values, list):
+            self.values[i] = None
+        self.lefts[i] = self.free
+        self.rights[i] = NIL
+        self.free = i
+
+    def __len__(self) -> int:
+        """The number of nodes in use."""
+        return self.size
+
+    def nbytes(self) -> int:
+        """The number of bytes in the buffers of the pool, not counting the
+        objects a list of values refers to.
+        """
+        values = self.values
+        if isinstance(values, list):
+            values = sys.getsizeof(values)
+        else:
+            values = values.itemsize * values.buffer_info()[1]
+        return values + 4 * (self.lefts.buffer_info()[1] + self.rights.buffer_info()[1])
+
+class PooledTree:
+    """A binary tree whose nodes live in a NodePool. A PooledTree is just a
+    handle holding the pool and the index of a node: value, left and right
+    read and write the pool's arrays. Handles are made as they are needed,
+    so two handles to the same node are equal but need not be the same
+    object.
+
+    A handle does not subclass Tree, whose slots for value, left and right
+    it would carry unused, but borrows the methods of Tree which only read
+    value, left and right, so it has the same traversals.
+    """
+
+    __slots__ = ('pool', 'index')
+
+    height = Tree.height
+    leaves = Tree.leaves
+    iter_pre_order = Tree.iter_pre_order
+    iter_depths = Tree.iter_depths
+    iter_level_order = Tree.iter_level_order
+    maybe_children = Tree.maybe_children
+    children = Tree.children
+    __lt__ = Tree.__lt__
+    __str__ = Tree.__str__
+
+    def __init__(self, value, left: 'PooledTree' = None, right: 'PooledTree' = None,
+                 pool: NodePool = None):
+        """ Construct a new PooledTree in pool, or in the pool of its
+        children, or in a new pool if it has none.
+        """
+        if pool is None:
+            pool = left.pool if left else right.pool if right else NodePool()
+        self.pool = pool
+        self.index = pool.new(value, self.index_of(left), self.index_of(right))
+
+    @classmethod
+    def at(cls, pool: NodePool, i: int) -> 'PooledTree':
+        """A handle to node i of pool, or None if i is NIL."""
+        if i == NIL:
+            return None
+        t = cls.__new__(cls)
+        t.pool = pool
+        t.index = i
+        return t
+
+    def index_of(self, t: 'PooledTree') -> int:
+        """The index of t, which must be None or in the same pool as this."""
+        if t is None:
+            return NIL
+        if t.pool is not self.pool:
+            raise ValueError("Subtree is in a different NodePool")
+        return t.index
+
+    @property
+    def value(self):
+        return self.pool.values[self.index]
+
+    @value.setter
+    def value(self, value) -> None:
+        self.pool.values[self.index] = value
+
+    @property
+    def left(self) -> 'PooledTree':
+        return self.at(self.pool, self.pool.lefts[self.index])
+
+    @left.setter
+    def left(self, t: 'PooledTree') -> None:
+        self.pool.lefts[self.index] = self.index_of(t)
+
+    @property
+    def right(self) -> 'PooledTree':
+        return self.at(self.pool, self.pool.rights[self.index])
+
+    @right.setter
+    def right(self, t: 'PooledTree') -> None:
+        self.pool.rights[self.index] = self.index_of(t)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, PooledTree) and \
+            self.pool is other.pool and self.index == other.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.pool), self.index))
+
+    def is_leaf(self) -> bool:
+        i = self.index
+        return self.pool.lefts[i] == NIL and self.pool.rights[i] == NIL
+
+    def iter_indices(self):
+        """Iterate over the indices of the nodes in order, reading the
+        arrays directly rather than making a handle per node.
+        """
+        (lefts, rights) = (self.pool.lefts, self.pool.rights)
+        stack = []
+        i = self.index
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = lefts[i]
+            i = stack.pop()
+            yield i
+            i = rights[i]
+
+    def iter_post_indices(self):
+        """Iterate over the indices of the nodes in post-order. Handles are
+        not unique, so this compares indices where Tree compares nodes.
+        """
+        (lefts, rights) = (self.pool.lefts, self.pool.rights)
+        stack = []
+        last = NIL
+        i = self.index
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = lefts[i]
+            i = stack[-1]
+            if rights[i] != NIL and rights[i] != last:
+                i = rights[i]
+            else:
+                last = stack.pop()
+                yield last
+                i = NIL
+
+    def iter_in_order(self):
+        pool = self.pool
+        for i in self.iter_indices():
+            yield self.at(pool, i)
+
+    def iter_post_order(self):
+        pool = self.pool
+        for i in self.iter_post_indices():
+            yield self.at(pool, i)
+
+    def to_list(self) -> list:
+        """An in-order traversal."""
+        values = self.pool.values
+        return [values[i] for i in self.iter_indices()]
+
+    def count_nodes(self) -> int:
+        """Count the nodes in the Tree."""
+        return sum(1 for _ in self.iter_indices())
+
+    def copy(self) -> 'PooledTree':
+        """Make a deep copy of the Tree in a new, compact pool of the same
+        kind.
+        """
+        (values, lefts, rights) = (self.pool.values, self.pool.lefts, self.pool.rights)
+        pool = NodePool(None if isinstance(values, list) else values.typecode)
+        # the indices in the new pool of the subtrees still to be linked
+        copies = []
+        for i in self.iter_post_indices():
+            right = copies.pop() if rights[i] != NIL else NIL
+            left = copies.pop() if lefts[i] != NIL else NIL
+            copies.append(pool.new(values[i], left, right))
+        return self.at(pool, copies.pop())
+
+class PooledBST(PooledTree):
+    """A BST whose nodes live in a NodePool. insert and remove work on the
+    arrays in place, without recursion, and return the new root (None when
+    the last item is removed), as with the other BSTs. They do not
+    rebalance, so build the tree with from_sorted or bulk_build where you
+    can.
+    """
+
+    __slots__ = ()
+
+    def search(self, item) -> bool:
+        """Search the BST for an item."""
+        (values, lefts, rights) = (self.pool.values, self.pool.lefts, self.pool.rights)
+        i = self.index
+        while i != NIL:
+            v = values[i]
+            if item == v:
+                return True
+            i = lefts[i] if item < v else rights[i]
+        return False
+
+    def insert(self, item) -> 'PooledBST':
+        """Insert a new item to the BST, returning the root."""
+        pool = self.pool
+        (values, lefts, rights) = (pool.values, pool.lefts, pool.rights)
+        i = self.index
+        while True:
+            v = values[i]
+            if item == v:
+                return self
+            children = lefts if item < v else rights
+            if children[i] == NIL:
+                children[i] = pool.new(item)
+                return self
+            i = children[i]
+
+    def remove(self, item) -> 'PooledBST':
+        """Remove an item from the BST, returning the new root, or None if
+        the BST is now empty. Removing an item which is not in the BST
+        returns it unchanged.
+        """
+        pool = self.pool
+        (values, lefts, rights) = (pool.values, pool.lefts, pool.rights)
+        (parent, i) = (NIL, self.index)
+        while i != NIL and values[i] != item:
+            (parent, i) = (i, lefts[i] if item < values[i] else rights[i])
+        if i == NIL:
+            return self
+        if lefts[i] != NIL and rights[i] != NIL:
+            # move the successor's value here and remove the successor instead
+            (parent, j) = (i, rights[i])
+            while lefts[j] != NIL:
+                (parent, j) = (j, lefts[j])
+            values[i] = values[j]
+            i = j
+        child = lefts[i] if lefts[i] != NIL else rights[i]
+        pool.release(i)
+        if parent == NIL:
+            return self.at(pool, child)
+        if lefts[parent] == i:
+            lefts[parent] = child
+        else:
+            rights[parent] = child
+        return self
+
+    @classmethod
+    def from_sorted(cls, items: list, pool: NodePool = None) -> 'PooledBST':
+        """Build a perfectly balanced BST in pool (or a new pool) from a list
+        of distinct items in ascending order, or None if the list is empty.
+        """
+        if pool is None:
+            pool = NodePool()
+        def build(lo: int, hi: int) -> int:
+            if lo >= hi:
+                return NIL
+            mid = (lo + hi) // 2
+            return pool.new(items[mid], build(lo, mid), build(mid + 1, hi))
+        return cls.at(pool, build(0, len(items)))
+
+    @classmethod
+    def bulk_build(cls, ns, pool: NodePool = None) -> 'PooledBST':
+        """Build a balanced BST in pool (or a new pool) from a collection,
+        as BST.bulk_build does.
+        """
+        return cls.from_sorted(sorted(set(ns)), pool)
+
+    @classmethod
+    def bulk_merge(cls, t1: 'PooledBST', t2: 'PooledBST',
+                   pool: NodePool = None) -> 'PooledBST':
+        """Merge two BSTs (either may be None) into a new balanced BST in pool
+        (or a new pool), as BST.bulk_merge does.
+        """
+        return cls.from_sorted(list(merge_sorted(in_order(t1), in_order(t2))), pool)
@@ -0,0 +1,192 @@
+from BST import *
+
+def is_red(t: 'RedBlack') -> bool:
+    """Is t a red node? The empty tree counts as black."""
+    return t is not None and t.red
+
+class RedBlack(BST):
+    """A left-leaning red-black tree (Sedgewick, 2008): a BST in which every
+    node is red or black, no path has two red nodes in a row, red nodes are
+    always left children and every path from the root to an empty subtree
+    passes through the same number of black nodes. The longest path is then
+    at most twice the shortest, so the height is O(log n) and so are insert,
+    remove and search.
+
+    insert and remove must be called on the root of the tree and return the
+    new root.
+    """
+
+    __slots__ = ('red',)
+
+    def __init__(self, value, left: 'RedBlack' = None, right: 'RedBlack' = None,
+                 red: bool = False):
+        """ Construct a new red-black tree."""
+        super().__init__(value, left, right)
+        self.red = red
+
+    def rotate_left(self) -> 'RedBlack':
+        """Turn a right-leaning red link into a left-leaning one."""
+        x = self.right
+        self.right = x.left
+        x.left = self
+        x.red = self.red
+        self.red = True
+        return x
+
+    def rotate_right(self) -> 'RedBlack':
+        """Turn a left-leaning red link into a right-leaning one."""
+        x = self.left
+        self.left = x.right
+        x.right = self
+        x.red = self.red
+        self.red = True
+        return x
+
+    def flip_colours(self) -> None:
+        """Flip the colours of this node and its two children."""
+        self.red = not self.red
+        self.left.red = not self.left.red
+        self.right.red = not self.right.red
+
+    def fix_up(self) -> 'RedBlack':
+        """Restore the red-black properties on the way back up the tree."""
+        t = self
+        if is_red(t.right) and not is_red(t.left):
+            t = t.rotate_left()
+        if is_red(t.left) and is_red(t.left.left):
+            t = t.rotate_right()
+        if is_red(t.left) and is_red(t.right):
+            t.flip_colours()
+        return t
+
+    def move_red_left(self) -> 'RedBlack':
+        """Make the left child or one of its children red, so that a node
+        can be removed from the left subtree.
+        """
+        self.flip_colours()
+        t = self
+        if is_red(self.right.left):
+            self.right = self.right.rotate_right()
+            t = self.rotate_left()
+            t.flip_colours()
+        return t
+
+    def move_red_right(self) -> 'RedBlack':
+        """Make the right child or one of its children red, so that a node
+        can be removed from the right subtree.
+        """
+        self.flip_colours()
+        t = self
+        if is_red(self.left.left):
+            t = self.rotate_right()
+            t.flip_colours()
+        return t
+
+    def insert(self, item) -> 'RedBlack':
+        """Insert a new item to the red-black tree, returning the new root."""
+        t = self.insert_below(item)
+        t.red = False
+        return t
+
+    def insert_below(self, item) -> 'RedBlack':
+        """Insert item into the subtree rooted here."""
+        if item < self.value:
+            self.left = self.left.insert_below(item) if self.left \
+                else type(self)(item, None, None, True)
+        elif item > self.value:
+            self.right = self.right.insert_below(item) if self.right \
+                else type(self)(item, None, None, True)
+        return self.fix_up()
+
+    def remove(self, item) -> 'RedBlack':
+        """Remove an item from the red-black tree, returning the new root, or
+        None if the tree is now empty. Removing an item which is not in the
+        tree returns the tree unchanged.
+        """
+        if not self.search(item):
+            return self
+        if not is_red(self.left) and not is_red(self.right):
+            self.red = True
+        t = self.remove_below(item)
+        if t:
+            t.red = False
+        return t
+
+    def remove_min(self) -> 'RedBlack':
+        """Remove the smallest item from the subtree rooted here."""
+        if self.left is None:
+            return None
+        t = self
+        if not is_red(t.left) and not is_red(t.left.left):
+            t = t.move_red_left()
+        t.left = t.left.remove_min()
+        return t.fix_up()
+
+    def remove_below(self, item) -> 'RedBlack':
+        """Remove item, which must be present, from the subtree rooted here."""
+        t = self
+        if item < t.value:
+            if not is_red(t.left) and not is_red(t.left.left):
+                t = t.move_red_left()
+            t.left = t.left.remove_below(item)
+        else:
+            if is_red(t.left):
+                t = t.rotate_right()
+            if item == t.value and t.right is None:
+                return None
+            if not is_red(t.right) and not is_red(t.right.left):
+                t = t.move_red_right()
+            if item == t.value:
+                m = t.right
+                while m.left:
+                    m = m.left
+                t.value = m.value
+                t.right = t.right.remove_min()
+            else:
+                t.right = t.right.remove_below(item)
+        return t.fix_up()
+
+    def search(self, item) -> bool:
+        """Search the red-black tree for an item."""
+        t = self
+        while t:
+            if item == t.value:
+                return True
+            t = t.left if item < t.value else t.right
+        return False
+
+    @classmethod
+    def from_sorted(cls, items: list) -> 'RedBlack':
+        """Build a red-black tree from a list of distinct items in ascending
+        order in O(n) time, or None if the list is empty.
+
+        The tree is built as a 2-3 tree in which every path from the root to
+        a leaf has the same length k, with floor(log2(n+1)) as k. A subtree
+        of that height can hold from 2**k - 1 keys (all 2-nodes) to 3**k - 1
+        keys (all 3-nodes), so each subtree is made a 2-node unless its
+        items will not fit in two subtrees of height k - 1. A 3-node is a
+        black node with a red left child, as the tree is left-leaning.
+        """
+        def build(lo: int, hi: int, k: int) -> 'RedBlack':
+            m = hi - lo
+            if m == 0:
+                return None
+            if m - 1 <= 2 * (3 ** (k - 1) - 1):
+                mid = lo + (m - 1) // 2
+                return cls(items[mid], build(lo, mid, k - 1), build(mid + 1, hi, k - 1))
+            (third, extra) = divmod(m - 2, 3)
+            a = lo + third + (extra > 0)
+            b = a + 1 + third + (extra > 1)
+            red = cls(items[a], build(lo, a, k - 1), build(a + 1, b, k - 1), True)
+            return cls(items[b], red, build(b + 1, hi, k - 1))
+        return build(0, len(items), (len(items) + 1).bit_length() - 1)
+
+    @classmethod
+    def build(cls, ns: set) -> 'RedBlack':
+        """Build a red-black tree from a set, or None if the set is empty."""
+        return cls.bulk_build(ns)
+
+    @classmethod
+    def merge(cls, t1: 'RedBlack', t2: 'RedBlack') -> 'RedBlack':
+        """Merge two red-black trees into a new one. Either may be None."""
+        return cls.bulk_merge(t1, t2)
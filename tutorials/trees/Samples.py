@@ -0,0 +1,19 @@
+"""
+Sample data and timing shared by the benchmarks and tests.
+"""
+
+import random
+import time
+
+def skewed_bytes(size: int, seed: int = 269) -> bytes:
+    """Random bytes with a skewed distribution, like text: the byte of rank
+    r is drawn with weight 1 / (r + 1).
+    """
+    rng = random.Random(seed)
+    return bytes(rng.choices(range(256), [1 / (r + 1) for r in range(256)], k=size))
+
+def timed(fn) -> tuple:
+    """The result of fn() and the seconds it took."""
+    start = time.perf_counter()
+    result = fn()
+    return (result, time.perf_counter() - start)
@@ -1,6 +1,17 @@
+from collections import deque
+
+def in_order(t: 'Tree'):
+    """Iterate over the values of t, which may be None, in order."""
+    if t:
+        for n in t.iter_in_order():
+            yield n.value
+
 class Tree:
     """A binary tree."""
 
+    # no per-node __dict__: a node is just its three fields
+    __slots__ = ('value', 'left', 'right')
+
     def __init__(self, value, left: 'Tree', right: 'Tree'):
         """ Construct a new Tree."""
         self.value = value
@@ -9,35 +20,100 @@ class Tree:
 
     def height(self) -> int:
         """Return the height of the Tree."""
-        (lh,rh) = self.maybe_children(Tree.height, 0)
-        # the use of maybe_children is equivalent to:
-        # lh = self.left.height() if self.left else 0
-        # rh = self.right.height() if self.right else 0
-        return 1 + max(lh, rh)
+        return max(depth for (_, depth) in self.iter_depths())
     
     def count_nodes(self) -> int:
         """Count the nodes in the Tree."""
-        (ln,rn) = self.maybe_children(Tree.count_nodes, 0)
-        return 1 + ln + rn
+        return sum(1 for _ in self.iter_pre_order())
     
     def to_list(self) -> list:
         """An in-order traversal."""
-        (lh,rh) = self.maybe_children(Tree.to_list, [])
-        return [*lh, self.value, *rh]
+        return [t.value for t in self.iter_in_order()]
     
     def is_leaf(self) -> bool:
         return self.left is None and self.right is None   
     
     def leaves(self) -> list:
         """An in-order traversal."""
-        (lh,rh) = self.maybe_children(Tree.leaves, [])
-        val = [self.value] if self.is_leaf() else []
-        return [*lh, *val, *rh]
+        return [t.value for t in self.iter_in_order() if t.is_leaf()]
 
     def copy(self) -> 'Tree':
         """Make a deep copy of the Tree."""
-        (lh,rh) = self.maybe_children(Tree.copy, None)
-        return Tree(self.value, lh, rh) 
+        # the copies of the subtrees of nodes still to be copied
+        copies = []
+        for t in self.iter_post_order():
+            rh = copies.pop() if t.right else None
+            lh = copies.pop() if t.left else None
+            copies.append(Tree(t.value, lh, rh))
+        return copies.pop()
+
+    def iter_in_order(self):
+        """Iterate over the nodes of the Tree in order (left subtree, node,
+        right subtree). Keeps a stack of the nodes whose left subtrees are
+        being visited, so uses O(h) memory and no recursion.
+        """
+        stack = []
+        t = self
+        while stack or t:
+            while t:
+                stack.append(t)
+                t = t.left
+            t = stack.pop()
+            yield t
+            t = t.right
+
+    def iter_pre_order(self):
+        """Iterate over the nodes of the Tree in pre-order (node, left
+        subtree, right subtree).
+        """
+        for (t, _) in self.iter_depths():
+            yield t
+
+    def iter_depths(self):
+        """Iterate over the nodes of the Tree in pre-order, as pairs of the
+        node and its depth, where the root has depth 1. The stack holds the
+        right children still to be visited, so is O(h) long.
+        """
+        stack = [(self, 1)]
+        while stack:
+            (t, depth) = stack.pop()
+            while t:
+                yield (t, depth)
+                if t.right:
+                    stack.append((t.right, depth + 1))
+                t = t.left
+                depth += 1
+
+    def iter_post_order(self):
+        """Iterate over the nodes of the Tree in post-order (left subtree,
+        right subtree, node). A node is visited once its right subtree is
+        empty or is the subtree that was visited last.
+        """
+        stack = []
+        last = None
+        t = self
+        while stack or t:
+            while t:
+                stack.append(t)
+                t = t.left
+            t = stack[-1]
+            if t.right and t.right is not last:
+                t = t.right
+            else:
+                last = stack.pop()
+                yield last
+                t = None
+
+    def iter_level_order(self):
+        """Iterate over the nodes of the Tree in level order, from the root
+        down and from left to right along each level. The queue holds at
+        most two levels of the Tree.
+        """
+        queue = deque([self])
+        while queue:
+            t = queue.popleft()
+            yield t
+            queue.extend(t.children())
     
     def maybe_children(self, fn, default) -> tuple:
         """Apply fn to left and right children if present,
@@ -67,4 +143,4 @@ class Tree:
     #    if other is None:
     #        return False
     #    return self.to_list().sort() == other.to_list().sort()
-    
\ No newline at end of file
+    
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Benchmark the balanced BSTs on sorted, reverse-sorted and random streams of
+keys. For each class, stream and size it reports the average time per
+insert (building the tree one key at a time), per search and per remove,
+together with the height of the final tree. With a balanced tree the time
+per operation grows only with log n, so it should stay almost flat as the
+size goes up by factors of ten.
+
+    $ python3 bench_BST.py [SIZE ...]
+"""
+
+import random
+import sys
+import time
+from AVL import *
+from RedBlack import *
+
+CLASSES = [AVL, RedBlack]
+
+def streams(n: int) -> dict:
+    """The key streams to run, by name."""
+    keys = list(range(n))
+    shuffled = keys.copy()
+    random.Random(269).shuffle(shuffled)
+    return {'sorted': keys, 'reversed': keys[::-1], 'random': shuffled}
+
+def per_op(fn, keys: list) -> float:
+    """Run fn on each key and return the average time per call in microseconds."""
+    start = time.perf_counter()
+    for k in keys:
+        fn(k)
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+def run(cls, keys: list) -> tuple:
+    """Time insert, search and remove of every key on a tree of class cls."""
+    t = cls(keys[0], None, None)
+    def insert(k):
+        nonlocal t
+        t = t.insert(k)
+    def remove(k):
+        nonlocal t
+        t = t.remove(k)
+    insert_us = per_op(insert, keys)
+    height = t.height()
+    search_us = per_op(lambda k: t.search(k), keys)
+    remove_us = per_op(remove, keys)
+    return (insert_us, search_us, remove_us, height)
+
+def main(sizes: list) -> None:
+    print(f"{'class':>9} {'stream':>9} {'size':>9} {'insert':>9} {'search':>9}"
+          f" {'remove':>9} {'height':>7}   (microseconds per operation)")
+    for n in sizes:
+        for (name, keys) in streams(n).items():
+            for cls in CLASSES:
+                (i, s, r, h) = run(cls, keys)
+                print(f"{cls.__name__:>9} {name:>9} {n:>9} {i:>9.2f} {s:>9.2f}"
+                      f" {r:>9.2f} {h:>7}")
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [1000, 10000, 100000])
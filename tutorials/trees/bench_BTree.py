@@ -0,0 +1,68 @@
+"""
+Benchmark BTree against the binary trees used as ordered indexes. For each
+class and size it reports the time to bulk build the index from sorted
+keys, the memory the index holds per key (as seen by tracemalloc, not
+counting the keys themselves), and the lookup throughput for a sample of
+random keys, half of which are present. By default it measures 10**5 and
+10**6 keys; larger sizes, up to 10**8, can be given on the command line,
+but the binary trees need several gigabytes at 10**8.
+
+    $ python3 bench_BTree.py [SIZE ...]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from AVL import *
+from RedBlack import *
+from PooledTree import *
+from BTree import *
+
+BUILDERS = {
+    'AVL': AVL.from_sorted,
+    'RedBlack': RedBlack.from_sorted,
+    'PooledBST': lambda keys: PooledBST.from_sorted(keys, NodePool('q')),
+    'BTree(32)': lambda keys: BTree.from_sorted(keys, 32),
+    'BTree(128)': lambda keys: BTree.from_sorted(keys, 128),
+    'BTree(512)': lambda keys: BTree.from_sorted(keys, 512),
+}
+
+def build(fn, keys: list) -> tuple:
+    """Build an index with fn, returning it, the seconds taken and the bytes
+    it holds per key.
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        t = fn(keys)
+        seconds = time.perf_counter() - start
+        held = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (t, seconds, held / len(keys))
+
+def lookups(t, probes: list) -> float:
+    """The number of searches per second for the keys in probes."""
+    search = t.search
+    start = time.perf_counter()
+    for k in probes:
+        search(k)
+    return len(probes) / (time.perf_counter() - start)
+
+def main(sizes: list, samples: int = 200000) -> None:
+    print(f"{'class':>11} {'size':>10} {'build s':>9} {'bytes/key':>10}"
+          f" {'lookups/s':>11} {'height':>7}")
+    for n in sizes:
+        # even keys are present, odd ones are misses
+        keys = list(range(0, 2 * n, 2))
+        rng = random.Random(269)
+        probes = [rng.randrange(2 * n) for _ in range(samples)]
+        for (name, fn) in BUILDERS.items():
+            (t, seconds, per_key) = build(fn, keys)
+            print(f"{name:>11} {n:>10} {seconds:>9.3f} {per_key:>10.1f}"
+                  f" {lookups(t, probes):>11.0f} {t.height():>7}")
+            del t
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [100000, 1000000])
@@ -0,0 +1,60 @@
+"""
+Compare decoding Huffman coded text by walking the Huffman tree a bit at a
+time with decoding the canonical code through a DecodeTable, for several
+sizes of root table. Reports the decoded megabytes per second.
+
+    $ python3 bench_Canonical.py [TEXT_SIZE ...]
+"""
+
+import sys
+import time
+from Canonical import *
+from HuffmanQueue import *
+from Samples import *
+
+def walk_decode(t: Tree, bits: list, count: int) -> list:
+    """Decode by following the tree from the root for every symbol."""
+    out = []
+    node = t
+    for b in bits:
+        node = node.right if b else node.left
+        if node.is_leaf():
+            out.append(node.value[0])
+            node = t
+            if len(out) == count:
+                break
+    return out
+
+def main(sizes: list) -> None:
+    print(f"{'decoder':>12} {'size':>9} {'MB/s':>8}")
+    for n in sizes:
+        text = skewed_bytes(n)
+        ft = {}
+        for b in text:
+            ft[b] = ft.get(b, 0) + 1
+        t = build_htree(ft)
+        # the code read off the tree, for walk_decode
+        paths = {}
+        stack = [(t, [])]
+        while stack:
+            (node, path) = stack.pop()
+            if node.is_leaf():
+                paths[node.value[0]] = path
+            else:
+                stack.append((node.left, path + [0]))
+                stack.append((node.right, path + [1]))
+        bits = [b for c in text for b in paths[c]]
+        start = time.perf_counter()
+        assert bytes(walk_decode(t, bits, n)) == text
+        print(f"{'tree walk':>12} {n:>9} {n / (time.perf_counter() - start) / 1e6:>8.2f}")
+        lengths = code_lengths(t)
+        code = code_bits(canonical_code(lengths))
+        data = pack_bits([b for c in text for b in code[c]])
+        for root_bits in (6, 10, 12):
+            table = DecodeTable(lengths, root_bits)
+            start = time.perf_counter()
+            assert bytes(table.decode(data, n)) == text
+            print(f"{f'table({root_bits})':>12} {n:>9} {n / (time.perf_counter() - start) / 1e6:>8.2f}")
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [100000, 1000000])
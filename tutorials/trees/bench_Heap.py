@@ -0,0 +1,90 @@
+"""
+Benchmark DaryHeap with several arities against heapq and
+queue.PriorityQueue. The items are random ints, used as their own
+priorities. For each size it reports the seconds taken to:
+
++ push: push every item in turn and then pop them all
++ heapify: make a heap of all the items at once and then pop them all
++ pushpop: push and pop an item together, once per item, on a full heap
+
+PriorityQueue has no heapify or pushpop, so only push is timed for it and
+the other columns show n/a.
+
+    $ python3 bench_Heap.py [SIZE ...]
+"""
+
+import heapq
+import random
+import sys
+from queue import PriorityQueue
+from DaryHeap import *
+from Samples import *
+
+def dary(arity: int) -> dict:
+    """The benchmarks for a DaryHeap of the given arity."""
+    def push(nums):
+        h = DaryHeap(arity)
+        for n in nums:
+            h.push(n)
+        while h:
+            h.pop()
+    def heapify(nums):
+        h = DaryHeap.from_iterable(nums, arity)
+        while h:
+            h.pop()
+    def pushpop(nums):
+        h = DaryHeap.from_iterable(nums, arity)
+        for n in nums:
+            h.pushpop(n)
+    return {'push': push, 'heapify': heapify, 'pushpop': pushpop}
+
+def with_heapq() -> dict:
+    """The benchmarks for heapq on a list."""
+    def push(nums):
+        h = []
+        for n in nums:
+            heapq.heappush(h, n)
+        while h:
+            heapq.heappop(h)
+    def heapify(nums):
+        h = nums.copy()
+        heapq.heapify(h)
+        while h:
+            heapq.heappop(h)
+    def pushpop(nums):
+        h = nums.copy()
+        heapq.heapify(h)
+        for n in nums:
+            heapq.heappushpop(h, n)
+    return {'push': push, 'heapify': heapify, 'pushpop': pushpop}
+
+def with_priority_queue() -> dict:
+    """The benchmarks for queue.PriorityQueue, which has only put and get."""
+    def push(nums):
+        q = PriorityQueue()
+        for n in nums:
+            q.put(n)
+        while not q.empty():
+            q.get()
+    return {'push': push}
+
+HEAPS = {
+    'DaryHeap(2)': dary(2),
+    'DaryHeap(4)': dary(4),
+    'DaryHeap(8)': dary(8),
+    'heapq': with_heapq(),
+    'PriorityQueue': with_priority_queue(),
+}
+
+def main(sizes: list) -> None:
+    print(f"{'heap':>14} {'size':>9} {'push s':>9} {'heapify s':>10} {'pushpop s':>10}")
+    for n in sizes:
+        rng = random.Random(269)
+        nums = [rng.randrange(n) for _ in range(n)]
+        for (name, ops) in HEAPS.items():
+            (p, h, pp) = (f"{timed(lambda: ops[op](nums))[1]:.3f}" if op in ops else 'n/a'
+                          for op in ('push', 'heapify', 'pushpop'))
+            print(f"{name:>14} {n:>9} {p:>9} {h:>10} {pp:>10}")
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [10000, 100000, 1000000])
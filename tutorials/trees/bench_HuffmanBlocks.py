@@ -0,0 +1,42 @@
+"""
+Measure how the throughput of block-wise Huffman compression scales with
+the number of worker processes. For 1, 2, 4, ... up to the number of CPUs
+it reports the megabytes per second of compressing and decompressing
+random text-like bytes with a shared code, and the speedup over one
+process (which runs in this process, with no pool).
+
+    $ python3 bench_HuffmanBlocks.py [MEGABYTES [BLOCK_SIZE]]
+"""
+
+import os
+import sys
+import time
+from HuffmanBlocks import *
+from Samples import *
+
+def main(megabytes: float = 8, block_size: int = BLOCK_SIZE) -> None:
+    data = skewed_bytes(int(megabytes * 1e6))
+    counts = []
+    p = 1
+    while p < (os.cpu_count() or 1):
+        counts.append(p)
+        p *= 2
+    counts.append(os.cpu_count() or 1)
+    print(f"{'processes':>9} {'compress MB/s':>14} {'speedup':>8} {'decompress MB/s':>16} {'speedup':>8}")
+    base = None
+    for processes in counts:
+        start = time.perf_counter()
+        packed = compress_blocks(data, block_size, processes=processes)
+        compress = len(data) / (time.perf_counter() - start) / 1e6
+        start = time.perf_counter()
+        assert decompress_blocks(packed, processes) == data
+        decompress = len(data) / (time.perf_counter() - start) / 1e6
+        base = base or (compress, decompress)
+        print(f"{processes:>9} {compress:>14.2f} {compress / base[0]:>7.1f}x"
+              f" {decompress:>16.2f} {decompress / base[1]:>7.1f}x")
+    print(f"ratio {len(packed) / len(data):.3f} of {len(data)} bytes"
+          f" in {len(BlockReader(packed))} blocks")
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 8,
+         int(sys.argv[2]) if len(sys.argv) > 2 else BLOCK_SIZE)
@@ -0,0 +1,44 @@
+"""
+Compare counting and coding bytes one at a time in Python with the bulk
+paths in HuffmanCodec: np.bincount and vectorised code lookup and packing
+with NumPy, or collections.Counter without it. Reports seconds and
+megabytes per second for each, and the speedup.
+
+    $ python3 bench_HuffmanCodec.py [MEGABYTES ...]
+"""
+
+import sys
+from HuffmanCodec import *
+from Samples import *
+
+def count_loop(data: bytes) -> dict:
+    """Count bytes with a Python loop."""
+    ft = {}
+    for b in data:
+        ft[b] = ft.get(b, 0) + 1
+    return ft
+
+def sample_data(size: int) -> bytes:
+    """Random bytes with a skewed distribution, like text."""
+    block = skewed_bytes(1 << 20)
+    return (block * (size // len(block) + 1))[:size]
+
+def main(sizes: list) -> None:
+    print(f"{'step':>8} {'MB':>6} {'loop s':>8} {'bulk s':>8} {'bulk MB/s':>10} {'speedup':>8}"
+          f"   (bulk is {'NumPy' if np is not None else 'Counter and BitWriter'})")
+    for mb in sizes:
+        data = sample_data(int(mb * 1e6))
+        (slow_ft, loop) = timed(lambda: count_loop(data))
+        (ft, bulk) = timed(lambda: count_bytes(data))
+        assert ft == slow_ft
+        print(f"{'count':>8} {mb:>6} {loop:>8.2f} {bulk:>8.3f} {mb / bulk:>10.1f} {loop / bulk:>7.1f}x")
+        code = canonical_code(lengths_for(ft))
+        slow = BitWriter()
+        (_, loop) = timed(lambda: slow.write_codes(code, data))
+        fast = BitWriter()
+        (_, bulk) = timed(lambda: encode_bytes(data, code, fast))
+        assert fast.getvalue() == slow.getvalue()
+        print(f"{'encode':>8} {mb:>6} {loop:>8.2f} {bulk:>8.3f} {mb / bulk:>10.1f} {loop / bulk:>7.1f}x")
+
+if __name__ == '__main__':
+    main([float(a) for a in sys.argv[1:]] or [10, 100])
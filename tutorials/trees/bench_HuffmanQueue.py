@@ -0,0 +1,27 @@
+"""
+Time building a Huffman tree with each of the queues in HuffmanQueue, for
+alphabets of random frequencies of several sizes (bytes, 16 bit tokens and
+a million n-grams, by default). TwoQueues is timed both with the sort it
+needs and on leaves which are already sorted.
+
+    $ python3 bench_HuffmanQueue.py [ALPHABET_SIZE ...]
+"""
+
+import random
+import sys
+from HuffmanQueue import *
+from Samples import *
+
+def main(sizes: list) -> None:
+    print(f"{'queue':>18} {'alphabet':>9} {'seconds':>9}")
+    for n in sizes:
+        rng = random.Random(269)
+        ft = {c: rng.randint(1, 10 * n) for c in range(n)}
+        for (name, queue) in QUEUES.items():
+            print(f"{name:>18} {n:>9} {timed(lambda: build_htree(ft, queue))[1]:>9.3f}")
+        leaves = sorted((Tree((c, f), None, None) for (c, f) in ft.items()), key=frequency)
+        (_, seconds) = timed(lambda: build_from_queue(TwoQueues(leaves)))
+        print(f"{'two_queues sorted':>18} {n:>9} {seconds:>9.3f}")
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [256, 65536, 1000000])
@@ -0,0 +1,95 @@
+"""
+Measure the memory used per node by the different ways of storing a tree.
+For each size it builds a balanced tree of that many int keys with
+from_sorted and reports the bytes allocated per node (not counting the keys
+themselves, which already exist), together with the time taken to build the
+tree and to walk it in order:
+
++ dict: a node object with a __dict__, as Tree was before it had __slots__
++ Tree and AVL: node objects with __slots__
++ pooled: a PooledBST, with the values in a list
++ pooled[q]: a PooledBST, with the values unboxed in an array of 'q'
+
+    $ python3 bench_TreeMemory.py [SIZE ...]
+"""
+
+import sys
+import time
+import tracemalloc
+from AVL import *
+from PooledTree import *
+
+class DictTree:
+    """A tree node with a __dict__, for comparison."""
+
+    def __init__(self, value, left, right):
+        self.value = value
+        self.left = left
+        self.right = right
+
+def from_sorted(cls, items: list):
+    """Build a balanced tree of class cls from sorted items."""
+    def build(lo: int, hi: int):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        return cls(items[mid], build(lo, mid), build(mid + 1, hi))
+    return build(0, len(items))
+
+def walk(t) -> int:
+    """Walk a tree of any kind in order, returning the number of nodes."""
+    count = 0
+    for _ in in_order(t) if isinstance(t, (Tree, PooledTree)) else walk_dict(t):
+        count += 1
+    return count
+
+def walk_dict(t):
+    """Walk a tree of DictTrees in order."""
+    stack = []
+    while stack or t:
+        while t:
+            stack.append(t)
+            t = t.left
+        t = stack.pop()
+        yield t.value
+        t = t.right
+
+BUILDERS = {
+    'dict': lambda keys: from_sorted(DictTree, keys),
+    'Tree': lambda keys: from_sorted(Tree, keys),
+    'AVL': lambda keys: AVL.from_sorted(keys),
+    'pooled': lambda keys: PooledBST.from_sorted(keys),
+    'pooled[q]': lambda keys: PooledBST.from_sorted(keys, NodePool('q')),
+}
+
+def measure(build, keys: list) -> tuple:
+    """The bytes per node held by the tree that build makes from keys, and
+    the seconds taken to build it and to walk it.
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        t = build(keys)
+        build_seconds = time.perf_counter() - start
+        held = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    start = time.perf_counter()
+    walk(t)
+    walk_seconds = time.perf_counter() - start
+    return (held / len(keys), build_seconds, walk_seconds)
+
+def main(sizes: list) -> None:
+    print(f"{'storage':>10} {'size':>9} {'bytes/node':>11} {'saving':>7}"
+          f" {'build s':>9} {'walk s':>9}")
+    for n in sizes:
+        keys = list(range(n))
+        baseline = None
+        for (name, build) in BUILDERS.items():
+            (per_node, b, w) = measure(build, keys)
+            baseline = baseline or per_node
+            print(f"{name:>10} {n:>9} {per_node:>11.1f} {baseline / per_node:>6.1f}x"
+                  f" {b:>9.3f} {w:>9.3f}")
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [10000, 100000, 1000000])
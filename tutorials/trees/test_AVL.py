@@ -0,0 +1,68 @@
+import unittest
+from random import (shuffle)
+from AVL import *
+
+class Testing(unittest.TestCase):
+
+    def check_avl(self, t: AVL) -> int:
+        """Check the order and balance of t and return its height."""
+        if t is None:
+            return 0
+        if t.left:
+            self.assertLess(t.left.value, t.value)
+        if t.right:
+            self.assertGreater(t.right.value, t.value)
+        lh = self.check_avl(t.left)
+        rh = self.check_avl(t.right)
+        self.assertLessEqual(abs(lh - rh), 1)
+        self.assertEqual(t.node_height, 1 + max(lh, rh))
+        return t.node_height
+
+    def test_insert_and_search(self):
+        """ Test that the insert and search methods work."""
+        lst = list(range(99))
+        shuffle(lst)
+        t = AVL(lst[0])
+        for n in lst:
+            t = t.insert(n)
+            self.check_avl(t)
+        for n in range(99):
+            self.assertTrue(t.search(n))
+        self.assertFalse(t.search(99))
+        self.assertEqual(t.to_list(), list(range(99)))
+
+    def test_sorted_input_stays_balanced(self):
+        """ Test that building from sorted and reverse-sorted input gives a
+            tree of logarithmic height.
+        """
+        for lst in (list(range(1000)), list(range(1000, 0, -1))):
+            t = AVL.build(lst)
+            self.check_avl(t)
+            self.assertLessEqual(t.height(), 15)
+            self.assertEqual(t.count_nodes(), 1000)
+
+    def test_remove(self):
+        """ Test that the remove method works."""
+        t = AVL(0)
+        self.assertTrue(t.remove(0) is None)
+        self.assertTrue(t.remove(1) == t)
+        lst = list(range(200))
+        shuffle(lst)
+        t = AVL.build(lst)
+        shuffle(lst)
+        for (i, n) in enumerate(lst[:-1]):
+            t = t.remove(n)
+            self.check_avl(t)
+            self.assertFalse(t.search(n))
+            self.assertEqual(t.count_nodes(), 199 - i)
+        self.assertIsNone(t.remove(lst[-1]))
+
+    def test_build_and_merge(self):
+        """ Test that the build and merge methods work."""
+        self.assertIsNone(AVL.build(set()))
+        t1 = AVL.build({1, 3, 5, 7})
+        t2 = AVL.build({2, 3, 4})
+        t = AVL.merge(t1, t2)
+        self.check_avl(t)
+        self.assertEqual(t.to_list(), [1, 2, 3, 4, 5, 7])
+        self.assertEqual(AVL.merge(None, t2).to_list(), [2, 3, 4])
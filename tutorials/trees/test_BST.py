@@ -24,3 +24,33 @@ class Testing(unittest.TestCase):
         self.assertTrue(bst1.remove(0) is None)
         print(bst1)
         self.assertTrue(bst1.remove(1) == bst1)
+
+    def test_in_order(self):
+        """ Test that the in_order iterator visits values in order."""
+        t = BST(5, BST(2, BST(1, None, None), BST(3, None, None)), BST(8, None, None))
+        self.assertEqual(list(in_order(t)), [1, 2, 3, 5, 8])
+        self.assertEqual(list(in_order(None)), [])
+
+    def test_from_sorted(self):
+        """ Test that from_sorted builds a perfectly balanced BST."""
+        self.assertIsNone(BST.from_sorted([]))
+        for n in (1, 2, 7, 8, 1000):
+            t = BST.from_sorted(list(range(n)))
+            self.assertEqual(t.to_list(), list(range(n)))
+            self.assertEqual(t.height(), n.bit_length())
+
+    def test_bulk_build_and_merge(self):
+        """ Test that bulk_build and bulk_merge give balanced BSTs holding
+            the right items.
+        """
+        lst = list(range(0, 200, 2))
+        shuffle(lst)
+        t1 = BST.bulk_build(lst)
+        t2 = BST.bulk_build(range(0, 300, 3))
+        t = BST.bulk_merge(t1, t2)
+        expected = sorted(set(range(0, 200, 2)) | set(range(0, 300, 3)))
+        self.assertEqual(t.to_list(), expected)
+        self.assertEqual(t.height(), len(expected).bit_length())
+        self.assertEqual(BST.bulk_merge(None, t2).to_list(), list(range(0, 300, 3)))
+        self.assertEqual(list(merge_sorted([1, 4, 6], [2, 4, 7, 9])), [1, 2, 4, 6, 7, 9])
+        self.assertEqual(list(merge_sorted([None], [])), [None])
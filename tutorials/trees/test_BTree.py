@@ -0,0 +1,72 @@
+import unittest
+import random
+from BTree import *
+
+class Testing(unittest.TestCase):
+
+    def check_btree(self, t: BTree) -> None:
+        """Check the order, fullness and depth of every node of t."""
+        least = t.fanout // 2
+        depths = set()
+        def check(node, lo, hi, depth, is_root):
+            if isinstance(node, Leaf):
+                if not is_root:
+                    self.assertGreaterEqual(len(node.keys), least)
+                self.assertLessEqual(len(node.keys), t.fanout)
+                self.assertEqual(node.keys, sorted(node.keys))
+                for k in node.keys:
+                    self.assertTrue((lo is None or lo <= k) and (hi is None or k < hi))
+                depths.add(depth)
+                return
+            self.assertEqual(len(node.children), len(node.keys) + 1)
+            self.assertGreaterEqual(len(node.children), 2 if is_root else least)
+            self.assertLessEqual(len(node.children), t.fanout)
+            bounds = [lo] + node.keys + [hi]
+            for (i, child) in enumerate(node.children):
+                check(child, bounds[i], bounds[i + 1], depth + 1, False)
+        check(t.root, None, None, 0, True)
+        self.assertEqual(len(depths), 1)
+
+    def test_insert_and_remove(self):
+        """ Test insert, search and remove against a set, for several fanouts."""
+        for fanout in (4, 5, 16):
+            rng = random.Random(fanout)
+            t = BTree(fanout)
+            items = set()
+            for _ in range(3000):
+                k = rng.randrange(1000)
+                if rng.random() < 0.6:
+                    t = t.insert(k)
+                    items.add(k)
+                else:
+                    t = t.remove(k)
+                    items.discard(k)
+                self.assertEqual(t.search(k), k in items)
+            self.check_btree(t)
+            self.assertEqual(t.to_list(), sorted(items))
+            self.assertEqual(len(t), len(items))
+            for k in list(items):
+                t.remove(k)
+            self.check_btree(t)
+            self.assertEqual(t.to_list(), [])
+
+    def test_bulk_load(self):
+        """ Test that from_sorted makes valid trees of every size."""
+        for n in range(200):
+            t = BTree.from_sorted(list(range(n)), 4)
+            self.check_btree(t)
+            self.assertEqual(t.to_list(), list(range(n)))
+        with self.assertRaises(ValueError):
+            BTree(3)
+
+    def test_range(self):
+        """ Test that range follows the chain of leaves."""
+        t = BTree.build(set(range(0, 1000, 3)), 8)
+        for (lo, hi) in [(0, 1000), (10, 200), (-5, 4), (999, 2000), (50, 40)]:
+            self.assertEqual(list(t.range(lo, hi)), [x for x in range(0, 1000, 3) if lo <= x < hi])
+
+    def test_merge(self):
+        """ Test that the merge method works."""
+        t = BTree.merge(BTree.build({1, 3, 5}), BTree.build({2, 3, 4}))
+        self.assertEqual(t.to_list(), [1, 2, 3, 4, 5])
+        self.assertEqual(BTree.merge(None, BTree.build({2})).to_list(), [2])
@@ -0,0 +1,85 @@
+import unittest
+import random
+from Canonical import *
+from HuffmanQueue import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.msg0 = "Hi, how are you?"
+        self.ft0 = {c: self.msg0.count(c) for c in set(self.msg0)}
+
+    def encode_bits(self, code: dict, msg) -> list:
+        """Encode msg as a list of bits with a code from code_bits."""
+        return [b for c in msg for b in code[c]]
+
+    def test_canonical_code(self):
+        """ Test that canonical codes are assigned in order of length and
+            symbol, and only depend on the lengths.
+        """
+        code = canonical_code({'a': 2, 'b': 1, 'c': 3, 'd': 3})
+        self.assertEqual(code, {'b': (0b0, 1), 'a': (0b10, 2), 'c': (0b110, 3), 'd': (0b111, 3)})
+        self.assertEqual(code_bits(code)['c'], [1, 1, 0])
+        lengths = code_lengths(build_htree(self.ft0))
+        bits = code_bits(canonical_code(lengths))
+        self.assertEqual({c: len(b) for (c, b) in bits.items()}, lengths)
+        self.assertEqual(code_lengths(build_htree({'x': 5})), {'x': 1})
+        with self.assertRaises(ValueError):
+            canonical_code({'a': 1, 'b': 1, 'c': 1})
+
+    def test_decode(self):
+        """ Test that the table decoder gives back the message for every
+            size of root table.
+        """
+        lengths = code_lengths(build_htree(self.ft0))
+        bits = self.encode_bits(code_bits(canonical_code(lengths)), self.msg0)
+        for root_bits in range(1, 12):
+            table = DecodeTable(lengths, root_bits)
+            self.assertEqual(''.join(table.decode(pack_bits(bits), len(self.msg0))), self.msg0)
+            data = pack_bits([1, 0, 1] + bits)
+            self.assertEqual(''.join(table.decode(data, len(self.msg0), 3)), self.msg0)
+
+    def test_long_codes(self):
+        """ Test codes much longer than the root table, from Fibonacci
+            frequencies, which make the deepest trees.
+        """
+        fib = [1, 1]
+        while len(fib) < 30:
+            fib.append(fib[-1] + fib[-2])
+        lengths = code_lengths(build_htree(dict(enumerate(fib))))
+        self.assertEqual(max(lengths.values()), 29)
+        rng = random.Random(269)
+        msg = [rng.randrange(30) for _ in range(2000)]
+        bits = self.encode_bits(code_bits(canonical_code(lengths)), msg)
+        self.assertEqual(DecodeTable(lengths, 8).decode(pack_bits(bits), len(msg)), msg)
+
+    def test_very_long_codes(self):
+        """ Test codes longer than the 56 bits the decoder reads at a time,
+            that no table is wider than the root table, and that
+            table_entries counts the entries of the tables.
+        """
+        fib = [1, 1]
+        while len(fib) < 64:
+            fib.append(fib[-1] + fib[-2])
+        lengths = code_lengths(build_htree(dict(enumerate(fib))))
+        self.assertEqual(max(lengths.values()), 63)
+        msg = [0, 1, 63, 2, 0, 1] + list(range(64))
+        bits = self.encode_bits(code_bits(canonical_code(lengths)), msg)
+        table = DecodeTable(lengths, 8)
+        self.assertEqual(table.decode(pack_bits(bits), len(msg)), msg)
+        self.assertEqual(table.decode(pack_bits([1, 1, 1] + bits), len(msg), 3), msg)
+        entries = 0
+        tables = [(table.symbols, table.lengths)]
+        while tables:
+            (symbols, sizes) = tables.pop()
+            self.assertLessEqual(len(symbols), 1 << 8)
+            entries += len(symbols)
+            tables.extend(symbols[i] for i in range(len(symbols)) if sizes[i] < 0)
+        self.assertEqual(table_entries(lengths, 8), entries)
+
+    def test_bad_data(self):
+        """ Test that decoding too much or an unused code fails."""
+        with self.assertRaises(ValueError):
+            DecodeTable({'a': 2, 'b': 1}).decode(pack_bits([1, 1]), 1)
+        with self.assertRaises(ValueError):
+            DecodeTable({'a': 2, 'b': 1, 'c': 2}).decode(pack_bits([0]), 9)
@@ -0,0 +1,62 @@
+import unittest
+import heapq
+import random
+from DaryHeap import *
+
+class Testing(unittest.TestCase):
+
+    def check_heap(self, heap: DaryHeap) -> None:
+        """Check that no node has a smaller priority than its parent."""
+        for i in range(1, len(heap)):
+            parent = (i - 1) // heap.arity
+            self.assertLessEqual(heap.priorities[parent], heap.priorities[i])
+
+    def test_push_and_pop(self):
+        """ Test that items come out in order of priority, for several arities."""
+        nums = [random.randint(1, 1000) for _ in range(300)]
+        for arity in (2, 3, 4, 8):
+            heap = DaryHeap(arity)
+            for n in nums:
+                heap.push(n)
+            self.check_heap(heap)
+            self.assertEqual(heap.peek(), min(nums))
+            self.assertEqual([heap.pop() for _ in range(len(nums))], sorted(nums))
+        with self.assertRaises(IndexError):
+            heap.pop()
+        with self.assertRaises(ValueError):
+            DaryHeap(1)
+
+    def test_from_iterable(self):
+        """ Test that heapify makes a valid heap."""
+        for n in range(50):
+            nums = [random.randint(1, 20) for _ in range(n)]
+            heap = DaryHeap.from_iterable(nums, 4)
+            self.check_heap(heap)
+            self.assertEqual([heap.pop() for _ in range(n)], sorted(nums))
+
+    def test_key_and_priority(self):
+        """ Test that priorities come from key or are given explicitly, and
+            that items with equal priorities are never compared.
+        """
+        heap = DaryHeap.from_iterable([('b', 2), ('a', 2), ('c', 1)], key=lambda x: x[1])
+        self.assertEqual(heap.pop(), ('c', 1))
+        heap = DaryHeap()
+        heap.push(object(), 1)
+        heap.push(object(), 1)
+        self.assertEqual(heap.peek_priority(), 1)
+        heap.pop()
+
+    def test_pushpop_and_replace(self):
+        """ Test pushpop and replace against heapq."""
+        nums = [random.randint(1, 1000) for _ in range(100)]
+        heap = DaryHeap.from_iterable(nums)
+        reference = nums.copy()
+        heapq.heapify(reference)
+        for _ in range(200):
+            n = random.randint(1, 1000)
+            if random.random() < 0.5:
+                self.assertEqual(heap.pushpop(n), heapq.heappushpop(reference, n))
+            else:
+                self.assertEqual(heap.replace(n), heapq.heapreplace(reference, n))
+            self.check_heap(heap)
+        self.assertEqual(DaryHeap().pushpop(5), 5)
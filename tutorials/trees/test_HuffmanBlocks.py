@@ -0,0 +1,69 @@
+import os
+import tempfile
+import threading
+import unittest
+from HuffmanBlocks import *
+from Samples import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.data = skewed_bytes(20000)
+
+    def test_round_trip(self):
+        """ Test shared and per-block codes, in this process and in a pool."""
+        for shared in (True, False):
+            for data in (b"", b"z", self.data):
+                packed = compress_blocks(data, 3000, shared, processes=1)
+                self.assertEqual(decompress_blocks(packed, processes=1), data)
+        packed = compress_blocks(self.data, 3000, processes=2)
+        self.assertEqual(packed, compress_blocks(self.data, 3000, processes=1))
+        self.assertEqual(decompress_blocks(packed, processes=2), self.data)
+
+    def test_random_access(self):
+        """ Test that any block can be decoded on its own."""
+        for shared in (True, False):
+            reader = BlockReader(compress_blocks(self.data, 3000, shared, processes=1))
+            self.assertEqual(len(reader), 7)
+            self.assertEqual(reader.size(), len(self.data))
+            for k in (6, 0, 3):
+                self.assertEqual(reader.block(k), self.data[3000 * k:3000 * (k + 1)])
+            with self.assertRaises(IndexError):
+                reader.block(7)
+
+    def test_threads(self):
+        """ Test that readers decode blocks in several threads at once."""
+        readers = [BlockReader(compress_blocks(self.data, 3000, shared, processes=1))
+                   for shared in (True, False)] * 4
+        results = [None] * len(readers)
+        def read(i):
+            results[i] = [readers[i].block(k) for k in range(len(readers[i]))]
+        threads = [threading.Thread(target=read, args=(i,)) for i in range(len(readers))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for blocks in results:
+            self.assertEqual(b"".join(blocks), self.data)
+
+    def test_compress_file(self):
+        """ Test that compressing a file gives the same as compressing its
+            bytes.
+        """
+        with tempfile.TemporaryDirectory() as d:
+            (source, target) = (os.path.join(d, 'data'), os.path.join(d, 'data.hufb'))
+            with open(source, 'wb') as f:
+                f.write(self.data)
+            for (shared, processes) in ((True, 1), (False, 1), (True, 2)):
+                compress_file(source, target, 3000, shared, processes)
+                with open(target, 'rb') as f:
+                    packed = f.read()
+                self.assertEqual(packed, compress_blocks(self.data, 3000, shared, processes=1))
+                self.assertEqual(decompress_blocks(packed, processes=1), self.data)
+
+    def test_bad_data(self):
+        """ Test that data which are not compressed blocks are rejected."""
+        packed = compress_blocks(self.data, 3000, processes=1)
+        for bad in (b"", b"HUFB", packed[:-1], b"XXXX" + packed[4:]):
+            with self.assertRaises(ValueError):
+                BlockReader(bad)
@@ -0,0 +1,81 @@
+import unittest
+import random
+from unittest.mock import patch
+from HuffmanCodec import *
+from Samples import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.msg0 = "Hi, how are you?"
+
+    def test_round_trip(self):
+        """ Test that str and bytes come back unchanged."""
+        rng = random.Random(269)
+        for msg in [self.msg0, "", "a", "aaaa", "été ☃☃",
+                    b"", b"\x00", bytes(rng.randrange(256) for _ in range(5000))]:
+            self.assertEqual(decode_packed(encode_packed(msg)), msg)
+        self.assertEqual(decode_packed(memoryview(encode_packed(b"memoryview"))), b"memoryview")
+
+    def test_same_as_bit_lists(self):
+        """ Test that the packed data are the bit list coding of the input,
+            packed eight bits to a byte.
+        """
+        data = encode_packed(self.msg0)
+        (lengths, kind, count, pos) = read_header(data)
+        self.assertEqual((kind, count), (KIND_STR, len(self.msg0)))
+        self.assertEqual(lengths, lengths_for(frequencies(self.msg0)))
+        code = code_bits(canonical_code(lengths))
+        bits = [b for c in self.msg0 for b in code[c]]
+        self.assertEqual(data[pos:], pack_bits(bits))
+        self.assertLess(len(encode_packed(self.msg0 * 100)), len(self.msg0) * 50)
+
+    def test_bit_writer(self):
+        """ Test that a BitWriter packs bits like pack_bits."""
+        rng = random.Random(1)
+        w = BitWriter()
+        bits = []
+        for _ in range(500):
+            length = rng.randint(1, 40)
+            n = rng.getrandbits(length)
+            w.write(n, length)
+            bits.extend((n >> i) & 1 for i in reversed(range(length)))
+        self.assertEqual(w.bit_length(), len(bits))
+        self.assertEqual(bytes(w.getvalue()), pack_bits(bits))
+
+    def test_varint_and_header(self):
+        """ Test varints and that bad headers are rejected."""
+        out = bytearray()
+        for n in (0, 127, 128, 300, 2 ** 40):
+            write_varint(out, n)
+        pos = 0
+        for n in (0, 127, 128, 300, 2 ** 40):
+            (m, pos) = read_varint(out, pos)
+            self.assertEqual(m, n)
+        with self.assertRaises(ValueError):
+            read_header(b"\x07")
+        with self.assertRaises(ValueError):
+            decode_packed(encode_packed(self.msg0)[:4])
+
+    def test_bytes_fast_path(self):
+        """ Test that counting and coding bytes in bulk gives the same
+            results as doing it a byte at a time, with and without NumPy.
+        """
+        data = skewed_bytes(30000)
+        ft = {}
+        for b in data:
+            ft[b] = ft.get(b, 0) + 1
+        code = canonical_code(lengths_for(ft))
+        slow = BitWriter(bytearray(b"xy"))
+        slow.write(5, 3)
+        slow.write_codes(code, data)
+        expected = (slow.bit_length(), bytes(slow.getvalue()))
+        for numpy in (np, None):
+            with patch('HuffmanCodec.np', numpy):
+                self.assertEqual(count_bytes(data), ft)
+                self.assertEqual(count_bytes(memoryview(bytearray(data))), ft)
+                fast = BitWriter(bytearray(b"xy"))
+                fast.write(5, 3)
+                encode_bytes(data, code, fast)
+                self.assertEqual((fast.bit_length(), bytes(fast.getvalue())), expected)
+                self.assertEqual(decode_packed(encode_packed(data)), data)
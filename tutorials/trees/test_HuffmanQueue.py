@@ -0,0 +1,37 @@
+import unittest
+import random
+from HuffmanQueue import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.ft = {'a': 45, 'b': 13, 'c': 12, 'd': 16, 'e': 9, 'f': 5}
+
+    def cost(self, t: Tree, depth: int = 0) -> int:
+        """The number of bits needed to code the leaves of t."""
+        if t.is_leaf():
+            return frequency(t) * depth
+        return self.cost(t.left, depth + 1) + self.cost(t.right, depth + 1)
+
+    def test_queues(self):
+        """ Test that every queue gives an optimal tree."""
+        for queue in QUEUES:
+            t = build_htree(self.ft, queue)
+            self.assertEqual(frequency(t), sum(self.ft.values()))
+            self.assertEqual({c for (c, _) in t.leaves()}, set(self.ft))
+            self.assertEqual(self.cost(t), 224)
+
+    def test_agree(self):
+        """ Test that the queues agree on the cost of random tables."""
+        rng = random.Random(269)
+        for n in (1, 2, 3, 50, 256):
+            ft = {c: rng.randint(1, 1000) for c in range(n)}
+            costs = {self.cost(build_htree(ft, queue)) for queue in QUEUES.values()}
+            self.assertEqual(len(costs), 1)
+        self.assertIsNone(build_htree({}))
+
+    def test_two_queues_needs_sorted(self):
+        """ Test that TwoQueues rejects unsorted leaves."""
+        leaves = [Tree((c, f), None, None) for (c, f) in self.ft.items()]
+        with self.assertRaises(ValueError):
+            TwoQueues(leaves)
@@ -0,0 +1,66 @@
+import unittest
+import os
+import tempfile
+import tracemalloc
+from HuffmanStream import *
+from Samples import *
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        self.data = skewed_bytes(100000)
+
+    def chunks(self, data: bytes, size: int):
+        """data in chunks of the given size."""
+        return (data[i:i + size] for i in range(0, len(data), size))
+
+    def test_round_trip(self):
+        """ Test that streams decode to the input, whatever the chunk sizes."""
+        for data in (b"", b"x", b"abracadabra", self.data):
+            ft = count_frequencies(self.chunks(data, 1000))
+            stream = b''.join(encode_stream(self.chunks(data, 1000), ft))
+            for size in (1, 7, 4096):
+                self.assertEqual(b''.join(decode_stream(self.chunks(stream, size))), data)
+
+    def test_sample(self):
+        """ Test that a code from a sampled prefix codes bytes missing from it."""
+        ft = count_frequencies(self.chunks(self.data, 100), sample=1000)
+        self.assertEqual(len(ft), 256)
+        data = self.data + bytes(range(256))
+        stream = b''.join(encode_stream(self.chunks(data, 5000), ft))
+        self.assertEqual(b''.join(decode_stream([stream])), data)
+
+    def peak_compress(self, source: str, target: str, copies: int) -> int:
+        """The peak memory used to compress copies of the test data."""
+        with open(source, 'wb') as f:
+            for _ in range(copies):
+                f.write(self.data)
+        tracemalloc.start()
+        try:
+            compress_file(source, target, 16384)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_files(self):
+        """ Test compressing and decompressing files from the command line,
+            and that memory does not grow with the size of the input.
+        """
+        with tempfile.TemporaryDirectory() as d:
+            (source, huf, target) = (os.path.join(d, name) for name in ('in', 'in.huf', 'out'))
+            small = self.peak_compress(source, huf, 1)
+            large = self.peak_compress(source, huf, 20)
+            self.assertLess(large, small * 1.5)
+            main(['compress', source, huf])
+            main(['decompress', huf, target])
+            with open(target, 'rb') as f:
+                self.assertEqual(f.read(), self.data * 20)
+            self.assertLess(os.path.getsize(huf), len(self.data) * 20)
+
+    def test_bad_stream(self):
+        """ Test that truncated or foreign streams are rejected."""
+        stream = b''.join(encode_stream([b"hello"], count_frequencies([b"hello"])))
+        with self.assertRaises(ValueError):
+            list(decode_stream([stream[:-2]]))
+        with self.assertRaises(ValueError):
+            list(decode_stream([b"GIF89a"]))
@@ -0,0 +1,65 @@
+import io
+import unittest
+import random
+from contextlib import redirect_stderr
+from LengthLimited import *
+from HuffmanStream import *
+import HuffmanStream
+
+class Testing(unittest.TestCase):
+
+    def setUp(self):
+        fib = [1, 1]
+        while len(fib) < 30:
+            fib.append(fib[-1] + fib[-2])
+        self.fib = dict(enumerate(fib))
+
+    def test_limit(self):
+        """ Test that limited codes are prefix codes within the limit."""
+        for max_length in (5, 8, 12, 20):
+            lengths = limited_lengths(self.fib, max_length)
+            self.assertEqual(max(lengths.values()), max_length)
+            self.assertLessEqual(sum(2 ** (max_length - l) for l in lengths.values()),
+                                 2 ** max_length)
+            canonical_code(lengths)
+        with self.assertRaises(ValueError):
+            limited_lengths(self.fib, 4)
+        self.assertEqual(limited_lengths({'a': 3}, 1), {'a': 1})
+        self.assertEqual(limited_lengths({}, 8), {})
+
+    def test_optimal(self):
+        """ Test that a limit no code reaches gives a Huffman code's cost,
+            and that no limit does better than a Huffman code.
+        """
+        rng = random.Random(269)
+        for n in (2, 3, 10, 50):
+            ft = {c: rng.randint(1, 1000) for c in range(n)}
+            optimal = coded_bits(ft, code_lengths(build_htree(ft)))
+            self.assertEqual(coded_bits(ft, limited_lengths(ft, n)), optimal)
+            for max_length in range(max(1, (n - 1).bit_length()), n):
+                self.assertGreaterEqual(coded_bits(ft, limited_lengths(ft, max_length)), optimal)
+
+    def test_report(self):
+        """ Test the report on Fibonacci frequencies, whose Huffman tree is
+            as deep as possible.
+        """
+        report = length_limit_report(self.fib, 10)
+        self.assertEqual(report['optimal']['longest'], 29)
+        self.assertEqual(report['limited']['longest'], 10)
+        self.assertEqual(report['limited']['table_entries'], 1 << 10)
+        self.assertEqual(report['optimal']['table_entries'], 2560)
+        self.assertAlmostEqual(report['loss'], 0.00164, places=5)
+
+    def test_codecs(self):
+        """ Test that the codecs decode input coded with limited codes, and
+            that the command line rejects limits too short for every byte.
+        """
+        data = bytes(b for (b, f) in self.fib.items() for _ in range(min(f, 2000)))
+        packed = encode_packed(data, 12)
+        (lengths, _, _, _) = read_header(packed)
+        self.assertEqual(max(lengths.values()), 12)
+        self.assertEqual(decode_packed(packed), data)
+        stream = b''.join(encode_stream([data], count_frequencies([data]), 12))
+        self.assertEqual(b''.join(decode_stream([stream])), data)
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            HuffmanStream.main(['compress', 'in', 'out', '--max-length', '7'])
@@ -0,0 +1,49 @@
+import unittest
+import random
+from OrderStatistic import *
+
+class Testing(unittest.TestCase):
+
+    def check_sizes(self, t: OrderStatistic) -> int:
+        """Check the cached size of every node in t and return the size."""
+        if t is None:
+            return 0
+        size = 1 + self.check_sizes(t.left) + self.check_sizes(t.right)
+        self.assertEqual(t.size, size)
+        return size
+
+    def test_sizes(self):
+        """ Test that insert and remove keep the sizes up to date."""
+        rng = random.Random(269)
+        t = OrderStatistic(50)
+        items = {50}
+        for _ in range(500):
+            k = rng.randrange(100)
+            if rng.random() < 0.6:
+                t = t.insert(k)
+                items.add(k)
+            elif len(items) > 1:
+                t = t.remove(k)
+                items.discard(k)
+            self.check_sizes(t)
+        self.assertEqual(len(t), len(items))
+
+    def test_rank_and_select(self):
+        """ Test that rank and select agree with a sorted list."""
+        items = sorted(random.Random(1).sample(range(1000), 200))
+        t = OrderStatistic.build(set(items))
+        for (k, item) in enumerate(items):
+            self.assertEqual(t.select(k), item)
+            self.assertEqual(t.rank(item), k)
+        self.assertEqual(t.rank(-1), 0)
+        self.assertEqual(t.rank(1000), 200)
+        with self.assertRaises(IndexError):
+            t.select(200)
+
+    def test_range(self):
+        """ Test that range and count_range find the items in a range."""
+        t = OrderStatistic.build(set(range(0, 100, 3)))
+        for (lo, hi) in [(0, 100), (10, 20), (-5, 4), (99, 200), (12, 13), (50, 40)]:
+            expected = [x for x in range(0, 100, 3) if lo <= x < hi]
+            self.assertEqual(list(t.range(lo, hi)), expected)
+            self.assertEqual(t.count_range(lo, hi), len(expected))
@@ -0,0 +1,41 @@
+import unittest
+import random
+from PersistentAVL import *
+
+class Testing(unittest.TestCase):
+
+    def nodes(self, t: PersistentAVL) -> set:
+        """The ids of the nodes in t."""
+        return {id(n) for n in t.iter_pre_order()} if t else set()
+
+    def test_versions(self):
+        """ Test that every old version is left unchanged by updates."""
+        rng = random.Random(269)
+        t = PersistentAVL(500)
+        items = {500}
+        versions = []
+        for _ in range(1000):
+            versions.append((t, sorted(items)))
+            k = rng.randrange(1000)
+            if rng.random() < 0.6:
+                t = t.insert(k)
+                items.add(k)
+            elif len(items) > 1:
+                t = t.remove(k)
+                items.discard(k)
+        for (v, expected) in versions:
+            self.assertEqual(v.to_list(), expected)
+        self.assertEqual(t.to_list(), sorted(items))
+
+    def test_sharing(self):
+        """ Test that an update copies only O(log n) nodes."""
+        t = PersistentAVL.build(set(range(0, 20000, 2)))
+        old = self.nodes(t)
+        for k in (1, 9999, 19999):
+            u = t.insert(k)
+            self.assertLessEqual(len(self.nodes(u) - old), 3 * u.height())
+        u = t.remove(10000)
+        self.assertLessEqual(len(self.nodes(u) - old), 3 * u.height())
+        self.assertIs(t.insert(2), t)
+        self.assertIs(t.snapshot(), t)
+        self.assertIs(t.copy(), t)
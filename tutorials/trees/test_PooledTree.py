@@ -0,0 +1,64 @@
+import unittest
+import random
+from PooledTree import *
+
+class Testing(unittest.TestCase):
+
+    def test_pool(self):
+        """ Test that released nodes are reused."""
+        pool = NodePool('q')
+        (a, b) = (pool.new(1), pool.new(2))
+        pool.release(a)
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(pool.new(3), a)
+        self.assertEqual(list(pool.values), [3, 2])
+
+    def test_tree_methods(self):
+        """ Test that the methods of Tree work on a PooledTree."""
+        pool = NodePool()
+        (one, three) = (PooledTree(1, pool=pool), PooledTree(3, pool=pool))
+        t = PooledTree(4, PooledTree(2, one, three), None)
+        self.assertEqual(t.to_list(), [1, 2, 3, 4])
+        self.assertEqual(t.leaves(), [1, 3])
+        self.assertEqual(t.height(), 3)
+        self.assertEqual(t.count_nodes(), 4)
+        self.assertEqual([n.value for n in t.iter_pre_order()], [4, 2, 1, 3])
+        self.assertEqual([n.value for n in t.iter_post_order()], [1, 3, 2, 4])
+        self.assertEqual([n.value for n in t.iter_level_order()], [4, 2, 1, 3])
+        self.assertEqual(t.left, PooledTree.at(t.pool, t.left.index))
+        self.assertFalse(hasattr(t, '__dict__'))
+        self.assertEqual(PooledTree.__slots__, ('pool', 'index'))
+        self.assertFalse(issubclass(PooledTree, Tree))
+        c = t.copy()
+        self.assertIsNot(c.pool, t.pool)
+        self.assertEqual(c.to_list(), t.to_list())
+        with self.assertRaises(ValueError):
+            PooledTree(5, t, PooledTree(6))
+
+    def test_bst(self):
+        """ Test insert, search and remove against a set."""
+        for typecode in (None, 'q'):
+            t = PooledBST.from_sorted(list(range(0, 200, 2)), NodePool(typecode))
+            items = set(range(0, 200, 2))
+            rng = random.Random(269)
+            for _ in range(2000):
+                k = rng.randrange(200)
+                if rng.random() < 0.5:
+                    t = t.insert(k)
+                    items.add(k)
+                else:
+                    t = t.remove(k)
+                    items.discard(k)
+                self.assertEqual(t.search(k), k in items)
+            self.assertEqual(t.to_list(), sorted(items))
+            self.assertEqual(len(t.pool), len(items))
+        t = PooledBST(1).insert(2)
+        self.assertIsNone(t.remove(1).remove(2))
+
+    def test_bulk(self):
+        """ Test that bulk_build and bulk_merge give balanced PooledBSTs."""
+        t = PooledBST.bulk_merge(PooledBST.bulk_build(range(0, 100, 2)),
+                                 PooledBST.bulk_build(range(0, 100, 3)))
+        expected = sorted(set(range(0, 100, 2)) | set(range(0, 100, 3)))
+        self.assertEqual(t.to_list(), expected)
+        self.assertEqual(t.height(), len(expected).bit_length())
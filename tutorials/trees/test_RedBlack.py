@@ -0,0 +1,83 @@
+import unittest
+from random import (shuffle)
+from RedBlack import *
+
+class Testing(unittest.TestCase):
+
+    def check_red_black(self, t: RedBlack) -> int:
+        """Check the order and colours of t and return its black height."""
+        if t is None:
+            return 1
+        if t.left:
+            self.assertLess(t.left.value, t.value)
+        if t.right:
+            self.assertGreater(t.right.value, t.value)
+        self.assertFalse(is_red(t.right))
+        if t.red:
+            self.assertFalse(is_red(t.left))
+        lb = self.check_red_black(t.left)
+        rb = self.check_red_black(t.right)
+        self.assertEqual(lb, rb)
+        return lb + (0 if t.red else 1)
+
+    def test_insert_and_search(self):
+        """ Test that the insert and search methods work."""
+        lst = list(range(99))
+        shuffle(lst)
+        t = RedBlack(lst[0])
+        for n in lst:
+            t = t.insert(n)
+            self.assertFalse(t.red)
+            self.check_red_black(t)
+        for n in range(99):
+            self.assertTrue(t.search(n))
+        self.assertFalse(t.search(99))
+        self.assertEqual(t.to_list(), list(range(99)))
+
+    def test_sorted_input_stays_balanced(self):
+        """ Test that building from sorted and reverse-sorted input gives a
+            tree of logarithmic height.
+        """
+        for lst in (list(range(1000)), list(range(1000, 0, -1))):
+            t = RedBlack.build(lst)
+            self.check_red_black(t)
+            self.assertLessEqual(t.height(), 20)
+            self.assertEqual(t.count_nodes(), 1000)
+
+    def test_remove(self):
+        """ Test that the remove method works."""
+        t = RedBlack(0)
+        self.assertTrue(t.remove(0) is None)
+        t = RedBlack(0)
+        self.assertTrue(t.remove(1) == t)
+        lst = list(range(200))
+        shuffle(lst)
+        t = RedBlack.build(lst)
+        shuffle(lst)
+        for (i, n) in enumerate(lst[:-1]):
+            t = t.remove(n)
+            self.check_red_black(t)
+            self.assertFalse(t.search(n))
+            self.assertEqual(t.count_nodes(), 199 - i)
+        self.assertIsNone(t.remove(lst[-1]))
+
+    def test_build_and_merge(self):
+        """ Test that the build and merge methods work."""
+        self.assertIsNone(RedBlack.build(set()))
+        t = RedBlack.merge(RedBlack.build({1, 3, 5, 7}), RedBlack.build({2, 3, 4}))
+        self.check_red_black(t)
+        self.assertEqual(t.to_list(), [1, 2, 3, 4, 5, 7])
+
+    def test_from_sorted(self):
+        """ Test that building from sorted items gives a valid red-black tree
+            of every size, which can then be changed.
+        """
+        self.assertIsNone(RedBlack.from_sorted([]))
+        for n in range(1, 300):
+            t = RedBlack.from_sorted(list(range(n)))
+            self.assertFalse(t.red)
+            self.check_red_black(t)
+            self.assertEqual(t.to_list(), list(range(n)))
+        t = t.insert(1000).remove(150).remove(0)
+        self.check_red_black(t)
+        self.assertEqual(t.count_nodes(), 298)
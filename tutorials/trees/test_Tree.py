@@ -21,3 +21,39 @@ class Testing(unittest.TestCase):
         """ Test that the traverse method works."""
         self.assertEqual(self.tree0.copy().traverse(), [0])
         self.assertEqual(self.tree1.copy().traverse(), [0,1,0])
+
+    def test_orders(self):
+        """ Test the iterative traversals on a small tree."""
+        #       4
+        #     2   6
+        #    1 3   7
+        t = Tree(4, Tree(2, Tree(1, None, None), Tree(3, None, None)),
+                 Tree(6, None, Tree(7, None, None)))
+        values = lambda ts: [n.value for n in ts]
+        self.assertEqual(values(t.iter_in_order()), [1, 2, 3, 4, 6, 7])
+        self.assertEqual(values(t.iter_pre_order()), [4, 2, 1, 3, 6, 7])
+        self.assertEqual(values(t.iter_post_order()), [1, 3, 2, 7, 6, 4])
+        self.assertEqual(values(t.iter_level_order()), [4, 2, 6, 1, 3, 7])
+        self.assertEqual([d for (_, d) in t.iter_depths()], [1, 2, 3, 3, 2, 3])
+        self.assertEqual(t.to_list(), [1, 2, 3, 4, 6, 7])
+        self.assertEqual(t.leaves(), [1, 3, 7])
+        self.assertEqual(t.height(), 3)
+        self.assertEqual(t.copy().to_list(), t.to_list())
+        self.assertEqual(list(in_order(None)), [])
+
+    def test_deep(self):
+        """ Test that the traversals work on trees far deeper than the
+            recursion limit.
+        """
+        n = 100000
+        t = None
+        for i in range(n):
+            t = Tree(i, t, None) if i % 2 else Tree(i, None, t)
+        self.assertEqual(t.height(), n)
+        self.assertEqual(t.count_nodes(), n)
+        self.assertEqual(t.leaves(), [0])
+        c = t.copy()
+        self.assertIsNot(c, t)
+        self.assertEqual(c.to_list(), t.to_list())
+        self.assertEqual(sum(1 for _ in t.iter_post_order()), n)
+        self.assertEqual(sum(1 for _ in t.iter_level_order()), n)